@@ -1,10 +1,11 @@
+from common.admin import ScalableModelAdmin
 from django.contrib import admin
 
 from apps.training_process.models import Group, GroupApplication
 
 
 @admin.register(Group)
-class GroupModelAdmin(admin.ModelAdmin):
+class GroupModelAdmin(ScalableModelAdmin):
     list_display = (
         'name',
         'coach',
@@ -12,10 +13,14 @@ class GroupModelAdmin(admin.ModelAdmin):
         'training_days',
         'training_time',
     )
+    list_select_related = ('coach__user',)
+    list_filter = ('status',)
+    search_fields = ('name',)
+    autocomplete_fields = ('coach',)
 
 
 @admin.register(GroupApplication)
-class GroupApplicationModelAdmin(admin.ModelAdmin):
+class GroupApplicationModelAdmin(ScalableModelAdmin):
     list_display = (
         'user',
         'group',
@@ -24,3 +29,7 @@ class GroupApplicationModelAdmin(admin.ModelAdmin):
         'playing_level',
         'comment',
     )
+    list_select_related = ('user', 'group')
+    list_filter = ('status',)
+    search_fields = ('user__full_name', 'user__email__startswith')
+    autocomplete_fields = ('user', 'group')
@@ -1,2 +1,3 @@
 # ruff: noqa: F401
+from .group import GroupFilter
 from .group_application import GroupApplicationFilter
@@ -0,0 +1,25 @@
+from django.db.models import F, Q
+from django_filters import rest_framework as filters
+
+
+class GroupFilter(filters.FilterSet):
+    """Фильтрация тренировочных групп."""
+
+    # Фильтры
+    has_free_seats = filters.BooleanFilter(
+        label='Есть свободные места', method='has_free_seats_filter'
+    )
+
+    @staticmethod
+    def has_free_seats_filter(qs, name, value):
+        """
+        Фильтрация по наличию свободных мест в группе.
+
+        Условие совпадает с условием частичного индекса
+        group_has_free_seats_idx, поэтому выборка групп со свободными
+        местами использует индекс.
+        """
+
+        condition = Q(participants_count__lt=F('max_participants'))
+
+        return qs.filter(condition) if value else qs.exclude(condition)
@@ -1,6 +1,9 @@
 # ruff: noqa: F401
 from .group import GroupSerializer
 from .group_application import (
+    GroupApplicationBulkApproveSerializer,
+    GroupApplicationBulkRejectSerializer,
+    GroupApplicationBulkResultSerializer,
     GroupApplicationRejectSerializer,
     GroupApplicationSerializer,
     GroupApplicationUpdateSerializer,
@@ -1,3 +1,4 @@
+from common.serializers import DynamicFieldsSerializerMixin
 from rest_framework import serializers
 
 from apps.training_process.models import Group
@@ -5,7 +6,9 @@ from apps.user.api.serializers import CoachSerializer
 from apps.user.models import Coach
 
 
-class GroupSerializer(serializers.ModelSerializer):
+class GroupSerializer(
+    DynamicFieldsSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор данных группы."""
 
     coach_id = serializers.PrimaryKeyRelatedField(
@@ -18,7 +21,32 @@ class GroupSerializer(serializers.ModelSerializer):
         label='Тренер',
         read_only=True,
     )
+    free_seats = serializers.IntegerField(
+        label='Количество свободных мест',
+        read_only=True,
+    )
+
+    # Свойства модели для выборки через .values() (см. ValuesMapper)
+    values_sources = {
+        'free_seats': ('max_participants', 'participants_count'),
+    }
 
     class Meta:
         model = Group
         fields = '__all__'
+
+    def validate_max_participants(self, value: int) -> int:
+        """
+        Проверка, что максимальное количество спортсменов
+        не меньше текущего.
+        """
+
+        if self.instance is not None and value < (
+            self.instance.participants_count
+        ):
+            raise serializers.ValidationError(
+                'Максимальное количество спортсменов не может быть меньше '
+                'текущего количества спортсменов в группе'
+            )
+
+        return value
@@ -1,3 +1,4 @@
+from common.serializers import DynamicFieldsSerializerMixin
 from rest_framework import serializers
 
 from apps.training_process.api.serializers.group import GroupSerializer
@@ -7,7 +8,9 @@ from apps.user.api.serializers import UserSerializer
 from apps.user.models import User
 
 
-class GroupApplicationSerializer(serializers.ModelSerializer):
+class GroupApplicationSerializer(
+    DynamicFieldsSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор данных заявки на присоединение к группе."""
 
     user_id = serializers.PrimaryKeyRelatedField(
@@ -61,3 +64,38 @@ class GroupApplicationRejectSerializer(serializers.ModelSerializer):
         extra_kwargs = {
             'reject_reason': {'write_only': True},
         }
+
+
+class GroupApplicationBulkApproveSerializer(serializers.Serializer):
+    """Сериализатор массового одобрения заявок на присоединение к группе."""
+
+    ids = serializers.ListField(
+        label='id заявок',
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=1000,
+        write_only=True,
+    )
+
+
+class GroupApplicationBulkRejectSerializer(
+    GroupApplicationBulkApproveSerializer
+):
+    """Сериализатор массового отклонения заявок на присоединение к группе."""
+
+    reject_reason = serializers.CharField(
+        label='Причина отклонения заявок',
+        max_length=500,
+        allow_blank=True,
+        allow_null=True,
+        default=None,
+        write_only=True,
+    )
+
+
+class GroupApplicationBulkResultSerializer(serializers.Serializer):
+    """Сериализатор результата массовой обработки заявки."""
+
+    id = serializers.IntegerField(label='id заявки')
+    success = serializers.BooleanField(label='Заявка обработана')
+    error = serializers.CharField(label='Ошибка', allow_null=True)
@@ -1,10 +1,16 @@
+from common.conditional import ConditionalGetMixin
+from common.response_cache import ResponseCacheMixin
 from rest_framework import mixins, viewsets
 
+from apps.training_process.api.filters import GroupFilter
 from apps.training_process.api.serializers import GroupSerializer
+from apps.training_process.cache import group_catalog_cache
 from apps.training_process.models import Group
 
 
 class GroupViewSet(
+    ResponseCacheMixin,
+    ConditionalGetMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.UpdateModelMixin,
@@ -17,4 +23,6 @@ class GroupViewSet(
         Group.objects.all().select_related('coach__user').order_by('-id')
     )
     serializer_class = GroupSerializer
+    filterset_class = GroupFilter
     http_method_names = ['get', 'post', 'patch']
+    response_cache = group_catalog_cache
@@ -1,3 +1,7 @@
+from common.choices import PaginationCountStrategy
+from common.conditional import ConditionalGetMixin
+from common.export import ExportMixin
+from common.values_serialization import ValuesListMixin
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
@@ -6,6 +10,9 @@ from rest_framework.response import Response
 
 from apps.training_process.api.filters import GroupApplicationFilter
 from apps.training_process.api.serializers import (
+    GroupApplicationBulkApproveSerializer,
+    GroupApplicationBulkRejectSerializer,
+    GroupApplicationBulkResultSerializer,
     GroupApplicationRejectSerializer,
     GroupApplicationSerializer,
     GroupApplicationUpdateSerializer,
@@ -14,11 +21,15 @@ from apps.training_process.models import GroupApplication
 from apps.training_process.models.choices import GroupApplicationStatus
 from apps.training_process.services import (
     GroupApplicationApproveService,
+    GroupApplicationBulkApproveService,
+    GroupApplicationBulkRejectService,
     GroupApplicationRejectService,
 )
 
 
-class GroupApplicationViewSet(viewsets.ModelViewSet):
+class GroupApplicationViewSet(
+    ExportMixin, ConditionalGetMixin, ValuesListMixin, viewsets.ModelViewSet
+):
     """API для работы с тренировочными группами."""
 
     queryset = (
@@ -28,11 +39,32 @@ class GroupApplicationViewSet(viewsets.ModelViewSet):
     )
     serializer_class = GroupApplicationSerializer
     filterset_class = GroupApplicationFilter
+    pagination_count_strategy = PaginationCountStrategy.CAPPED
     http_method_names = ['get', 'post', 'patch', 'delete']
 
+    export_fields = {
+        'id': 'ID',
+        'created_at': 'Дата и время подачи заявки',
+        'status': 'Статус',
+        'user_id': 'ID пользователя',
+        'user__full_name': 'ФИО',
+        'user__email': 'Адрес электронной почты',
+        'user__phone': 'Номер телефона',
+        'group_id': 'ID группы',
+        'group__name': 'Группа',
+        'playing_level': 'Уровень занимающихся',
+        'comment': 'Комментарий к заявке',
+        'reject_reason': 'Причина отклонения заявки',
+    }
+    export_filename = 'group_applications'
+
     def get_serializer_class(self):
         if self.action == 'reject':
             return GroupApplicationRejectSerializer
+        if self.action == 'bulk_approve':
+            return GroupApplicationBulkApproveSerializer
+        if self.action == 'bulk_reject':
+            return GroupApplicationBulkRejectSerializer
         return super().get_serializer_class()
 
     def destroy(self, request, *args, **kwargs):
@@ -151,3 +183,72 @@ class GroupApplicationViewSet(viewsets.ModelViewSet):
 
         response_serializer = GroupApplicationSerializer(group_application)
         return Response(response_serializer.data, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        summary='Массовое одобрение заявок на присоединение к группе',
+        request=GroupApplicationBulkApproveSerializer(),
+        responses={
+            status.HTTP_200_OK: GroupApplicationBulkResultSerializer(
+                many=True
+            ),
+        },
+    )
+    @action(
+        detail=False,
+        methods=['POST'],
+        url_path='bulk-approve',
+        url_name='bulk-approve',
+    )
+    def bulk_approve(self, request, *args, **kwargs):
+        """
+        Массовое одобрение заявок на присоединение к тренировочным группам.
+
+        Одобряются только заявки в статусе "Новая". Результат обработки
+        возвращается по каждой заявке: если заявку одобрить нельзя,
+        остальные заявки все равно будут одобрены.
+        """
+
+        request_serializer = self.get_serializer(data=request.data)
+        request_serializer.is_valid(raise_exception=True)
+        results = GroupApplicationBulkApproveService(
+            **request_serializer.validated_data
+        ).execute()
+
+        response_serializer = GroupApplicationBulkResultSerializer(
+            results, many=True
+        )
+        return Response(response_serializer.data, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        summary='Массовое отклонение заявок на присоединение к группе',
+        request=GroupApplicationBulkRejectSerializer(),
+        responses={
+            status.HTTP_200_OK: GroupApplicationBulkResultSerializer(
+                many=True
+            ),
+        },
+    )
+    @action(
+        detail=False,
+        methods=['POST'],
+        url_path='bulk-reject',
+        url_name='bulk-reject',
+    )
+    def bulk_reject(self, request, *args, **kwargs):
+        """
+        Массовое отклонение заявок на присоединение к тренировочным группам.
+
+        Отклоняются только заявки в статусе "Новая". Результат обработки
+        возвращается по каждой заявке.
+        """
+
+        request_serializer = self.get_serializer(data=request.data)
+        request_serializer.is_valid(raise_exception=True)
+        results = GroupApplicationBulkRejectService(
+            **request_serializer.validated_data
+        ).execute()
+
+        response_serializer = GroupApplicationBulkResultSerializer(
+            results, many=True
+        )
+        return Response(response_serializer.data, status=status.HTTP_200_OK)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class TrainingProcessConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.training_process'
+
+    def ready(self):
+        from apps.training_process import signals  # noqa: F401
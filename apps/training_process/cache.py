@@ -0,0 +1,6 @@
+from common.response_cache import ResponseCache
+
+# Кеш ответов каталога групп. Инвалидируется при изменении групп,
+# тренеров групп и их пользователей, а также состава групп
+# (см. apps.training_process.signals)
+group_catalog_cache = ResponseCache(key_prefix='group_catalog')
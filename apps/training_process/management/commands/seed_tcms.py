@@ -0,0 +1,583 @@
+import random
+import time
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta
+
+from common.choices import PlayingLevel, Weekdays
+from django.contrib.auth.hashers import UNUSABLE_PASSWORD_PREFIX
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models import Model
+from django.utils import timezone
+
+from apps.training_process.models import Group, GroupApplication
+from apps.training_process.models.choices import (
+    GroupApplicationStatus,
+    GroupStatus,
+)
+from apps.user.models import Administrator, Athlete, Coach, User
+from apps.user.models.choices import CoachPosition, GenderType, JudgeCategory
+
+# Непригодный для входа пароль, общий для всех пользователей. Хеш
+# настоящего пароля считался бы на каждую строку несколько сотен миллисекунд
+PASSWORD = f'{UNUSABLE_PASSWORD_PREFIX}seed'
+
+# Домен адресов электронной почты. Адрес строится по id пользователя,
+# поэтому уникален
+EMAIL_DOMAIN = 'seed.example.com'
+
+LAST_NAMES = (
+    'Иванов', 'Смирнов', 'Кузнецов', 'Попов', 'Васильев', 'Петров',
+    'Соколов', 'Михайлов', 'Новиков', 'Федоров', 'Морозов', 'Волков',
+    'Алексеев', 'Лебедев', 'Семенов', 'Егоров', 'Павлов', 'Козлов',
+    'Степанов', 'Николаев', 'Орлов', 'Андреев', 'Макаров', 'Никитин',
+    'Захаров', 'Зайцев', 'Соловьев', 'Борисов', 'Яковлев', 'Григорьев',
+)  # fmt: skip
+MALE_FIRST_NAMES = (
+    'Александр', 'Дмитрий', 'Максим', 'Сергей', 'Андрей', 'Алексей',
+    'Артем', 'Илья', 'Кирилл', 'Михаил', 'Никита', 'Матвей', 'Роман',
+    'Егор', 'Иван', 'Павел', 'Денис', 'Олег', 'Владимир', 'Николай',
+)  # fmt: skip
+FEMALE_FIRST_NAMES = (
+    'Анастасия', 'Мария', 'Дарья', 'Анна', 'Елизавета', 'Полина',
+    'Виктория', 'Екатерина', 'Софья', 'Александра', 'Ксения', 'Алина',
+    'Вероника', 'Ольга', 'Татьяна', 'Наталья', 'Ирина', 'Юлия',
+    'Светлана', 'Елена',
+)  # fmt: skip
+# Отчества в мужской и женской форме
+PATRONYMICS = (
+    ('Александрович', 'Александровна'), ('Дмитриевич', 'Дмитриевна'),
+    ('Сергеевич', 'Сергеевна'), ('Андреевич', 'Андреевна'),
+    ('Алексеевич', 'Алексеевна'), ('Михайлович', 'Михайловна'),
+    ('Иванович', 'Ивановна'), ('Павлович', 'Павловна'),
+    ('Владимирович', 'Владимировна'), ('Николаевич', 'Николаевна'),
+    ('Олегович', 'Олеговна'), ('Романович', 'Романовна'),
+)  # fmt: skip
+TRAINING_TIMES = ('08:00-09:30', '10:00-11:30', '18:00-19:30', '20:00-21:30')
+REJECT_REASONS = ('Нет свободных мест', 'Не подходит уровень')
+
+# Доля пользователей без отчества
+NO_PATRONYMIC_SHARE = 0.1
+# Доля неактивных пользователей
+INACTIVE_USERS_SHARE = 0.02
+# Распределение статусов групп
+GROUP_STATUS_WEIGHTS = {
+    GroupStatus.ACTIVE: 0.6,
+    GroupStatus.FUTURE: 0.2,
+    GroupStatus.FINISHED: 0.2,
+}
+
+
+def share(value: str) -> float:
+    """Доля от 0 до 1 для аргумента командной строки."""
+
+    result = float(value)
+    if not 0 <= result <= 1:
+        raise ValueError
+    return result
+
+
+def copy_rows(
+    cursor, model: type[Model], columns: Iterable[str], rows: Iterable
+) -> int:
+    """
+    Загрузка строк в таблицу модели через COPY FROM STDIN.
+
+    :param cursor: Курсор psycopg.
+    :param columns: Имена столбцов в порядке значений строк.
+    :param rows: Кортежи значений.
+    :return: Количество загруженных строк.
+    """
+
+    quote_name = connection.ops.quote_name
+    sql = 'COPY {table} ({columns}) FROM STDIN'.format(
+        table=quote_name(model._meta.db_table),
+        columns=', '.join(quote_name(column) for column in columns),
+    )
+    count = 0
+    with cursor.copy(sql) as copy:
+        for row in rows:
+            copy.write_row(row)
+            count += 1
+
+    return count
+
+
+class TcmsSeeder:
+    """
+    Генерация тестовых данных: пользователей, истории их ролей, групп,
+    спортсменов групп и заявок.
+
+    Все случайные значения берутся из генератора с заданным зерном,
+    поэтому на одной и той же базе данные получаются одинаковыми. Даты
+    отсчитываются от текущего дня.
+    """
+
+    def __init__(self, options: dict) -> None:
+        self.options = options
+        self.random = random.Random(options['seed'])
+        self.now = timezone.now()
+        self.today = timezone.localdate()
+
+        self.first_ids = {}
+        self.coaches = []
+        self.athletes = []
+        self.administrators = []
+        # Строки действующих и будущих групп
+        self.groups = []
+        self.memberships = []
+
+    def random_date(self, start: date, end: date) -> date:
+        """Случайная дата в интервале, включая границы."""
+
+        return start + timedelta(
+            days=self.random.randint(0, max((end - start).days, 0))
+        )
+
+    def random_datetime(self, days: int) -> datetime:
+        """Случайный момент за последние days дней."""
+
+        seconds = self.random.randint(0, days * 24 * 60 * 60)
+        return self.now - timedelta(seconds=seconds)
+
+    def random_phone(self) -> str:
+        """Случайный номер мобильного телефона."""
+
+        code = self.random.randint(0, 99)
+        number = self.random.randint(0, 9_999_999)
+        return f'+7(9{code:02d}){number // 10_000:03d}-{number % 10_000:04d}'
+
+    def role_periods(self) -> list[tuple[date, date | None]]:
+        """
+        Периоды действия ролей пользователя от ранних к поздним.
+
+        С заданной вероятностью перед последней ролью была закончившаяся,
+        и с заданной вероятностью последняя роль тоже закончилась.
+        """
+
+        periods = []
+        date_from = self.random_date(
+            self.today - timedelta(days=5 * 365), self.today
+        )
+        date_to = None
+        if self.random.random() < self.options['ended_roles']:
+            date_to = self.random_date(date_from, self.today)
+        periods.append((date_from, date_to))
+
+        if self.random.random() < self.options['role_history']:
+            previous_to = date_from - timedelta(
+                days=self.random.randint(1, 365)
+            )
+            previous_from = previous_to - timedelta(
+                days=self.random.randint(30, 5 * 365)
+            )
+            periods.insert(0, (previous_from, previous_to))
+
+        return periods
+
+    def generate_users(self, first_id: int, count: int):
+        """
+        Строки пользователей. Попутно собираются строки их ролей.
+        """
+
+        options = self.options
+        role_weights = {
+            self.add_coach: options['coaches'],
+            self.add_athlete: options['athletes'],
+            self.add_administrator: options['administrators'],
+            None: 1
+            - options['coaches']
+            - options['athletes']
+            - options['administrators'],
+        }
+        add_role_functions = list(role_weights)
+        add_role_weights = list(role_weights.values())
+
+        for user_id in range(first_id, first_id + count):
+            gender = self.random.choice(GenderType.values)
+            is_male = gender == GenderType.MALE
+            last_name = self.random.choice(LAST_NAMES)
+            if not is_male:
+                last_name += 'а'
+            patronymic = None
+            if self.random.random() >= NO_PATRONYMIC_SHARE:
+                patronymic = self.random.choice(PATRONYMICS)[not is_male]
+
+            yield (
+                user_id,
+                PASSWORD,
+                False,
+                last_name,
+                self.random.choice(
+                    MALE_FIRST_NAMES if is_male else FEMALE_FIRST_NAMES
+                ),
+                patronymic,
+                self.random_date(date(1960, 1, 1), date(2008, 12, 31)),
+                gender,
+                f'user{user_id}@{EMAIL_DOMAIN}',
+                self.random_phone(),
+                self.random_datetime(5 * 365),
+                self.now,
+                self.random.random() >= INACTIVE_USERS_SHARE,
+            )
+
+            (add_role,) = self.random.choices(
+                add_role_functions, add_role_weights
+            )
+            if add_role is not None:
+                for date_from, date_to in self.role_periods():
+                    add_role(user_id, date_from, date_to)
+
+    def add_coach(self, user_id: int, date_from: date, date_to) -> None:
+        self.coaches.append(
+            (
+                len(self.coaches) + self.first_ids[Coach],
+                user_id,
+                date_from,
+                date_to,
+                self.random.randint(0, 30),
+                self.random.choice(CoachPosition.values),
+                self.random.choice([None, *JudgeCategory.values]),
+                self.now,
+            )
+        )
+
+    def add_athlete(self, user_id: int, date_from: date, date_to) -> None:
+        self.athletes.append(
+            (
+                len(self.athletes) + self.first_ids[Athlete],
+                user_id,
+                date_from,
+                date_to,
+                self.random.choice(PlayingLevel.values),
+                self.now,
+            )
+        )
+
+    def add_administrator(
+        self, user_id: int, date_from: date, date_to
+    ) -> None:
+        self.administrators.append(
+            (
+                len(self.administrators) + self.first_ids[Administrator],
+                user_id,
+                date_from,
+                date_to,
+            )
+        )
+
+    def generate_groups(self):
+        """
+        Строки групп действующих тренеров. Спортсмены распределяются по
+        действующим и будущим группам с учетом количества мест.
+        """
+
+        statuses = list(GROUP_STATUS_WEIGHTS)
+        weights = list(GROUP_STATUS_WEIGHTS.values())
+        group_id = self.first_ids[Group]
+        groups = []
+        for coach_id, _, _, date_to, *_ in self.coaches:
+            if date_to is not None:
+                continue
+            count = self.random.randint(
+                0, 2 * self.options['groups_per_coach']
+            )
+            for _ in range(count):
+                (status,) = self.random.choices(statuses, weights)
+                groups.append(
+                    [
+                        group_id,
+                        f'Группа {group_id}',
+                        status,
+                        coach_id,
+                        6,
+                        self.random.randint(6, 12),
+                        0,
+                        self.random.choice(PlayingLevel.values),
+                        sorted(
+                            self.random.sample(
+                                Weekdays.values, self.random.randint(2, 3)
+                            ),
+                            key=Weekdays.values.index,
+                        ),
+                        self.random.choice(TRAINING_TIMES),
+                        self.random_date(
+                            self.today - timedelta(days=365),
+                            self.today + timedelta(days=90),
+                        ),
+                        self.now,
+                    ]
+                )
+                if status != GroupStatus.FINISHED:
+                    self.groups.append(groups[-1])
+                group_id += 1
+
+        open_groups = list(self.groups)
+        for athlete_id, _, _, date_to, *_ in self.athletes:
+            if date_to is not None or not open_groups:
+                continue
+            count = self.random.randint(
+                0, self.options['max_groups_per_athlete']
+            )
+            for group in self.random.sample(
+                open_groups, min(count, len(open_groups))
+            ):
+                # Количество спортсменов и максимальное количество
+                group[6] += 1
+                self.memberships.append((athlete_id, group[0]))
+                if group[6] >= group[5]:
+                    open_groups.remove(group)
+
+        return groups
+
+    def generate_applications(self, first_user_id: int, users_count: int):
+        """Строки заявок случайных пользователей в случайные группы."""
+
+        options = self.options
+        statuses = [
+            GroupApplicationStatus.NEW,
+            GroupApplicationStatus.APPROVED,
+            GroupApplicationStatus.REJECT,
+        ]
+        weights = [
+            1 - options['approved'] - options['rejected'],
+            options['approved'],
+            options['rejected'],
+        ]
+        count = round(users_count * options['applications'])
+        for application_id in range(
+            self.first_ids[GroupApplication],
+            self.first_ids[GroupApplication] + count,
+        ):
+            (status,) = self.random.choices(statuses, weights)
+            created_at = self.random_datetime(365)
+            yield (
+                application_id,
+                self.random.randint(
+                    first_user_id, first_user_id + users_count - 1
+                ),
+                self.random.choice(self.groups)[0],
+                created_at,
+                created_at,
+                status,
+                self.random.choice(PlayingLevel.values),
+                None,
+                self.random.choice(REJECT_REASONS)
+                if status == GroupApplicationStatus.REJECT
+                else None,
+            )
+
+    def execute(self) -> dict[str, int]:
+        """
+        Загрузка данных одной транзакцией.
+
+        Id записей назначаются подряд после максимальных существующих,
+        на время загрузки таблицы блокируются от записи, а после нее
+        последовательности id сдвигаются за загруженные записи.
+
+        :return: Количество загруженных строк по таблицам.
+        """
+
+        models = (User, Coach, Athlete, Administrator, Group, GroupApplication)
+        quote_name = connection.ops.quote_name
+        tables = ', '.join(
+            quote_name(model._meta.db_table)
+            for model in (*models, Athlete.groups.through)
+        )
+        users_count = self.options['users']
+        result = {}
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f'LOCK TABLE {tables} IN SHARE ROW EXCLUSIVE MODE')
+            for model in models:
+                cursor.execute(
+                    'SELECT COALESCE(MAX(id), 0) + 1 FROM '
+                    f'{quote_name(model._meta.db_table)}'
+                )
+                self.first_ids[model] = cursor.fetchone()[0]
+
+            # Курсор psycopg, у обертки Django нет метода copy
+            copy_cursor = cursor.cursor
+            first_user_id = self.first_ids[User]
+            result['users'] = copy_rows(
+                copy_cursor,
+                User,
+                (
+                    'id', 'password', 'is_superuser', 'last_name',
+                    'first_name', 'patronymic', 'date_of_birth', 'gender',
+                    'email', 'phone', 'created_at', 'updated_at',
+                    'is_active',
+                ),
+                self.generate_users(first_user_id, users_count),
+            )  # fmt: skip
+            result['coaches'] = copy_rows(
+                copy_cursor,
+                Coach,
+                (
+                    'id', 'user_id', 'date_from', 'date_to',
+                    'coach_experience', 'position', 'judge_category',
+                    'updated_at',
+                ),
+                self.coaches,
+            )  # fmt: skip
+            result['athletes'] = copy_rows(
+                copy_cursor,
+                Athlete,
+                (
+                    'id', 'user_id', 'date_from', 'date_to',
+                    'playing_level', 'updated_at',
+                ),
+                self.athletes,
+            )  # fmt: skip
+            result['administrators'] = copy_rows(
+                copy_cursor,
+                Administrator,
+                ('id', 'user_id', 'date_from', 'date_to'),
+                self.administrators,
+            )
+            result['groups'] = copy_rows(
+                copy_cursor,
+                Group,
+                (
+                    'id', 'name', 'status', 'coach_id', 'min_participants',
+                    'max_participants', 'participants_count',
+                    'playing_level', 'training_days', 'training_time',
+                    'trainings_start_date', 'updated_at',
+                ),
+                self.generate_groups(),
+            )  # fmt: skip
+            result['group athletes'] = copy_rows(
+                copy_cursor,
+                Athlete.groups.through,
+                ('athlete_id', 'group_id'),
+                self.memberships,
+            )
+            result['group applications'] = 0
+            if self.groups and users_count:
+                result['group applications'] = copy_rows(
+                    copy_cursor,
+                    GroupApplication,
+                    (
+                        'id', 'user_id', 'group_id', 'created_at',
+                        'updated_at', 'status', 'playing_level', 'comment',
+                        'reject_reason',
+                    ),
+                    self.generate_applications(first_user_id, users_count),
+                )  # fmt: skip
+
+            for sql in connection.ops.sequence_reset_sql(no_style(), models):
+                cursor.execute(sql)
+
+        # Статистика планировщика для новых объемов данных
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {tables}')
+
+        return result
+
+
+class Command(BaseCommand):
+    help = (
+        'Генерация тестовых данных объема боевой базы: пользователей, '
+        'истории ролей, групп и заявок. Данные загружаются через COPY и '
+        'при одинаковом --seed получаются одинаковыми.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--users',
+            type=int,
+            default=100_000,
+            help='Количество пользователей',
+        )
+        parser.add_argument(
+            '--coaches',
+            type=share,
+            default=0.01,
+            help='Доля пользователей с ролью тренера',
+        )
+        parser.add_argument(
+            '--athletes',
+            type=share,
+            default=0.3,
+            help='Доля пользователей с ролью спортсмена',
+        )
+        parser.add_argument(
+            '--administrators',
+            type=share,
+            default=0.001,
+            help='Доля пользователей с ролью администратора',
+        )
+        parser.add_argument(
+            '--role-history',
+            type=share,
+            default=0.2,
+            help='Доля ролей, перед которыми была закончившаяся роль',
+        )
+        parser.add_argument(
+            '--ended-roles',
+            type=share,
+            default=0.1,
+            help='Доля закончившихся последних ролей',
+        )
+        parser.add_argument(
+            '--groups-per-coach',
+            type=int,
+            default=3,
+            help='Среднее количество групп действующего тренера',
+        )
+        parser.add_argument(
+            '--max-groups-per-athlete',
+            type=int,
+            default=2,
+            help='Максимальное количество групп действующего спортсмена',
+        )
+        parser.add_argument(
+            '--applications',
+            type=float,
+            default=0.5,
+            help='Среднее количество заявок на пользователя',
+        )
+        parser.add_argument(
+            '--approved',
+            type=share,
+            default=0.3,
+            help='Доля подтвержденных заявок',
+        )
+        parser.add_argument(
+            '--rejected',
+            type=share,
+            default=0.2,
+            help='Доля отклоненных заявок',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Зерно генератора случайных чисел',
+        )
+
+    def handle(self, *args, **options):
+        if options['users'] < 0:
+            raise CommandError('Количество пользователей не может быть < 0')
+        roles = ('coaches', 'athletes', 'administrators')
+        if sum(options[role] for role in roles) > 1:
+            raise CommandError('Сумма долей ролей не может быть больше 1')
+        if options['approved'] + options['rejected'] > 1:
+            raise CommandError('Сумма долей статусов заявок больше 1')
+        if (
+            options['groups_per_coach'] < 0
+            or options['max_groups_per_athlete'] < 0
+            or options['applications'] < 0
+        ):
+            raise CommandError('Количество групп и заявок не может быть < 0')
+
+        start = time.perf_counter()
+        result = TcmsSeeder(options).execute()
+        duration = time.perf_counter() - start
+
+        for table, count in result.items():
+            self.stdout.write(f'{table}: {count}')
+        self.stdout.write(
+            self.style.SUCCESS(f'Данные загружены за {duration:.1f} с')
+        )
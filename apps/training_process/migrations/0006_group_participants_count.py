@@ -0,0 +1,39 @@
+# Generated by Django 5.1.6 on 2026-10-18 08:49
+
+import apps.training_process.models.managers
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('training_process', '0005_alter_groupapplication_managers'),
+        ('user', '0004_user_full_name'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='group',
+            managers=[
+                ('objects', apps.training_process.models.managers.GroupManager()),
+            ],
+        ),
+        migrations.AddField(
+            model_name='group',
+            name='participants_count',
+            field=models.PositiveSmallIntegerField(default=0, editable=False, verbose_name='Текущее количество спортсменов'),
+        ),
+        migrations.AddIndex(
+            model_name='group',
+            index=models.Index(condition=models.Q(('participants_count__lt', models.F('max_participants'))), fields=['-id'], name='group_has_free_seats_idx'),
+        ),
+        migrations.RunSQL(
+            sql=(
+                'UPDATE training_process_group g SET participants_count = ('
+                'SELECT COUNT(*) FROM user_athlete_groups ag '
+                'JOIN user_athlete a ON a.id = ag.athlete_id '
+                'WHERE ag.group_id = g.id AND a.date_to IS NULL)'
+            ),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.6 on 2026-10-18 09:49
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('training_process', '0007_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='groupapplication',
+            index=models.Index(fields=['status', '-id'], name='group_application_status_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-18 09:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('training_process', '0008_group_application_status_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='groupapplication',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='Дата и время подачи заявки'),
+        ),
+    ]
@@ -1,14 +1,19 @@
 from common.choices import PlayingLevel, Weekdays
+from common.mixins import UpdatedAtModelMixin
 from django.contrib.postgres.fields import ArrayField
 from django.core.validators import MaxValueValidator
 from django.db import models
+from django.db.models import F, Q
 
 from apps.training_process.models.choices import GroupStatus
+from apps.training_process.models.managers import GroupManager
 
 
-class Group(models.Model):
+class Group(UpdatedAtModelMixin, models.Model):
     """Модель тренировочной группы."""
 
+    objects = GroupManager()
+
     name = models.CharField(
         verbose_name='Наименование',
         max_length=300,
@@ -38,6 +43,12 @@ class Group(models.Model):
         validators=[MaxValueValidator(12)],
         default=12,
     )
+    # Поддерживается сервисами одобрения заявок и окончания роли спортсмена
+    participants_count = models.PositiveSmallIntegerField(
+        verbose_name='Текущее количество спортсменов',
+        default=0,
+        editable=False,
+    )
     playing_level = models.CharField(
         verbose_name='Уровень занимающихся',
         choices=PlayingLevel.choices,
@@ -55,12 +66,28 @@ class Group(models.Model):
     trainings_start_date = models.DateField(
         verbose_name='Дата начала тренировок'
     )
+    updated_at = models.DateTimeField(
+        verbose_name='Дата и время изменения',
+        auto_now=True,
+    )
 
     class Meta:
         verbose_name = 'Группа'
         verbose_name_plural = 'Группы'
+        indexes = [
+            # Частичный индекс для фильтра групп со свободными местами
+            models.Index(
+                fields=['-id'],
+                condition=Q(participants_count__lt=F('max_participants')),
+                name='group_has_free_seats_idx',
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.name
 
-    # TODO добавить расчет актуальной заполненности группы
+    @property
+    def free_seats(self) -> int:
+        """Количество свободных мест в группе."""
+
+        return max(self.max_participants - self.participants_count, 0)
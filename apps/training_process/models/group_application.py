@@ -1,4 +1,5 @@
 from common.choices import PlayingLevel
+from common.mixins import UpdatedAtModelMixin
 from django.db import models
 
 from apps.training_process.models.choices import (
@@ -7,7 +8,7 @@ from apps.training_process.models.choices import (
 from apps.training_process.models.managers import GroupApplicationManager
 
 
-class GroupApplication(models.Model):
+class GroupApplication(UpdatedAtModelMixin, models.Model):
     """Модель заявки на присоединение к тренировочной группе."""
 
     objects = GroupApplicationManager()
@@ -27,6 +28,11 @@ class GroupApplication(models.Model):
     created_at = models.DateTimeField(
         verbose_name='Дата и время подачи заявки',
         auto_now_add=True,
+        db_index=True,
+    )
+    updated_at = models.DateTimeField(
+        verbose_name='Дата и время изменения',
+        auto_now=True,
     )
     status = models.CharField(
         verbose_name='Статус заявки',
@@ -54,6 +60,14 @@ class GroupApplication(models.Model):
     class Meta:
         verbose_name = 'Заявка на присоединение к группе'
         verbose_name_plural = 'Заявки на присоединение к группе'
+        indexes = [
+            # Индекс для списка заявок в статусе (например, новых)
+            # в порядке убывания id
+            models.Index(
+                fields=['status', '-id'],
+                name='group_application_status_idx',
+            ),
+        ]
 
     def __str__(self) -> str:
         return (
@@ -1,8 +1,77 @@
-from common.managers import UserFullNameAnnotationMixin
-from django.db.models import Manager, QuerySet
+from common.managers import (
+    UpdatedAtQuerySetMixin,
+    UserFullNameAnnotationMixin,
+)
+from django.db import transaction
+from django.db.models import Count, Manager, OuterRef, QuerySet, Subquery
+from django.db.models.functions import Coalesce
 
+from apps.training_process.cache import group_catalog_cache
 
-class GroupApplicationQuerySet(QuerySet, UserFullNameAnnotationMixin):
+
+class GroupQuerySet(UpdatedAtQuerySetMixin, QuerySet):
+    def update(self, **kwargs):
+        result = super().update(**kwargs)
+        # Массовое изменение не отправляет сигналы сохранения
+        group_catalog_cache.invalidate()
+
+        return result
+
+    def update_participants_count(self) -> int:
+        """
+        Пересчет количества спортсменов в группах кверисета одним UPDATE.
+
+        Учитываются только действующие роли спортсменов. Перед вызовом
+        строки групп стоит заблокировать (select_for_update), чтобы
+        параллельные транзакции не затерли значение друг друга.
+        """
+
+        through_model = self.model.athletes.through
+        participants_count = (
+            through_model.objects.filter(
+                group_id=OuterRef('pk'), athlete__date_to__isnull=True
+            )
+            .order_by()
+            .values('group_id')
+            .annotate(count=Count('pk'))
+            .values('count')
+        )
+
+        return self.update(
+            participants_count=Coalesce(Subquery(participants_count), 0)
+        )
+
+    def lock_and_update_participants_count(self) -> int:
+        """
+        Блокировка групп кверисета (в порядке id) и пересчет количества
+        спортсменов в них в одной транзакции.
+        """
+
+        with transaction.atomic():
+            list(
+                self.select_for_update()
+                .order_by('pk')
+                .values_list('pk', flat=True)
+            )
+            return self.update_participants_count()
+
+
+class GroupManager(Manager):
+    """Менеджер для модели тренировочной группы."""
+
+    use_in_migrations = True
+
+    def get_queryset(self):
+        return GroupQuerySet(
+            model=self.model,
+            using=self._db,
+            hints=self._hints,
+        )
+
+
+class GroupApplicationQuerySet(
+    UpdatedAtQuerySetMixin, QuerySet, UserFullNameAnnotationMixin
+):
     user_field_name = 'user'
 
 
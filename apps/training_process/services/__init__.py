@@ -1,3 +1,5 @@
 # ruff: noqa: F401
 from .group_application_approve import GroupApplicationApproveService
+from .group_application_bulk_approve import GroupApplicationBulkApproveService
+from .group_application_bulk_reject import GroupApplicationBulkRejectService
 from .group_application_reject import GroupApplicationRejectService
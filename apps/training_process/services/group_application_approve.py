@@ -1,6 +1,7 @@
+from django.db import transaction
 from rest_framework.exceptions import ValidationError
 
-from apps.training_process.models import GroupApplication
+from apps.training_process.models import Group, GroupApplication
 from apps.training_process.models.choices import GroupApplicationStatus
 from apps.user.models import Athlete
 from apps.user.services import UserAppointAthleteService
@@ -17,15 +18,29 @@ class GroupApplicationApproveService:
         self._application = group_application
 
     def execute(self) -> GroupApplication:
-        self._validate()
-        self._joining_athlete_to_group()
+        with transaction.atomic():
+            self._lock_group()
+            self._validate()
+            self._joining_athlete_to_group()
+            self._refresh_group_participants_count()
 
-        return self._approve_application()
+            return self._approve_application()
+
+    def _lock_group(self) -> None:
+        """
+        Блокировка группы на время одобрения заявки, чтобы параллельные
+        одобрения не превысили количество мест в группе.
+        """
+
+        self._group = Group.objects.select_for_update().get(
+            pk=self._application.group_id
+        )
 
     def _validate(self) -> None:
         """Валидация."""
 
         self._validate_status()
+        self._validate_free_seats()
 
     def _validate_status(self):
         """Валидация статуса заявки."""
@@ -35,6 +50,28 @@ class GroupApplicationApproveService:
                 'Одобрять можно только заявки в статусе "Новая"'
             )
 
+    def _validate_free_seats(self) -> None:
+        """
+        Проверка наличия свободных мест в группе.
+
+        Спортсмен, который уже состоит в группе, нового места не занимает,
+        как и при массовом одобрении заявок.
+        """
+
+        if self._group.free_seats or self._is_group_member():
+            return
+
+        raise ValidationError('В группе нет свободных мест')
+
+    def _is_group_member(self) -> bool:
+        """Состоит ли действующий спортсмен пользователя заявки в группе."""
+
+        return Athlete.groups.through.objects.filter(
+            group_id=self._group.pk,
+            athlete__user_id=self._application.user_id,
+            athlete__date_to__isnull=True,
+        ).exists()
+
     def _joining_athlete_to_group(self) -> None:
         """Присоединение спортсмена к группе."""
 
@@ -50,7 +87,16 @@ class GroupApplicationApproveService:
             ).execute()
         )
 
-        athlete.groups.add(self._application.group)
+        athlete.groups.add(self._group)
+
+    def _refresh_group_participants_count(self) -> None:
+        """
+        Получение количества спортсменов в группе. Количество
+        пересчитывается при присоединении спортсмена к группе
+        (см. update_participants_count_on_membership_change).
+        """
+
+        self._application.group.refresh_from_db(fields=['participants_count'])
 
     def _approve_application(self) -> GroupApplication:
         """Редактирование заявки."""
@@ -0,0 +1,240 @@
+from typing import Any
+
+from django.db import transaction
+from django.utils.timezone import now
+
+from apps.training_process.models import Group, GroupApplication
+from apps.training_process.models.choices import GroupApplicationStatus
+from apps.user.models import Athlete
+
+
+class GroupApplicationBulkApproveService:
+    """
+    Сервис массового одобрения заявок на присоединение к группе.
+
+    Все заявки обрабатываются фиксированным числом запросов: блокировка
+    заявок и групп, поиск действующих спортсменов, одна вставка недостающих
+    спортсменов и их повторный поиск, одна вставка связей спортсменов
+    с группами, пересчет заполненности групп и одно обновление статусов.
+    Результат возвращается по каждой заявке.
+    """
+
+    def __init__(self, ids: list[int]) -> None:
+        """
+        :param ids: Идентификаторы одобряемых заявок.
+        """
+
+        self._ids = list(dict.fromkeys(ids))
+        self._errors: dict[int, str] = {}
+
+    def execute(self) -> list[dict[str, Any]]:
+        with transaction.atomic():
+            applications = self._lock_applications()
+            self._validate(applications)
+            applications = self._exclude_failed(applications)
+
+            if applications:
+                groups = self._lock_groups(applications)
+                athletes = self._get_athletes(applications)
+                self._validate_free_seats(applications, groups, athletes)
+                applications = self._exclude_failed(applications)
+
+            if applications:
+                athletes.update(self._create_athletes(applications, athletes))
+                self._joining_athletes_to_groups(applications, athletes)
+                self._update_groups_participants_count(groups)
+                self._approve_applications(applications)
+
+        return self._get_results()
+
+    def _lock_applications(self) -> list[GroupApplication]:
+        """Блокировка заявок на время одобрения."""
+
+        return list(
+            GroupApplication.objects.select_for_update()
+            .filter(pk__in=self._ids)
+            .only('id', 'user_id', 'group_id', 'status', 'playing_level')
+            .order_by('pk')
+        )
+
+    @staticmethod
+    def _lock_groups(applications: list[GroupApplication]) -> dict[int, int]:
+        """
+        Блокировка групп заявок на время одобрения.
+
+        :return: Словарь id группы - количество свободных мест.
+        """
+
+        groups = (
+            Group.objects.select_for_update()
+            .filter(
+                pk__in={application.group_id for application in applications}
+            )
+            .only('id', 'max_participants', 'participants_count')
+            .order_by('pk')
+        )
+
+        return {group.pk: group.free_seats for group in groups}
+
+    def _validate(self, applications: list[GroupApplication]) -> None:
+        """Валидация заявок."""
+
+        found_ids = {application.pk for application in applications}
+        for pk in self._ids:
+            if pk not in found_ids:
+                self._errors[pk] = 'Заявка не найдена'
+
+        for application in applications:
+            if not application.status == GroupApplicationStatus.NEW:
+                self._errors[application.pk] = (
+                    'Одобрять можно только заявки в статусе "Новая"'
+                )
+
+    def _validate_free_seats(
+        self,
+        applications: list[GroupApplication],
+        free_seats: dict[int, int],
+        athletes: dict[int, int],
+    ) -> None:
+        """
+        Проверка наличия свободных мест в группах.
+
+        Места занимаются в порядке id заявок. Спортсмен, который уже состоит
+        в группе, нового места не занимает.
+        """
+
+        through_model = Athlete.groups.through
+        members = set(
+            through_model.objects.filter(
+                athlete_id__in=athletes.values(), group_id__in=free_seats
+            ).values_list('athlete_id', 'group_id')
+        )
+
+        joining = set()
+        for application in applications:
+            key = (application.user_id, application.group_id)
+            athlete_id = athletes.get(application.user_id)
+            if key in joining or (athlete_id, application.group_id) in members:
+                continue
+            if free_seats[application.group_id] <= 0:
+                self._errors[application.pk] = 'В группе нет свободных мест'
+                continue
+            free_seats[application.group_id] -= 1
+            joining.add(key)
+
+    @staticmethod
+    def _get_athletes(applications: list[GroupApplication]) -> dict[int, int]:
+        """
+        Получение действующих ролей спортсменов пользователей заявок.
+
+        :return: Словарь id пользователя - id спортсмена.
+        """
+
+        return dict(
+            Athlete.objects.filter(
+                user_id__in={
+                    application.user_id for application in applications
+                },
+                date_to__isnull=True,
+            )
+            .order_by('pk')
+            .values_list('user_id', 'pk')
+        )
+
+    @classmethod
+    def _create_athletes(
+        cls, applications: list[GroupApplication], athletes: dict[int, int]
+    ) -> dict[int, int]:
+        """
+        Создание ролей спортсменов пользователям без действующей роли.
+
+        Роль создается с уровнем из первой заявки пользователя. Если роль
+        пользователю параллельно назначили после поиска действующих ролей,
+        вставка пропускается по ограничению уникальности действующей роли,
+        а заявка присоединяет к группе уже назначенного спортсмена.
+
+        :return: Словарь id пользователя - id спортсмена.
+        """
+
+        new_athletes = {}
+        for application in applications:
+            if application.user_id in athletes:
+                continue
+            new_athletes.setdefault(
+                application.user_id,
+                Athlete(
+                    user_id=application.user_id,
+                    playing_level=application.playing_level,
+                    date_from=now().date(),
+                ),
+            )
+
+        if not new_athletes:
+            return {}
+
+        Athlete.objects.bulk_create(
+            new_athletes.values(), ignore_conflicts=True
+        )
+
+        return cls._get_athletes(
+            [
+                application
+                for application in applications
+                if application.user_id in new_athletes
+            ]
+        )
+
+    @staticmethod
+    def _joining_athletes_to_groups(
+        applications: list[GroupApplication], athletes: dict[int, int]
+    ) -> None:
+        """Присоединение спортсменов к группам."""
+
+        through_model = Athlete.groups.through
+        through_model.objects.bulk_create(
+            [
+                through_model(
+                    athlete_id=athletes[application.user_id],
+                    group_id=application.group_id,
+                )
+                for application in applications
+            ],
+            ignore_conflicts=True,
+        )
+
+    @staticmethod
+    def _update_groups_participants_count(groups: dict[int, int]) -> None:
+        """Пересчет количества спортсменов в группах."""
+
+        Group.objects.filter(pk__in=groups).update_participants_count()
+
+    @staticmethod
+    def _approve_applications(applications: list[GroupApplication]) -> None:
+        """Обновление статусов заявок."""
+
+        GroupApplication.objects.filter(
+            pk__in=[application.pk for application in applications]
+        ).update(status=GroupApplicationStatus.APPROVED)
+
+    def _exclude_failed(
+        self, applications: list[GroupApplication]
+    ) -> list[GroupApplication]:
+        """Исключение заявок, которые не прошли проверки."""
+
+        return [
+            application
+            for application in applications
+            if application.pk not in self._errors
+        ]
+
+    def _get_results(self) -> list[dict[str, Any]]:
+        """Формирование результата по каждой заявке."""
+
+        return [
+            {
+                'id': pk,
+                'success': pk not in self._errors,
+                'error': self._errors.get(pk),
+            }
+            for pk in self._ids
+        ]
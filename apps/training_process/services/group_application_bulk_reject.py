@@ -0,0 +1,84 @@
+from typing import Any
+
+from django.db import transaction
+
+from apps.training_process.models import GroupApplication
+from apps.training_process.models.choices import GroupApplicationStatus
+
+
+class GroupApplicationBulkRejectService:
+    """
+    Сервис массового отклонения заявок на присоединение к группе.
+
+    Заявки блокируются одним запросом и отклоняются одним обновлением.
+    Результат возвращается по каждой заявке.
+    """
+
+    def __init__(self, ids: list[int], reject_reason: str) -> None:
+        """
+        :param ids: Идентификаторы отклоняемых заявок.
+        :param reject_reason: Причина отклонения заявок.
+        """
+
+        self._ids = list(dict.fromkeys(ids))
+        self._reject_reason = reject_reason
+        self._errors: dict[int, str] = {}
+
+    def execute(self) -> list[dict[str, Any]]:
+        with transaction.atomic():
+            applications = self._lock_applications()
+            self._validate(applications)
+
+            rejected_ids = [
+                application.pk
+                for application in applications
+                if application.pk not in self._errors
+            ]
+            if rejected_ids:
+                self._reject_applications(rejected_ids)
+
+        return self._get_results()
+
+    def _lock_applications(self) -> list[GroupApplication]:
+        """Блокировка заявок на время отклонения."""
+
+        return list(
+            GroupApplication.objects.select_for_update()
+            .filter(pk__in=self._ids)
+            .only('id', 'status')
+            .order_by('pk')
+        )
+
+    def _validate(self, applications: list[GroupApplication]) -> None:
+        """Валидация заявок."""
+
+        found_ids = {application.pk for application in applications}
+        for pk in self._ids:
+            if pk not in found_ids:
+                self._errors[pk] = 'Заявка не найдена'
+
+        for application in applications:
+            if not application.status == GroupApplicationStatus.NEW:
+                self._errors[application.pk] = (
+                    'Отклонять можно только заявки в статусе "Новая"'
+                )
+
+    def _reject_applications(self, ids: list[int]) -> None:
+        """Обновление статусов заявок."""
+
+        GroupApplication.objects.filter(pk__in=ids).update(
+            status=GroupApplicationStatus.REJECT,
+            reject_reason=self._reject_reason,
+        )
+
+    def _get_results(self) -> list[dict[str, Any]]:
+        """Формирование результата по каждой заявке."""
+
+        return [
+            {
+                'id': pk,
+                'success': pk not in self._errors,
+                'error': self._errors.get(pk),
+            }
+            for pk in self._ids
+        ]
@@ -0,0 +1,123 @@
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+)
+from django.dispatch import receiver
+
+from apps.training_process.cache import group_catalog_cache
+from apps.training_process.models import Group
+from apps.user.models import Athlete, Coach, User
+
+
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+def invalidate_group_catalog_on_group_change(sender, **kwargs):
+    """Инвалидация кеша каталога групп при изменении группы."""
+
+    group_catalog_cache.invalidate()
+
+
+@receiver(post_save, sender=Coach)
+@receiver(post_delete, sender=Coach)
+def invalidate_group_catalog_on_coach_change(sender, instance, **kwargs):
+    """Инвалидация кеша каталога групп при изменении тренера группы."""
+
+    if Group.objects.filter(coach_id=instance.pk).exists():
+        group_catalog_cache.invalidate()
+
+
+@receiver(post_save, sender=User)
+def invalidate_group_catalog_on_user_change(sender, instance, **kwargs):
+    """
+    Инвалидация кеша каталога групп при изменении пользователя
+    тренера группы.
+    """
+
+    if Group.objects.filter(coach__user_id=instance.pk).exists():
+        group_catalog_cache.invalidate()
+
+
+@receiver(m2m_changed, sender=Athlete.groups.through)
+def invalidate_group_catalog_on_membership_change(sender, action, **kwargs):
+    """Инвалидация кеша каталога групп при изменении состава групп."""
+
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        group_catalog_cache.invalidate()
+
+
+@receiver(m2m_changed, sender=Athlete.groups.through)
+def update_participants_count_on_membership_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    """
+    Пересчет количества спортсменов в группах при изменении состава групп
+    через связь (например, в панели администратора).
+
+    Группы блокируются на время пересчета, чтобы параллельные изменения
+    не затерли количество друг друга. Сервисы, добавляющие связи
+    пакетно, пересчитывают количество сами.
+    """
+
+    if action == 'pre_clear' and not reverse:
+        # После очистки группы спортсмена уже не получить
+        instance._cleared_group_ids = list(
+            instance.groups.values_list('pk', flat=True)
+        )
+        return
+
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if reverse:
+        group_ids = [instance.pk]
+    elif action == 'post_clear':
+        group_ids = instance.__dict__.pop('_cleared_group_ids', [])
+    else:
+        group_ids = pk_set
+
+    if group_ids:
+        Group.objects.filter(
+            pk__in=group_ids
+        ).lock_and_update_participants_count()
+
+
+@receiver(post_save, sender=Athlete)
+def update_participants_count_on_athlete_change(
+    sender, instance, created, update_fields, **kwargs
+):
+    """
+    Пересчет количества спортсменов в группах спортсмена при изменении
+    даты окончания роли (окончание роли, правка в панели администратора).
+    """
+
+    if created or (
+        update_fields is not None and 'date_to' not in update_fields
+    ):
+        return
+
+    instance.groups.all().lock_and_update_participants_count()
+
+
+@receiver(pre_delete, sender=Athlete)
+def remember_groups_on_athlete_delete(sender, instance, **kwargs):
+    """
+    Сохранение групп удаляемого спортсмена, в т.ч. при каскадном удалении
+    пользователя: после удаления связи с группами уже не получить.
+    """
+
+    instance._deleted_group_ids = list(
+        instance.groups.values_list('pk', flat=True)
+    )
+
+
+@receiver(post_delete, sender=Athlete)
+def update_participants_count_on_athlete_delete(sender, instance, **kwargs):
+    """Пересчет количества спортсменов в группах удаленного спортсмена."""
+
+    group_ids = instance.__dict__.pop('_deleted_group_ids', [])
+    if group_ids:
+        Group.objects.filter(
+            pk__in=group_ids
+        ).lock_and_update_participants_count()
@@ -1,10 +1,16 @@
+from common.admin import CurrentRoleListFilter, ScalableModelAdmin
 from django.contrib import admin
 
-from apps.user.models import Administrator, Coach, User
+from apps.user.models import Administrator, Athlete, Coach, User
+
+# Поиск пользователя по триграммному индексу ФИО и по индексу адреса
+# электронной почты (поиск по началу адреса)
+USER_SEARCH_FIELDS = ('full_name', 'email__startswith')
+ROLE_SEARCH_FIELDS = tuple(f'user__{field}' for field in USER_SEARCH_FIELDS)
 
 
 @admin.register(User)
-class UserModelAdmin(admin.ModelAdmin):
+class UserModelAdmin(ScalableModelAdmin):
     list_display = (
         'get_full_name',
         'email',
@@ -12,6 +18,8 @@ class UserModelAdmin(admin.ModelAdmin):
         'date_of_birth',
         'gender',
     )
+    list_filter = ('is_active',)
+    search_fields = USER_SEARCH_FIELDS
 
     def get_full_name(self, obj):
         return obj.full_name
@@ -20,19 +28,41 @@ class UserModelAdmin(admin.ModelAdmin):
 
 
 @admin.register(Administrator)
-class AdministratorModelAdmin(admin.ModelAdmin):
+class AdministratorModelAdmin(ScalableModelAdmin):
     list_display = (
         'user',
         'date_from',
         'date_to',
     )
+    list_select_related = ('user',)
+    list_filter = (CurrentRoleListFilter,)
+    search_fields = ROLE_SEARCH_FIELDS
+    autocomplete_fields = ('user',)
 
 
 @admin.register(Coach)
-class CoachModelAdmin(admin.ModelAdmin):
+class CoachModelAdmin(ScalableModelAdmin):
     list_display = (
         'user',
         'date_from',
         'date_to',
         'position',
     )
+    list_select_related = ('user',)
+    list_filter = (CurrentRoleListFilter,)
+    search_fields = ROLE_SEARCH_FIELDS
+    autocomplete_fields = ('user',)
+
+
+@admin.register(Athlete)
+class AthleteModelAdmin(ScalableModelAdmin):
+    list_display = (
+        'user',
+        'date_from',
+        'date_to',
+        'playing_level',
+    )
+    list_select_related = ('user',)
+    list_filter = (CurrentRoleListFilter,)
+    search_fields = ROLE_SEARCH_FIELDS
+    autocomplete_fields = ('user', 'groups')
@@ -1,4 +1,4 @@
-from common.mixins import FullNameFilterMixin
+from common.mixins import CurrentRoleFilterMixin, FullNameFilterMixin
 from django_filters import rest_framework as filters
 from django_filters.constants import EMPTY_VALUES
 
@@ -22,7 +22,7 @@ class AthleteOrderingFilter(filters.OrderingFilter):
         return qs.with_full_name_annotation().order_by(*ordering)
 
 
-class AthleteFilter(FullNameFilterMixin):
+class AthleteFilter(CurrentRoleFilterMixin, FullNameFilterMixin):
     """Фильтрация и сортировка спортсменов."""
 
     # Фильтры
@@ -1,15 +1,31 @@
-from common.mixins import FullNameFilterMixin
+from common.mixins import CurrentRoleFilterMixin, FullNameFilterMixin
 from django_filters import rest_framework as filters
 from django_filters.constants import EMPTY_VALUES
 
+# Максимальное значение фильтров по общему тренерскому стажу
+MAX_COACH_EXPERIENCE_FILTER = 200
+
 
 class CoachOrderingFilter(filters.OrderingFilter):
     """
     Класс сортировки для модели Coach.
 
     Обновляет стандартный OrderingFilter, добавляя к кверисету аннотации.
+    Сортировка по общему тренерскому стажу выполняется по индексу даты
+    начала карьеры в обратном направлении.
     """
 
+    # Поля, сортировка по которым обратна сортировке по параметру
+    reversed_fields = frozenset({'career_start_date'})
+
+    def get_ordering_value(self, param):
+        value = super().get_ordering_value(param)
+        field_name = value.removeprefix('-')
+        if field_name not in self.reversed_fields:
+            return value
+
+        return field_name if value.startswith('-') else f'-{field_name}'
+
     def filter(self, qs, value):
         if value in EMPTY_VALUES:
             return qs
@@ -19,27 +35,48 @@ class CoachOrderingFilter(filters.OrderingFilter):
             for param in value
             if param not in EMPTY_VALUES
         ]
-        return (
-            qs.with_full_name_annotation()
-            .with_all_coach_experience_annotation()
-            .order_by(*ordering)
-        )
+        return qs.with_full_name_annotation().order_by(*ordering)
 
 
-class CoachFilter(FullNameFilterMixin):
+class CoachFilter(CurrentRoleFilterMixin, FullNameFilterMixin):
     """Фильтрация и сортировка тренеров."""
 
+    # Фильтры
+    min_coach_experience = filters.NumberFilter(
+        label='Общий тренерский стаж от (полных лет)',
+        method='min_coach_experience_filter',
+        min_value=0,
+        max_value=MAX_COACH_EXPERIENCE_FILTER,
+    )
+    max_coach_experience = filters.NumberFilter(
+        label='Общий тренерский стаж до (полных лет)',
+        method='max_coach_experience_filter',
+        min_value=0,
+        max_value=MAX_COACH_EXPERIENCE_FILTER,
+    )
+
+    @staticmethod
+    def min_coach_experience_filter(qs, name, value):
+        """Фильтрация по минимальному общему тренерскому стажу."""
+
+        return qs.with_min_coach_experience(int(value))
+
+    @staticmethod
+    def max_coach_experience_filter(qs, name, value):
+        """Фильтрация по максимальному общему тренерскому стажу."""
+
+        return qs.with_max_coach_experience(int(value))
+
     # Сортировка
-    # TODO добавить сортировку по стажу работы
     ordering = CoachOrderingFilter(
         fields={
             'full_name': 'full_name',
             'position': 'position',
-            'all_coach_experience': 'all_coach_experience',
+            'career_start_date': 'all_coach_experience',
         },
         field_labels={
             'full_name': 'ФИО пользователя',
             'position': 'Должность',
-            'all_coach_experience': 'Общий тренерский стаж',
+            'career_start_date': 'Общий тренерский стаж',
         },
     )
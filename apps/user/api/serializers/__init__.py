@@ -13,4 +13,11 @@ from .coach import (
     CoachCreateSerializer,
     CoachSerializer,
 )
-from .user import UserSerializer
+from .token import TokenObtainPairWithLastLoginSerializer
+from .user import (
+    ImportRowErrorSerializer,
+    UserImportSerializer,
+    UserSerializer,
+    UsersImportReportSerializer,
+    UsersImportSerializer,
+)
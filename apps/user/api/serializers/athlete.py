@@ -1,3 +1,4 @@
+from common.serializers import DynamicFieldsSerializerMixin
 from rest_framework import serializers
 
 from apps.user.api.serializers.user import (
@@ -7,7 +8,9 @@ from apps.user.api.serializers.user import (
 from apps.user.models import Athlete
 
 
-class AthleteSerializer(serializers.ModelSerializer):
+class AthleteSerializer(
+    DynamicFieldsSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор данных спортсмена."""
 
     user = UserSerializer(
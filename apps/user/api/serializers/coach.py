@@ -1,3 +1,4 @@
+from common.serializers import DynamicFieldsSerializerMixin
 from rest_framework import serializers
 
 from apps.user.api.serializers.user import (
@@ -7,7 +8,9 @@ from apps.user.api.serializers.user import (
 from apps.user.models import Coach
 
 
-class CoachSerializer(serializers.ModelSerializer):
+class CoachSerializer(
+    DynamicFieldsSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор данных тренера."""
 
     user = UserSerializer(
@@ -15,6 +18,13 @@ class CoachSerializer(serializers.ModelSerializer):
         read_only=True,
     )
 
+    # Свойства модели для выборки через .values() (см. ValuesMapper).
+    # Стаж вычисляется по дате начала карьеры, если он не выбран
+    # аннотацией кверисета
+    values_sources = {
+        'current_coach_experience': ('career_start_date',),
+    }
+
     class Meta:
         model = Coach
         fields = (
@@ -0,0 +1,18 @@
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+
+from apps.user.last_login import last_login_buffer
+
+
+class TokenObtainPairWithLastLoginSerializer(TokenObtainPairSerializer):
+    """
+    Сериализатор получения пары токенов.
+
+    Дата последнего входа пользователя не записывается в БД сразу,
+    а добавляется в буфер пакетного обновления.
+    """
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        last_login_buffer.add(self.user.pk)
+
+        return data
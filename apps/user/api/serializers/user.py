@@ -1,10 +1,13 @@
+from common.serializers import DynamicFieldsSerializerMixin
 from django.contrib.auth.hashers import make_password
 from rest_framework import serializers
 
 from apps.user.models import User
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(
+    DynamicFieldsSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор данных пользователя."""
 
     class Meta:
@@ -59,3 +62,45 @@ class UserCreateNestedSerializer(serializers.ModelSerializer):
             'gender': {'write_only': True},
             'phone': {'write_only': True},
         }
+
+
+class UserImportSerializer(UserCreateNestedSerializer):
+    """
+    Сериализатор данных пользователя при импорте из CSV.
+
+    Уникальность адресов электронной почты проверяется сервисом импорта
+    одним запросом для всего файла, а не запросом на каждую строку.
+    """
+
+    class Meta(UserCreateNestedSerializer.Meta):
+        extra_kwargs = {
+            **UserCreateNestedSerializer.Meta.extra_kwargs,
+            'email': {'write_only': True, 'validators': []},
+        }
+
+
+class UsersImportSerializer(serializers.Serializer):
+    """Сериализатор файла импорта пользователей с ролями."""
+
+    file = serializers.FileField(
+        label='CSV-файл',
+        help_text=(
+            'Файл в кодировке UTF-8 с заголовком. Столбцы: данные '
+            'пользователя и данные роли.'
+        ),
+        write_only=True,
+    )
+
+
+class ImportRowErrorSerializer(serializers.Serializer):
+    """Сериализатор ошибок строки файла импорта."""
+
+    line = serializers.IntegerField(label='Номер строки')
+    errors = serializers.DictField(label='Ошибки по столбцам')
+
+
+class UsersImportReportSerializer(serializers.Serializer):
+    """Сериализатор отчета об импорте пользователей с ролями."""
+
+    created = serializers.IntegerField(label='Количество созданных ролей')
+    errors = ImportRowErrorSerializer(label='Ошибки строк', many=True)
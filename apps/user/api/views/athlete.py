@@ -1,27 +1,39 @@
+import io
+
+from common.conditional import ConditionalGetMixin
+from common.export import ExportMixin
+from common.values_serialization import ValuesListMixin
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 
 from apps.user.api.filters import AthleteFilter
 from apps.user.api.serializers import (
     AthleteCreateSerializer,
     AthleteSerializer,
+    UsersImportReportSerializer,
+    UsersImportSerializer,
 )
 from apps.user.models import Athlete
 from apps.user.services import (
     AthleteCancelService,
+    AthletesWithUsersImportService,
     AthleteWithUserCreateService,
 )
 
 
 class AthleteViewSet(
-    mixins.ListModelMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet
+    ExportMixin,
+    ConditionalGetMixin,
+    ValuesListMixin,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    viewsets.GenericViewSet,
 ):
     """API для работы со спортсменами."""
 
-    # TODO если у пользователя несколько ролей спортсмена,
-    #  должна показываться только последняя
     queryset = Athlete.objects.all().order_by('-id').select_related('user')
 
     serializer_class = AthleteSerializer
@@ -29,10 +41,27 @@ class AthleteViewSet(
     def get_serializer_class(self):
         if self.action == 'create':
             return AthleteCreateSerializer
+        if self.action == 'import_athletes':
+            return UsersImportSerializer
         return super().get_serializer_class()
 
     filterset_class = AthleteFilter
 
+    export_fields = {
+        'id': 'ID',
+        'user_id': 'ID пользователя',
+        'user__last_name': 'Фамилия',
+        'user__first_name': 'Имя',
+        'user__patronymic': 'Отчество',
+        'user__date_of_birth': 'Дата рождения',
+        'user__email': 'Адрес электронной почты',
+        'user__phone': 'Номер телефона',
+        'playing_level': 'Уровень',
+        'date_from': 'Дата назначения роли',
+        'date_to': 'Дата окончания действия роли',
+    }
+    export_filename = 'athletes'
+
     @extend_schema(
         summary='Создание роли спортсмена вместе с пользователем',
         request=AthleteCreateSerializer,
@@ -91,3 +120,44 @@ class AthleteViewSet(
 
         response_serializer = AthleteSerializer(athlete)
         return Response(response_serializer.data, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        summary='Импорт спортсменов вместе с пользователями из CSV',
+        request={'multipart/form-data': UsersImportSerializer},
+        responses={
+            status.HTTP_201_CREATED: UsersImportReportSerializer,
+            status.HTTP_400_BAD_REQUEST: UsersImportReportSerializer,
+        },
+    )
+    @action(
+        detail=False,
+        methods=['POST'],
+        url_path='import',
+        url_name='import',
+        parser_classes=[MultiPartParser],
+    )
+    def import_athletes(self, request, *args, **kwargs):
+        """
+        Импорт ролей спортсменов вместе с созданием новых для системы
+        пользователей из CSV-файла.
+
+        Первая строка файла - заголовок со столбцами данных пользователя
+        и роли. Если в файле есть ошибки, ничего не создается, а в ответе
+        возвращаются ошибки по номерам строк.
+        """
+
+        request_serializer = self.get_serializer(data=request.data)
+        request_serializer.is_valid(raise_exception=True)
+        csv_file = io.TextIOWrapper(
+            request_serializer.validated_data['file'].file,
+            encoding='utf-8-sig',
+            newline='',
+        )
+        report = AthletesWithUsersImportService(csv_file).execute()
+
+        return Response(
+            report,
+            status=status.HTTP_400_BAD_REQUEST
+            if report['errors']
+            else status.HTTP_201_CREATED,
+        )
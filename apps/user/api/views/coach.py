@@ -1,21 +1,37 @@
+import io
+
+from common.conditional import ConditionalGetMixin
+from common.values_serialization import ValuesListMixin
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 
 from apps.user.api.filters import CoachFilter
-from apps.user.api.serializers import CoachCreateSerializer, CoachSerializer
+from apps.user.api.serializers import (
+    CoachCreateSerializer,
+    CoachSerializer,
+    UsersImportReportSerializer,
+    UsersImportSerializer,
+)
 from apps.user.models import Coach
-from apps.user.services import CoachCancelService, CoachWithUserCreateService
+from apps.user.services import (
+    CoachCancelService,
+    CoachesWithUsersImportService,
+    CoachWithUserCreateService,
+)
 
 
 class CoachViewSet(
-    mixins.ListModelMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet
+    ConditionalGetMixin,
+    ValuesListMixin,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    viewsets.GenericViewSet,
 ):
     """API для работы с тренерами."""
 
-    # TODO если у пользователя несколько ролей тренера,
-    #  должна показываться только последняя
     queryset = Coach.objects.all().order_by('-id').select_related('user')
 
     serializer_class = CoachSerializer
@@ -23,10 +39,19 @@ class CoachViewSet(
     def get_serializer_class(self):
         if self.action == 'create':
             return CoachCreateSerializer
+        if self.action == 'import_coachs':
+            return UsersImportSerializer
         return super().get_serializer_class()
 
     filterset_class = CoachFilter
 
+    def get_queryset(self):
+        # Стаж зависит от текущей даты, поэтому аннотация добавляется
+        # при каждом запросе
+        return (
+            super().get_queryset().with_current_coach_experience_annotation()
+        )
+
     @extend_schema(
         summary='Создание роли тренера вместе с пользователем',
         request=CoachCreateSerializer,
@@ -85,3 +110,44 @@ class CoachViewSet(
 
         response_serializer = CoachSerializer(coach)
         return Response(response_serializer.data, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        summary='Импорт тренеров вместе с пользователями из CSV',
+        request={'multipart/form-data': UsersImportSerializer},
+        responses={
+            status.HTTP_201_CREATED: UsersImportReportSerializer,
+            status.HTTP_400_BAD_REQUEST: UsersImportReportSerializer,
+        },
+    )
+    @action(
+        detail=False,
+        methods=['POST'],
+        url_path='import',
+        url_name='import',
+        parser_classes=[MultiPartParser],
+    )
+    def import_coachs(self, request, *args, **kwargs):
+        """
+        Импорт ролей тренеров вместе с созданием новых для системы
+        пользователей из CSV-файла.
+
+        Первая строка файла - заголовок со столбцами данных пользователя
+        и роли. Если в файле есть ошибки, ничего не создается, а в ответе
+        возвращаются ошибки по номерам строк.
+        """
+
+        request_serializer = self.get_serializer(data=request.data)
+        request_serializer.is_valid(raise_exception=True)
+        csv_file = io.TextIOWrapper(
+            request_serializer.validated_data['file'].file,
+            encoding='utf-8-sig',
+            newline='',
+        )
+        report = CoachesWithUsersImportService(csv_file).execute()
+
+        return Response(
+            report,
+            status=status.HTTP_400_BAD_REQUEST
+            if report['errors']
+            else status.HTTP_201_CREATED,
+        )
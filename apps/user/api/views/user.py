@@ -1,3 +1,7 @@
+from common.choices import PaginationCountStrategy
+from common.conditional import ConditionalGetMixin
+from common.export import ExportMixin
+from common.values_serialization import ValuesListMixin
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
@@ -20,7 +24,9 @@ from apps.user.services import (
 )
 
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(
+    ExportMixin, ConditionalGetMixin, ValuesListMixin, viewsets.ModelViewSet
+):
     """API для работы с пользователями."""
 
     queryset = User.objects.all().order_by('-id')
@@ -35,8 +41,23 @@ class UserViewSet(viewsets.ModelViewSet):
         return super().get_serializer_class()
 
     filterset_class = UserFilter
+    pagination_count_strategy = PaginationCountStrategy.CAPPED
     http_method_names = ['get', 'post', 'patch', 'delete']
 
+    export_fields = {
+        'id': 'ID',
+        'last_name': 'Фамилия',
+        'first_name': 'Имя',
+        'patronymic': 'Отчество',
+        'date_of_birth': 'Дата рождения',
+        'gender': 'Пол',
+        'email': 'Адрес электронной почты',
+        'phone': 'Номер телефона',
+        'created_at': 'Дата и время регистрации',
+        'is_active': 'Активен',
+    }
+    export_filename = 'users'
+
     @extend_schema(
         summary='Назначение пользователю роли администратора',
         request=None,
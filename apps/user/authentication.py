@@ -0,0 +1,65 @@
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from apps.user.cache import auth_user_cache
+from apps.user.models import User
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    Аутентификация по JWT с кешированием пользователя.
+
+    Пользователь кешируется на время действия токена, поэтому запрос
+    пользователя к БД выполняется только при первом обращении с токеном.
+    Кеш сбрасывается при сохранении пользователя и при изменении
+    признака активности (см. AuthUserCache).
+    """
+
+    def get_user(self, validated_token: Token) -> User:
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None:
+            return super().get_user(validated_token)
+
+        user = auth_user_cache.get(user_id)
+        if user is None:
+            # Версия до чтения из БД: сброс кеша после чтения сделает
+            # сохраненную запись устаревшей
+            version = auth_user_cache.get_version(user_id)
+            user = super().get_user(validated_token)
+            auth_user_cache.set(user_id, user, validated_token['exp'], version)
+            return user
+
+        self._validate_cached_user(user, validated_token)
+        return user
+
+    @staticmethod
+    def _validate_cached_user(user: User, validated_token: Token) -> None:
+        """
+        Проверки закешированного пользователя, которые зависят от токена.
+
+        Повторяют проверки JWTAuthentication.get_user.
+        """
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(
+                _('User is inactive'), code='user_inactive'
+            )
+
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(
+                _("The user's password has been changed."),
+                code='password_changed',
+            )
+
+
+class CachedJWTScheme(SimpleJWTScheme):
+    """Описание схемы аутентификации CachedJWTAuthentication для OpenAPI."""
+
+    target_class = CachedJWTAuthentication
@@ -0,0 +1,223 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+
+class AuthUserCache:
+    """
+    Кеш пользователей для аутентификации по JWT.
+
+    Пользователь хранится в общем для процессов кеше Django с алиасом
+    AUTH_USER_CACHE_ALIAS и в локальном для процесса LRU-кеше. Без алиаса
+    кеш отключен: сброс локального кеша при сохранении пользователя
+    не виден другим процессам.
+
+    У каждого пользователя в общем кеше есть версия, которая меняется
+    при сбросе кеша. Запись хранится вместе с версией, на момент
+    получения которой пользователь был прочитан из БД, и при каждом
+    обращении сверяется с текущей версией. Поэтому деактивация
+    пользователя или смена пароля действуют во всех процессах сразу,
+    а из общего кеша при попадании в локальный читается только версия.
+
+    Запись живет не дольше срока действия токена, локальная запись -
+    не дольше AUTH_USER_CACHE_LOCAL_TTL.
+    """
+
+    key_prefix = 'auth_user'
+
+    def __init__(self) -> None:
+        self._local: OrderedDict[int, tuple[object, int, float]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return (
+            settings.AUTH_USER_CACHE_SIZE > 0
+            and settings.AUTH_USER_CACHE_ALIAS is not None
+        )
+
+    @property
+    def shared(self):
+        return caches[settings.AUTH_USER_CACHE_ALIAS]
+
+    def get(self, user_id: int):
+        """
+        Получение пользователя из кеша.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Копия закешированного пользователя или None.
+        """
+
+        if not self.enabled:
+            return None
+
+        version_key = self._get_version_key(user_id)
+        local = self._get_local(user_id)
+        if local is not None:
+            user, version = local
+            if self.shared.get(version_key) == version:
+                # Копия, чтобы изменения атрибутов пользователя в одном
+                # запросе не попадали в другие запросы
+                return copy.copy(user)
+            self._pop_local(user_id)
+
+        key = self._get_key(user_id)
+        values = self.shared.get_many([key, version_key])
+        entry, version = values.get(key), values.get(version_key)
+        if entry is None or version is None or entry['version'] != version:
+            return None
+
+        self._set_local(
+            user_id,
+            entry['user'],
+            version,
+            time.time() + settings.AUTH_USER_CACHE_LOCAL_TTL,
+        )
+
+        return copy.copy(entry['user'])
+
+    def get_version(self, user_id: int) -> int | None:
+        """
+        Получение текущей версии пользователя в кеше.
+
+        Запрашивается до чтения пользователя из БД, чтобы сброс кеша
+        между чтением и сохранением в кеш сделал запись устаревшей.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Версия или None, если кеш отключен.
+        """
+
+        if not self.enabled:
+            return None
+
+        version_key = self._get_version_key(user_id)
+        version = time.time_ns()
+        if not self.shared.add(version_key, version, None):
+            version = self.shared.get(version_key, version)
+
+        return version
+
+    def set(
+        self, user_id: int, user, expires_at: float, version: int | None = None
+    ) -> None:
+        """
+        Сохранение пользователя в кеш.
+
+        :param user_id: Идентификатор пользователя.
+        :param user: Пользователь.
+        :param expires_at: Время окончания действия токена (timestamp).
+        :param version: Версия, полученная get_version до чтения
+            пользователя из БД. По умолчанию - текущая версия.
+        """
+
+        timeout = expires_at - time.time()
+        if not self.enabled or timeout <= 0:
+            return
+
+        if version is None:
+            version = self.get_version(user_id)
+
+        # Копия, чтобы изменения пользователя запроса, который его
+        # закешировал, не попадали в кеш
+        user = copy.copy(user)
+        self._set_local(
+            user_id,
+            user,
+            version,
+            min(expires_at, time.time() + settings.AUTH_USER_CACHE_LOCAL_TTL),
+        )
+        self.shared.set(
+            self._get_key(user_id),
+            {'user': user, 'version': version},
+            timeout,
+        )
+
+    def invalidate(self, *user_ids: int) -> None:
+        """
+        Сброс кеша пользователей во всех процессах сменой версии.
+
+        Версия меняется сразу и повторно после фиксации транзакции,
+        чтобы запись, закешированная до фиксации по старым данным,
+        не считалась актуальной.
+        """
+
+        self._delete(user_ids)
+        transaction.on_commit(partial(self._delete, user_ids))
+
+    def clear(self) -> None:
+        """Очистка локального кеша процесса."""
+
+        with self._lock:
+            self._local.clear()
+
+    def _delete(self, user_ids: tuple[int, ...]) -> None:
+        """Смена версий пользователей и удаление их записей."""
+
+        for user_id in user_ids:
+            self._pop_local(user_id)
+
+        if not self.enabled or not user_ids:
+            return
+
+        version = time.time_ns()
+        self.shared.set_many(
+            {self._get_version_key(user_id): version for user_id in user_ids},
+            None,
+        )
+        self.shared.delete_many(
+            [self._get_key(user_id) for user_id in user_ids]
+        )
+
+    def _get_local(self, user_id: int) -> tuple[object, int] | None:
+        """
+        Получение пользователя из локального кеша.
+
+        :return: Пользователь и версия записи или None.
+        """
+
+        with self._lock:
+            item = self._local.get(user_id)
+            if item is None:
+                return None
+
+            user, version, expires_at = item
+            if expires_at <= time.time():
+                del self._local[user_id]
+                return None
+
+            self._local.move_to_end(user_id)
+            return user, version
+
+    def _set_local(
+        self, user_id: int, user, version: int, expires_at: float
+    ) -> None:
+        """Сохранение пользователя в локальный кеш."""
+
+        with self._lock:
+            self._local[user_id] = (user, version, expires_at)
+            self._local.move_to_end(user_id)
+            while len(self._local) > settings.AUTH_USER_CACHE_SIZE:
+                self._local.popitem(last=False)
+
+    def _pop_local(self, user_id: int) -> None:
+        """Удаление пользователя из локального кеша."""
+
+        with self._lock:
+            self._local.pop(user_id, None)
+
+    def _get_key(self, user_id: int) -> str:
+        return f'{self.key_prefix}:{user_id}'
+
+    def _get_version_key(self, user_id: int) -> str:
+        return f'{self.key_prefix}:{user_id}:version'
+
+
+auth_user_cache = AuthUserCache()
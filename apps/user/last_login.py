@@ -0,0 +1,126 @@
+import atexit
+import logging
+import os
+import threading
+from datetime import datetime
+
+from django.conf import settings
+from django.db import connection
+from django.utils.timezone import now
+
+logger = logging.getLogger(__name__)
+
+
+class LastLoginBuffer:
+    """
+    Буфер обновлений даты последнего входа пользователей.
+
+    Вместо записи в user_user при каждом получении токена даты входа
+    накапливаются в памяти процесса и записываются одним запросом
+    UPDATE ... FROM (VALUES ...) раз в LAST_LOGIN_FLUSH_INTERVAL секунд
+    или по достижении LAST_LOGIN_FLUSH_SIZE пользователей. При аварийном
+    завершении процесса теряются даты входа не более чем за один интервал.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[int, datetime] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+
+    def add(self, user_id: int, last_login: datetime | None = None) -> None:
+        """
+        Добавление даты входа пользователя в буфер.
+
+        :param user_id: Идентификатор пользователя.
+        :param last_login: Дата и время входа, по умолчанию - текущие.
+        """
+
+        with self._lock:
+            self._pending[user_id] = last_login or now()
+            size = len(self._pending)
+
+        if settings.LAST_LOGIN_FLUSH_INTERVAL <= 0:
+            self.flush()
+            return
+
+        self._ensure_thread()
+        if size >= settings.LAST_LOGIN_FLUSH_SIZE:
+            self._wakeup.set()
+
+    def flush(self) -> int:
+        """
+        Запись накопленных дат входа в БД.
+
+        :return: Количество обновленных пользователей.
+        """
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        if not pending:
+            return 0
+
+        values = ', '.join(['(%s, %s::timestamptz)'] * len(pending))
+        params = [item for pair in pending.items() for item in pair]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'UPDATE user_user u SET last_login = v.last_login '
+                f'FROM (VALUES {values}) AS v(id, last_login) '
+                'WHERE u.id = v.id '
+                'AND (u.last_login IS NULL OR u.last_login < v.last_login)',
+                params,
+            )
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        """Очистка буфера без записи в БД."""
+
+        with self._lock:
+            self._pending.clear()
+
+    def _ensure_thread(self) -> None:
+        """
+        Запуск фонового потока записи.
+
+        Поток запускается при первом входе в каждом процессе, в том числе
+        после fork воркеров сервера приложений.
+        """
+
+        if self._pid == os.getpid() and self._thread.is_alive():
+            return
+
+        with self._lock:
+            if self._pid == os.getpid() and self._thread.is_alive():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self._run, name='last-login-flush', daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Цикл фонового потока записи."""
+
+        while True:
+            self._wakeup.wait(settings.LAST_LOGIN_FLUSH_INTERVAL)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception('Не удалось обновить даты входа')
+            finally:
+                connection.close()
+
+    def flush_at_exit(self) -> None:
+        """Запись накопленных дат входа при завершении процесса."""
+
+        try:
+            self.flush()
+        except Exception:
+            logger.exception('Не удалось обновить даты входа')
+
+
+last_login_buffer = LastLoginBuffer()
+atexit.register(last_login_buffer.flush_at_exit)
@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError
+
+from apps.user.services import (
+    AthletesWithUsersImportService,
+    CoachesWithUsersImportService,
+)
+
+# Сервисы импорта по роли
+IMPORT_SERVICES = {
+    'athlete': AthletesWithUsersImportService,
+    'coach': CoachesWithUsersImportService,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Импорт ролей вместе с новыми для системы пользователями из '
+        'CSV-файла. Если в файле есть ошибки, ничего не создается.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Путь к CSV-файлу в UTF-8')
+        parser.add_argument(
+            '--role',
+            choices=IMPORT_SERVICES,
+            required=True,
+            help='Роль импортируемых пользователей',
+        )
+
+    def handle(self, *args, **options):
+        service_class = IMPORT_SERVICES[options['role']]
+        try:
+            with open(
+                options['path'], encoding='utf-8-sig', newline=''
+            ) as csv_file:
+                report = service_class(csv_file).execute()
+        except OSError as exc:
+            raise CommandError(f'Не удалось открыть файл: {exc}') from exc
+        except ValidationError as exc:
+            raise CommandError(exc.detail['file'][0]) from exc
+
+        for error in report['errors']:
+            for field, messages in error['errors'].items():
+                self.stderr.write(
+                    f'Строка {error["line"]}, {field}: {"; ".join(messages)}'
+                )
+        if report['errors']:
+            raise CommandError(
+                f'Ошибок в строках: {len(report["errors"])}. '
+                'Пользователи не созданы'
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Создано ролей: {report["created"]}')
+        )
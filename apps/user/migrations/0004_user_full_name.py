@@ -0,0 +1,27 @@
+# Generated by Django 5.1.6 on 2026-10-18 08:43
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.operations
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('user', '0003_coach_coach_experience'),
+    ]
+
+    operations = [
+        django.contrib.postgres.operations.TrigramExtension(),
+        migrations.AddField(
+            model_name='user',
+            name='full_name',
+            field=models.GeneratedField(db_index=True, db_persist=True, expression=django.db.models.functions.text.Concat(models.F('last_name'), models.Value(' '), models.F('first_name'), models.Case(models.When(models.Q(('patronymic__isnull', True), ('patronymic', ''), _connector='OR'), then=models.Value('')), default=django.db.models.functions.text.Concat(models.Value(' '), models.F('patronymic'))), output_field=models.CharField()), output_field=models.CharField(max_length=152), verbose_name='ФИО'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('full_name'), name='gin_trgm_ops'), name='user_full_name_trgm_idx'),
+        ),
+    ]
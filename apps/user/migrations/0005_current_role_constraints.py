@@ -0,0 +1,81 @@
+# Generated by Django 5.1.6 on 2026-10-18 08:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('user', '0004_user_full_name'),
+    ]
+
+    operations = [
+        # Закрытие устаревших дублей действующих ролей перед созданием
+        # уникального ограничения: действующей остается последняя роль
+        migrations.RunSQL(
+            sql=(
+                'UPDATE user_administrator r SET date_to = CURRENT_DATE '
+                'WHERE r.date_to IS NULL AND EXISTS ('
+                'SELECT 1 FROM user_administrator l WHERE l.user_id = r.user_id '
+                'AND l.date_to IS NULL AND l.id > r.id)'
+            ),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            sql=(
+                'UPDATE user_athlete r SET date_to = CURRENT_DATE '
+                'WHERE r.date_to IS NULL AND EXISTS ('
+                'SELECT 1 FROM user_athlete l WHERE l.user_id = r.user_id '
+                'AND l.date_to IS NULL AND l.id > r.id)'
+            ),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            sql=(
+                'UPDATE user_coach r SET date_to = CURRENT_DATE '
+                'WHERE r.date_to IS NULL AND EXISTS ('
+                'SELECT 1 FROM user_coach l WHERE l.user_id = r.user_id '
+                'AND l.date_to IS NULL AND l.id > r.id)'
+            ),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='athlete',
+            index=models.Index(
+                condition=models.Q(('date_to__isnull', True)),
+                fields=['-id'],
+                name='athlete_current_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='coach',
+            index=models.Index(
+                condition=models.Q(('date_to__isnull', True)),
+                fields=['-id'],
+                name='coach_current_idx',
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='administrator',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('date_to__isnull', True)),
+                fields=('user',),
+                name='administrator_unique_current_user',
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='athlete',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('date_to__isnull', True)),
+                fields=('user',),
+                name='athlete_unique_current_user',
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='coach',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('date_to__isnull', True)),
+                fields=('user',),
+                name='coach_unique_current_user',
+            ),
+        ),
+    ]
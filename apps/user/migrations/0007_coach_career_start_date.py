@@ -0,0 +1,21 @@
+# Generated by Django 5.1.6 on 2026-10-18 09:25
+
+import apps.user.models.utils
+import django.db.models.expressions
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0006_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='coach',
+            name='career_start_date',
+            field=models.GeneratedField(db_index=True, db_persist=True, expression=django.db.models.functions.comparison.Cast(django.db.models.expressions.CombinedExpression(models.F('date_from'), '-', apps.user.models.utils.YearsInterval('coach_experience')), output_field=models.DateField()), output_field=models.DateField(), verbose_name='Дата начала тренерской карьеры'),
+        ),
+    ]
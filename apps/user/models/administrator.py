@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Q
 
 from apps.user.models.managers import AdministratorManager
 
@@ -27,6 +28,14 @@ class Administrator(models.Model):
     class Meta:
         verbose_name = 'Администратор'
         verbose_name_plural = 'Администраторы'
+        constraints = [
+            # У пользователя может быть только одна действующая роль
+            models.UniqueConstraint(
+                fields=['user'],
+                condition=Q(date_to__isnull=True),
+                name='administrator_unique_current_user',
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.user.full_name
@@ -1,10 +1,12 @@
 from common.choices import PlayingLevel
+from common.mixins import UpdatedAtModelMixin
 from django.db import models
+from django.db.models import Q
 
 from apps.user.models.managers import AthleteManager
 
 
-class Athlete(models.Model):
+class Athlete(UpdatedAtModelMixin, models.Model):
     """Модель спортсмена."""
 
     objects = AthleteManager()
@@ -36,10 +38,30 @@ class Athlete(models.Model):
         verbose_name='Уровень',
         choices=PlayingLevel.choices,
     )
+    updated_at = models.DateTimeField(
+        verbose_name='Дата и время изменения',
+        auto_now=True,
+    )
 
     class Meta:
         verbose_name = 'Спортсмен'
         verbose_name_plural = 'Спортсмены'
+        constraints = [
+            # У пользователя может быть только одна действующая роль
+            models.UniqueConstraint(
+                fields=['user'],
+                condition=Q(date_to__isnull=True),
+                name='athlete_unique_current_user',
+            ),
+        ]
+        indexes = [
+            # Частичный индекс для списка действующих ролей
+            models.Index(
+                fields=['-id'],
+                condition=Q(date_to__isnull=True),
+                name='athlete_current_idx',
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.user.full_name
@@ -1,13 +1,16 @@
-from dateutil.relativedelta import relativedelta
+from common.mixins import UpdatedAtModelMixin
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models import F, Q
+from django.db.models.functions import Cast
 from django.utils.timezone import now
 
 from apps.user.models.choices import CoachPosition, JudgeCategory
 from apps.user.models.managers import CoachManager
+from apps.user.models.utils import YearsInterval, get_full_years
 
 
-class Coach(models.Model):
+class Coach(UpdatedAtModelMixin, models.Model):
     """Модель роли тренера."""
 
     objects = CoachManager()
@@ -35,6 +38,19 @@ class Coach(models.Model):
         validators=[MinValueValidator(0), MaxValueValidator(99)],
         default=0,
     )
+    # Дата, от которой отсчитывается общий тренерский стаж. Хранится
+    # в индексе, поэтому сортировка и фильтрация по стажу не требуют
+    # вычисления стажа для каждой записи
+    career_start_date = models.GeneratedField(
+        verbose_name='Дата начала тренерской карьеры',
+        expression=Cast(
+            F('date_from') - YearsInterval('coach_experience'),
+            output_field=models.DateField(),
+        ),
+        output_field=models.DateField(),
+        db_persist=True,
+        db_index=True,
+    )
 
     position = models.CharField(
         verbose_name='Должность',
@@ -65,19 +81,61 @@ class Coach(models.Model):
         blank=True,
         null=True,
     )
+    updated_at = models.DateTimeField(
+        verbose_name='Дата и время изменения',
+        auto_now=True,
+    )
 
     class Meta:
         verbose_name = 'Тренер'
         verbose_name_plural = 'Тренеры'
+        constraints = [
+            # У пользователя может быть только одна действующая роль
+            models.UniqueConstraint(
+                fields=['user'],
+                condition=Q(date_to__isnull=True),
+                name='coach_unique_current_user',
+            ),
+        ]
+        indexes = [
+            # Частичный индекс для списка действующих ролей
+            models.Index(
+                fields=['-id'],
+                condition=Q(date_to__isnull=True),
+                name='coach_current_idx',
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.user.full_name
 
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+
+        # Дата начала карьеры вычисляется на стороне БД. При создании
+        # записи она возвращается через RETURNING, а после обновления
+        # сбрасывается и будет перечитана из БД при первом обращении
+        if not adding:
+            self.__dict__.pop('career_start_date', None)
+
     @property
     def current_coach_experience(self) -> int:
-        """Расчет общего тренерского стажа."""
+        """
+        Общий тренерский стаж (полных лет).
+
+        Берется из аннотации CoachQuerySet.with_current_coach_experience_
+        annotation, если запись выбрана с ней, иначе вычисляется по дате
+        начала карьеры.
+        """
+
+        experience = getattr(self, '_current_coach_experience', None)
+        if experience is None:
+            experience = get_full_years(self.career_start_date, now().date())
 
-        today = now().date()
-        delta = relativedelta(today, self.date_from)
+        return experience
 
-        return delta.years + self.coach_experience
+    @current_coach_experience.setter
+    def current_coach_experience(self, value: int) -> None:
+        # Значение аннотации кверисета
+        self._current_coach_experience = value
@@ -1,19 +1,35 @@
-from common.managers import UserFullNameAnnotationMixin
-from django.contrib.auth.base_user import BaseUserManager
-from django.db.models import (
-    ExpressionWrapper,
-    F,
-    IntegerField,
-    QuerySet,
+from common.managers import (
+    UpdatedAtQuerySetMixin,
+    UserFullNameAnnotationMixin,
 )
+from dateutil.relativedelta import relativedelta
+from django.contrib.auth.base_user import BaseUserManager
+from django.db.models import F, QuerySet
 from django.utils.timezone import now
 
+from apps.user.cache import auth_user_cache
 from apps.user.models.utils import YearsBetween
 
 
-class UserQuerySet(QuerySet, UserFullNameAnnotationMixin):
+class UserQuerySet(
+    UpdatedAtQuerySetMixin, QuerySet, UserFullNameAnnotationMixin
+):
     user_field_name = None
 
+    # Поля, при изменении которых сбрасывается кеш пользователей
+    # для аутентификации
+    auth_cache_fields = frozenset({'is_active', 'password'})
+
+    def update(self, **kwargs):
+        if self.auth_cache_fields.isdisjoint(kwargs):
+            return super().update(**kwargs)
+
+        user_ids = list(self.values_list('pk', flat=True))
+        result = super().update(**kwargs)
+        auth_user_cache.invalidate(*user_ids)
+
+        return result
+
 
 class UserManager(BaseUserManager):
     """Менеджер для модели пользователя."""
@@ -67,20 +83,39 @@ class AdministratorManager(BaseUserManager):
         )
 
 
-class CoachQuerySet(QuerySet, UserFullNameAnnotationMixin):
+class CoachQuerySet(
+    UpdatedAtQuerySetMixin, QuerySet, UserFullNameAnnotationMixin
+):
     user_field_name = 'user'
 
-    def with_all_coach_experience_annotation(self):
-        """Добавляет на уровне SQL аннотацию с общим тренерским стажем."""
+    def with_current_coach_experience_annotation(self):
+        """
+        Добавляет на уровне SQL аннотацию с общим тренерским стажем.
+
+        Стаж считается от хранимой даты начала карьеры. Значение
+        аннотации возвращает свойство Coach.current_coach_experience.
+        """
 
         return self.annotate(
-            all_coach_experience=ExpressionWrapper(
-                YearsBetween(now().date(), F('date_from'))
-                + F('coach_experience'),
-                output_field=IntegerField(),
+            current_coach_experience=YearsBetween(
+                now().date(), F('career_start_date')
             )
         )
 
+    def with_min_coach_experience(self, years: int):
+        """Тренеры с общим стажем не менее years полных лет."""
+
+        return self.filter(
+            career_start_date__lte=now().date() - relativedelta(years=years)
+        )
+
+    def with_max_coach_experience(self, years: int):
+        """Тренеры с общим стажем не более years полных лет."""
+
+        return self.filter(
+            career_start_date__gt=now().date() - relativedelta(years=years + 1)
+        )
+
 
 class CoachManager(BaseUserManager):
     """Менеджер для модели тренера."""
@@ -95,7 +130,9 @@ class CoachManager(BaseUserManager):
         )
 
 
-class AthleteQuerySet(QuerySet, UserFullNameAnnotationMixin):
+class AthleteQuerySet(
+    UpdatedAtQuerySetMixin, QuerySet, UserFullNameAnnotationMixin
+):
     user_field_name = 'user'
 
 
@@ -1,12 +1,16 @@
+from common.mixins import UpdatedAtModelMixin
+from common.utils import get_full_name_expression
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
-from django.utils.functional import cached_property
+from django.db.models.functions import Upper
 
+from apps.user.cache import auth_user_cache
 from apps.user.models.choices import GenderType
 from apps.user.models.managers import UserManager
 
 
-class User(AbstractBaseUser, PermissionsMixin):
+class User(UpdatedAtModelMixin, AbstractBaseUser, PermissionsMixin):
     """Модель пользователя системы."""
 
     objects = UserManager()
@@ -32,6 +36,13 @@ class User(AbstractBaseUser, PermissionsMixin):
         blank=True,
         db_index=True,
     )
+    full_name = models.GeneratedField(
+        verbose_name='ФИО',
+        expression=get_full_name_expression(),
+        output_field=models.CharField(max_length=152),
+        db_persist=True,
+        db_index=True,
+    )
     date_of_birth = models.DateField(
         verbose_name='Дата рождения',
     )
@@ -56,25 +67,47 @@ class User(AbstractBaseUser, PermissionsMixin):
     created_at = models.DateTimeField(
         verbose_name='Дата и время регистрации',
         auto_now_add=True,
+        db_index=True,
+    )
+    updated_at = models.DateTimeField(
+        verbose_name='Дата и время изменения',
+        auto_now=True,
     )
     is_active = models.BooleanField(verbose_name='Активен', default=True)
 
     class Meta:
         verbose_name = 'Пользователь'
         verbose_name_plural = 'Пользователи'
+        indexes = [
+            # Триграммный индекс для поиска по подстроке ФИО (icontains)
+            GinIndex(
+                OpClass(Upper('full_name'), name='gin_trgm_ops'),
+                name='user_full_name_trgm_idx',
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.full_name
 
-    @cached_property
-    def full_name(self) -> str:
-        """Возвращает ФИО пользователя."""
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+
+        # ФИО вычисляется на стороне БД. При создании записи оно
+        # возвращается через RETURNING, а после обновления сбрасывается
+        # и будет перечитано из БД при первом обращении
+        if not adding:
+            self.__dict__.pop('full_name', None)
+
+        # Сброс кеша пользователя для аутентификации
+        auth_user_cache.invalidate(self.pk)
 
-        full_name = (
-            f'{self.last_name} {self.first_name} {self.patronymic or ""}'
-        )
+    def delete(self, *args, **kwargs):
+        pk = self.pk
+        result = super().delete(*args, **kwargs)
+        auth_user_cache.invalidate(pk)
 
-        return full_name.strip()
+        return result
 
     @property
     def is_staff(self) -> bool:
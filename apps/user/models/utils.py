@@ -1,4 +1,6 @@
-from django.db.models import Func, IntegerField
+import datetime
+
+from django.db.models import DurationField, Func, IntegerField
 
 
 class YearsBetween(Func):
@@ -10,3 +12,25 @@ class YearsBetween(Func):
     function = 'DATE_PART'
     template = "%(function)s('year', AGE(%(expressions)s))::int"
     output_field = IntegerField()
+
+
+class YearsInterval(Func):
+    """Интервал в заданное кол-во лет на уровне SQL."""
+
+    function = 'MAKE_INTERVAL'
+    template = '%(function)s(years => %(expressions)s)'
+    output_field = DurationField()
+
+
+def get_full_years(date_from: datetime.date, date_to: datetime.date) -> int:
+    """
+    Подсчет кол-ва полных лет между датами.
+
+    Совпадает с YearsBetween на уровне SQL.
+    """
+
+    return (
+        date_to.year
+        - date_from.year
+        - ((date_to.month, date_to.day) < (date_from.month, date_from.day))
+    )
@@ -9,12 +9,17 @@ from .administrator.administrator_with_user_create import (
 # Сервисы спортсменов
 from .athlete.athlete_cancel import AthleteCancelService
 from .athlete.athlete_with_user_create import AthleteWithUserCreateService
+from .athlete.athletes_with_users_import import (
+    AthletesWithUsersImportService,
+)
 
 # Сервисы тренеров
 from .coach.coach_cancel import CoachCancelService
 from .coach.coach_with_user_create import CoachWithUserCreateService
+from .coach.coaches_with_users_import import CoachesWithUsersImportService
 
 # Сервисы пользователей
 from .user.user_appoint_administrator import UserAppointAdministratorService
 from .user.user_appoint_athlete import UserAppointAthleteService
 from .user.user_appoint_coach import UserAppointCoachService
+from .user.users_with_roles_import import UsersWithRolesImportService
@@ -1,3 +1,4 @@
+from django.db import transaction
 from django.utils.timezone import now
 from rest_framework.exceptions import ValidationError
 
@@ -17,7 +18,11 @@ class AthleteCancelService:
     def execute(self) -> Athlete:
         self._validate()
 
-        return self._cancel_athlete()
+        with transaction.atomic():
+            # Количество спортсменов в группах пересчитывается при
+            # сохранении даты окончания роли (см. сигналы training_process)
+            self._lock_groups()
+            return self._cancel_athlete()
 
     def _validate(self) -> None:
         """Валидация."""
@@ -32,6 +37,19 @@ class AthleteCancelService:
                 'Роль данного спортсмена уже не является действующей'
             )
 
+    def _lock_groups(self) -> list[int]:
+        """
+        Блокировка групп спортсмена на время окончания действия роли.
+
+        :return: Идентификаторы групп спортсмена.
+        """
+
+        return list(
+            self._athlete.groups.select_for_update(of=('self',))
+            .order_by('pk')
+            .values_list('pk', flat=True)
+        )
+
     def _cancel_athlete(self) -> Athlete:
         """
         Обновление объекта в таблице спортсменов - в поле date_to
@@ -0,0 +1,15 @@
+from apps.user.api.serializers import AppointAthleteSerializer
+from apps.user.models import Athlete
+from apps.user.services.user.users_with_roles_import import (
+    UsersWithRolesImportService,
+)
+
+
+class AthletesWithUsersImportService(UsersWithRolesImportService):
+    """
+    Сервис импорта ролей спортсменов
+    вместе с новыми для системы пользователями из CSV-файла.
+    """
+
+    role_model = Athlete
+    role_serializer_class = AppointAthleteSerializer
@@ -0,0 +1,15 @@
+from apps.user.api.serializers import AppointCoachSerializer
+from apps.user.models import Coach
+from apps.user.services.user.users_with_roles_import import (
+    UsersWithRolesImportService,
+)
+
+
+class CoachesWithUsersImportService(UsersWithRolesImportService):
+    """
+    Сервис импорта ролей тренеров
+    вместе с новыми для системы пользователями из CSV-файла.
+    """
+
+    role_model = Coach
+    role_serializer_class = AppointCoachSerializer
@@ -1,8 +1,13 @@
+from common.utils import get_violated_constraint
+from django.db import IntegrityError, transaction
 from django.utils.timezone import now
 from rest_framework.exceptions import ValidationError
 
 from apps.user.models import Administrator, User
 
+# Ограничение, запрещающее пользователю вторую действующую роль
+UNIQUE_CURRENT_CONSTRAINT = 'administrator_unique_current_user'
+
 
 class UserAppointAdministratorService:
     """Сервис назначения пользователю роли администратора."""
@@ -15,33 +20,27 @@ class UserAppointAdministratorService:
         self._user = user
 
     def execute(self) -> Administrator:
-        self._validate()
-
         return self._create_administrator()
 
-    def _validate(self) -> None:
-        """Валидация."""
-
-        self._validate_administrator_already_exists()
-
-    def _validate_administrator_already_exists(self) -> None:
+    def _create_administrator(self) -> Administrator:
         """
-        Проверка на существование у пользователя
-        действующей роли администратора.
+        Создание сущности администратора.
+
+        Наличие у пользователя действующей роли администратора проверяет
+        уникальное частичное ограничение в базе данных, поэтому отдельный
+        запрос на проверку не выполняется.
         """
 
-        administrator = Administrator.objects.filter(
-            user=self._user, date_to__isnull=True
-        ).exists()
-        if administrator:
+        try:
+            with transaction.atomic():
+                return Administrator.objects.create(
+                    user=self._user,
+                    date_from=now().date(),
+                )
+        except IntegrityError as exc:
+            # Остальные нарушения целостности не связаны с ролью
+            if get_violated_constraint(exc) != UNIQUE_CURRENT_CONSTRAINT:
+                raise
             raise ValidationError(
                 'У пользователя уже есть действующая роль администратора'
-            )
-
-    def _create_administrator(self) -> Administrator:
-        """Создание сущности администратора."""
-
-        return Administrator.objects.create(
-            user=self._user,
-            date_from=now().date(),
-        )
+            ) from exc
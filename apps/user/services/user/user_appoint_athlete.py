@@ -1,9 +1,14 @@
 from common.choices import PlayingLevel
+from common.utils import get_violated_constraint
+from django.db import IntegrityError, transaction
 from django.utils.timezone import now
 from rest_framework.exceptions import ValidationError
 
 from apps.user.models import Athlete, User
 
+# Ограничение, запрещающее пользователю вторую действующую роль
+UNIQUE_CURRENT_CONSTRAINT = 'athlete_unique_current_user'
+
 
 class UserAppointAthleteService:
     """Сервис назначения пользователю роли спортсмена."""
@@ -18,34 +23,28 @@ class UserAppointAthleteService:
         self._playing_level = playing_level
 
     def execute(self) -> Athlete:
-        self._validate()
-
         return self._create_athlete()
 
-    def _validate(self) -> None:
-        """Валидация."""
-
-        self._validate_athlete_already_exists()
-
-    def _validate_athlete_already_exists(self) -> None:
+    def _create_athlete(self) -> Athlete:
         """
-        Проверка на существование у пользователя
-        действующей роли спортсмена.
+        Создание сущности спортсмена.
+
+        Наличие у пользователя действующей роли спортсмена проверяет
+        уникальное частичное ограничение в базе данных, поэтому отдельный
+        запрос на проверку не выполняется.
         """
 
-        athlete = Athlete.objects.filter(
-            user=self._user, date_to__isnull=True
-        ).exists()
-        if athlete:
+        try:
+            with transaction.atomic():
+                return Athlete.objects.create(
+                    user=self._user,
+                    date_from=now().date(),
+                    playing_level=self._playing_level,
+                )
+        except IntegrityError as exc:
+            # Остальные нарушения целостности не связаны с ролью
+            if get_violated_constraint(exc) != UNIQUE_CURRENT_CONSTRAINT:
+                raise
             raise ValidationError(
                 'У пользователя уже есть действующая роль спортсмена'
-            )
-
-    def _create_athlete(self) -> Athlete:
-        """Создание сущности спортсмена."""
-
-        return Athlete.objects.create(
-            user=self._user,
-            date_from=now().date(),
-            playing_level=self._playing_level,
-        )
+            ) from exc
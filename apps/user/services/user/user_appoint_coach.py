@@ -1,10 +1,15 @@
 from typing import Any
 
+from common.utils import get_violated_constraint
+from django.db import IntegrityError, transaction
 from django.utils.timezone import now
 from rest_framework.exceptions import ValidationError
 
 from apps.user.models import Coach, User
 
+# Ограничение, запрещающее пользователю вторую действующую роль
+UNIQUE_CURRENT_CONSTRAINT = 'coach_unique_current_user'
+
 
 class UserAppointCoachService:
     """Сервис назначения пользователю роли тренера."""
@@ -19,34 +24,28 @@ class UserAppointCoachService:
         self._data = data
 
     def execute(self) -> Coach:
-        self._validate()
-
         return self._create_coach()
 
-    def _validate(self) -> None:
-        """Валидация."""
-
-        self._validate_coach_already_exists()
-
-    def _validate_coach_already_exists(self) -> None:
+    def _create_coach(self) -> Coach:
         """
-        Проверка на существование у пользователя
-        действующей роли тренера.
+        Создание сущности тренера.
+
+        Наличие у пользователя действующей роли тренера проверяет
+        уникальное частичное ограничение в базе данных, поэтому отдельный
+        запрос на проверку не выполняется.
         """
 
-        coach = Coach.objects.filter(
-            user=self._user, date_to__isnull=True
-        ).exists()
-        if coach:
+        try:
+            with transaction.atomic():
+                return Coach.objects.create(
+                    user=self._user,
+                    date_from=now().date(),
+                    **self._data,
+                )
+        except IntegrityError as exc:
+            # Остальные нарушения целостности не связаны с ролью
+            if get_violated_constraint(exc) != UNIQUE_CURRENT_CONSTRAINT:
+                raise
             raise ValidationError(
                 'У пользователя уже есть действующая роль тренера'
-            )
-
-    def _create_coach(self) -> Coach:
-        """Создание сущности тренера."""
-
-        return Coach.objects.create(
-            user=self._user,
-            date_from=now().date(),
-            **self._data,
-        )
+            ) from exc
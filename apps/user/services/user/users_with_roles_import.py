@@ -0,0 +1,236 @@
+import csv
+from typing import Any, TextIO
+
+from common.utils import get_violated_constraint
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Model
+from django.utils.timezone import now
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from apps.user.api.serializers import UserImportSerializer
+from apps.user.models import User
+
+# Количество строк в одном INSERT
+BATCH_SIZE = 1000
+# Ограничение уникальности адреса электронной почты пользователя
+UNIQUE_EMAIL_CONSTRAINT = 'user_user_email_key'
+
+
+class UsersWithRolesImportService:
+    """
+    Базовый сервис импорта ролей вместе с новыми для системы
+    пользователями из CSV-файла.
+
+    Файл читается построчно. Данные пользователя проверяются по правилам
+    создания пользователя вместе с ролью, данные роли - по правилам
+    назначения роли. Адреса электронной почты проверяются на повторы
+    в файле и одним запросом на совпадение с существующими.
+
+    Если ошибок нет, пользователи и роли создаются одной транзакцией
+    пакетными INSERT. Пароли не хешируются: пользователям назначается
+    непригодный для входа пароль, который они меняют при восстановлении
+    доступа. Если в файле есть ошибки, ничего не создается. Адрес,
+    занятый другим пользователем между проверкой и вставкой, тоже
+    возвращается ошибкой строки.
+    """
+
+    # Модель роли
+    role_model: type[Model]
+    # Сериализатор данных роли
+    role_serializer_class: type[serializers.ModelSerializer]
+
+    def __init__(self, csv_file: TextIO) -> None:
+        """
+        :param csv_file: Текстовый файл с заголовком в первой строке.
+        """
+
+        self._csv_file = csv_file
+        self._user_fields = set(UserImportSerializer().fields)
+        self._role_fields = set(self.role_serializer_class().fields)
+
+    def execute(self) -> dict[str, Any]:
+        """
+        Импорт пользователей с ролями.
+
+        :return: Отчет: количество созданных ролей и ошибки строк
+            с номерами строк файла.
+        :raises ValidationError: Файл не удалось прочитать.
+        """
+
+        try:
+            return self._import()
+        except (UnicodeDecodeError, csv.Error) as exc:
+            raise ValidationError(
+                {'file': [f'Файл не удалось прочитать как CSV в UTF-8: {exc}']}
+            ) from exc
+
+    def _import(self) -> dict[str, Any]:
+        reader = csv.DictReader(self._csv_file)
+        header_errors = self._validate_columns(reader.fieldnames or [])
+        if header_errors:
+            return self._get_report(0, {1: header_errors})
+
+        rows = []
+        # Ошибки по номеру строки
+        errors = {}
+        # Номер строки по адресу электронной почты
+        email_lines = {}
+        for row in reader:
+            if len(rows) >= settings.USERS_IMPORT_MAX_ROWS:
+                errors[reader.line_num] = {
+                    'non_field_errors': [
+                        'Превышено максимальное количество строк: '
+                        f'{settings.USERS_IMPORT_MAX_ROWS}'
+                    ]
+                }
+                break
+
+            user_data, role_data, row_errors = self._validate_row(row)
+            # Повторы адресов проверяются и для строк с ошибками
+            email = (row.get('email') or '').strip()
+            if email in email_lines:
+                row_errors.setdefault('email', []).append(
+                    f'Адрес повторяется в строке {email_lines[email]}'
+                )
+            elif email:
+                email_lines[email] = reader.line_num
+
+            if row_errors:
+                errors[reader.line_num] = row_errors
+            rows.append((user_data, role_data))
+
+        self._add_existing_email_errors(errors, email_lines)
+        if errors:
+            return self._get_report(0, errors)
+
+        try:
+            roles = self._create(rows)
+        except IntegrityError as exc:
+            # Адрес занял пользователь, созданный после проверки адресов
+            if get_violated_constraint(exc) != UNIQUE_EMAIL_CONSTRAINT:
+                raise
+            self._add_existing_email_errors(errors, email_lines)
+            return self._get_report(0, errors)
+
+        return self._get_report(len(roles), {})
+
+    def _validate_columns(self, columns: list[str]) -> dict:
+        """
+        Проверка заголовка файла: все столбцы известны, обязательные
+        столбцы есть.
+
+        :return: Ошибки заголовка.
+        """
+
+        known = self._user_fields | self._role_fields
+        required = {
+            name
+            for serializer_class in (
+                UserImportSerializer,
+                self.role_serializer_class,
+            )
+            for name, field in serializer_class().fields.items()
+            if field.required
+        }
+        messages = []
+        if unknown := [column for column in columns if column not in known]:
+            messages.append(f'Неизвестные столбцы: {", ".join(unknown)}')
+        if missing := sorted(required - set(columns)):
+            messages.append(f'Нет обязательных столбцов: {", ".join(missing)}')
+
+        return {'non_field_errors': messages} if messages else {}
+
+    def _validate_row(self, row: dict) -> tuple[dict, dict, dict]:
+        """
+        Проверка строки файла.
+
+        Пустые значения считаются незаполненными.
+
+        :return: Проверенные данные пользователя, данные роли и ошибки
+            по столбцам.
+        """
+
+        # Значения сверх заголовка попадают под ключ None
+        if row.get(None):
+            return {}, {}, {'non_field_errors': ['Лишние значения в строке']}
+
+        data = {
+            name: value.strip()
+            for name, value in row.items()
+            if value and value.strip()
+        }
+        user_serializer = UserImportSerializer(
+            data={
+                name: value
+                for name, value in data.items()
+                if name in self._user_fields
+            }
+        )
+        role_serializer = self.role_serializer_class(
+            data={
+                name: value
+                for name, value in data.items()
+                if name in self._role_fields
+            }
+        )
+        errors = {}
+        for serializer in (user_serializer, role_serializer):
+            if not serializer.is_valid():
+                errors.update(serializer.errors)
+
+        return (
+            dict(user_serializer.validated_data),
+            dict(role_serializer.validated_data),
+            errors,
+        )
+
+    @staticmethod
+    def _add_existing_email_errors(
+        errors: dict[int, dict], email_lines: dict[str, int]
+    ) -> None:
+        """
+        Добавление ошибок строк с адресами, уже занятыми пользователями.
+        Адреса проверяются одним запросом.
+        """
+
+        existing_emails = User.objects.filter(
+            email__in=email_lines
+        ).values_list('email', flat=True)
+        for email in existing_emails:
+            errors.setdefault(email_lines[email], {}).setdefault(
+                'email', []
+            ).append(
+                'Пользователь с таким адресом электронной почты уже существует'
+            )
+
+    @transaction.atomic
+    def _create(self, rows: list[tuple[dict, dict]]) -> list[Model]:
+        """Создание пользователей и ролей пакетными INSERT."""
+
+        users = []
+        for user_data, _ in rows:
+            user = User(**user_data)
+            user.set_unusable_password()
+            users.append(user)
+        User.objects.bulk_create(users, batch_size=BATCH_SIZE)
+
+        today = now().date()
+        return self.role_model.objects.bulk_create(
+            [
+                self.role_model(user=user, date_from=today, **role_data)
+                for user, (_, role_data) in zip(users, rows, strict=True)
+            ],
+            batch_size=BATCH_SIZE,
+        )
+
+    @staticmethod
+    def _get_report(created: int, errors: dict[int, dict]) -> dict[str, Any]:
+        return {
+            'created': created,
+            'errors': [
+                {'line': line, 'errors': errors[line]}
+                for line in sorted(errors)
+            ],
+        }
@@ -0,0 +1,120 @@
+"""
+Бенчмарк пула соединений с БД.
+
+Сравнивает количество запросов в секунду к API с пулом соединений
+psycopg 3 и без него (новое соединение с БД на каждый запрос).
+Каждый режим запускается в отдельном процессе, так как настройки БД
+читаются при старте Django. Нужна БД с хотя бы одним пользователем.
+
+Запуск: python benchmarks/db_pool.py --requests 1000 --concurrency 4
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def run_mode(requests_count: int, concurrency: int) -> float:
+    """
+    Замер в текущем процессе.
+
+    :return: Количество запросов в секунду.
+    """
+
+    import django
+
+    sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'configs.settings')
+    django.setup()
+
+    from apps.user.models import User
+    from django.test import Client
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    user = User.objects.order_by('pk').first()
+    if user is None:
+        raise SystemExit('В БД нет пользователей')
+    authorization = f'Bearer {AccessToken.for_user(user)}'
+    # Легкий запрос, чтобы время открытия соединения было заметно
+    url = f'/api/users/{user.pk}/'
+
+    per_thread = requests_count // concurrency
+    errors = []
+
+    def worker():
+        client = Client(HTTP_AUTHORIZATION=authorization)
+        for _ in range(per_thread):
+            response = client.get(url)
+            if response.status_code != 200:
+                errors.append(response.status_code)
+
+    # Прогрев: кеш пользователя, импорт модулей, соединения пула
+    Client(HTTP_AUTHORIZATION=authorization).get(url)
+
+    worker_threads = [
+        threading.Thread(target=worker) for _ in range(concurrency)
+    ]
+    started = time.perf_counter()
+    for thread in worker_threads:
+        thread.start()
+    for thread in worker_threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    if errors:
+        raise SystemExit(f'Ошибочные ответы: {sorted(set(errors))}')
+    return per_thread * concurrency / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--mode', choices=['pool', 'no-pool'])
+    args = parser.parse_args()
+
+    if args.mode:
+        print(run_mode(args.requests, args.concurrency))  # noqa: T201
+        return
+
+    results = {}
+    for mode in ('no-pool', 'pool'):
+        env = {
+            **os.environ,
+            'DB_POOL_ENABLED': str(mode == 'pool'),
+            'DB_CONN_MAX_AGE': '0',
+            'DEBUG': '',
+        }
+        output = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                '--mode',
+                mode,
+                '--requests',
+                str(args.requests),
+                '--concurrency',
+                str(args.concurrency),
+            ],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        results[mode] = float(output.strip().splitlines()[-1])
+
+    for mode, rps in results.items():
+        print(f'{mode:>8}: {rps:8.1f} запросов/с')  # noqa: T201
+    print(  # noqa: T201
+        f'Ускорение: x{results["pool"] / results["no-pool"]:.2f}'
+    )
+
+
+if __name__ == '__main__':
+    main()
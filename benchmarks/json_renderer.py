@@ -0,0 +1,91 @@
+"""
+Бенчмарк рендерера JSON.
+
+Сравнивает время рендеринга данных сериализаторов стандартным
+JSONRenderer и ORJSONRenderer. Данные берутся из БД, как для страницы
+списка в API, поэтому нужна БД с пользователями (например, после
+наполнения тестовыми данными).
+
+Запуск: python benchmarks/json_renderer.py --rows 1000 --repeat 50
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def measure(renderer, data, repeat: int) -> float:
+    """
+    Замер времени рендеринга.
+
+    :return: Среднее время рендеринга в миллисекундах.
+    """
+
+    renderer.render(data)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        renderer.render(data)
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    import django
+
+    sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'configs.settings')
+    django.setup()
+
+    from apps.training_process.api.serializers import (
+        GroupApplicationSerializer,
+    )
+    from apps.training_process.models import GroupApplication
+    from apps.user.api.serializers import CoachSerializer, UserSerializer
+    from apps.user.models import Coach, User
+    from common.renderers import ORJSONRenderer
+    from rest_framework.renderers import JSONRenderer
+
+    datasets = {
+        'users': UserSerializer(
+            User.objects.order_by('-id')[: args.rows], many=True
+        ).data,
+        'coaches': CoachSerializer(
+            Coach.objects.select_related('user').order_by('-id')[: args.rows],
+            many=True,
+        ).data,
+        'group-applications': GroupApplicationSerializer(
+            GroupApplication.objects.select_related(
+                'user', 'group__coach__user'
+            ).order_by('-id')[: args.rows],
+            many=True,
+        ).data,
+    }
+
+    for name, data in datasets.items():
+        if not data:
+            print(f'{name}: нет данных')  # noqa: T201
+            continue
+
+        json_renderer, orjson_renderer = JSONRenderer(), ORJSONRenderer()
+        if json_renderer.render(data) != orjson_renderer.render(data):
+            raise SystemExit(f'{name}: результаты рендереров различаются')
+
+        json_time = measure(json_renderer, data, args.repeat)
+        orjson_time = measure(orjson_renderer, data, args.repeat)
+        print(  # noqa: T201
+            f'{name} ({len(data)} строк): json {json_time:.2f} мс, '
+            f'orjson {orjson_time:.2f} мс, '
+            f'ускорение x{json_time / orjson_time:.2f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
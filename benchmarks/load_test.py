@@ -0,0 +1,481 @@
+"""
+Нагрузочный тест API со смешанным профилем запросов.
+
+Запускает заданное количество потоков, каждый из которых выполняет
+сценарии с заданными весами против запущенного экземпляра TCMS:
+- token_obtain - получение пары токенов;
+- token_refresh - обновление токена доступа;
+- group_catalog - просмотр каталога групп (страницы списка, фильтр
+  по свободным местам, детальный просмотр группы);
+- user_search - поиск пользователей по full_name;
+- coach_list - список тренеров с сортировкой по all_coach_experience;
+- application_approve - подача заявки в группу и ее одобрение.
+
+По каждому эндпоинту выводятся количество запросов, ошибки,
+пропускная способность и задержки p50/p95/p99, что позволяет подбирать
+количество воркеров gunicorn под ожидаемую нагрузку.
+
+Пользователь для теста создается в локальной БД из настроек проекта
+(если не переданы --email и --password). Заявки подаются от его имени
+в одну группу со свободными местами, поэтому после первого одобрения
+заполненность группы не меняется.
+
+Запуск: python benchmarks/load_test.py --base-url http://127.0.0.1:8000
+    --concurrency 8 --duration 60
+Профиль: --mix group_catalog=10,application_approve=0
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import secrets
+import sys
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode, urlsplit
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# Веса сценариев по умолчанию
+DEFAULT_MIX = {
+    'token_obtain': 1,
+    'token_refresh': 2,
+    'group_catalog': 10,
+    'user_search': 5,
+    'coach_list': 4,
+    'application_approve': 1,
+}
+
+# Префиксы ФИО для поиска пользователей
+SEARCH_QUERIES = ['ова', 'Ив', 'Мар', 'Смирн', 'Анна', 'евна']
+
+LOAD_TEST_EMAIL = 'loadtest@example.com'
+
+# Размер страницы списков API (PAGE_SIZE)
+PAGE_SIZE = 20
+
+
+class Stats:
+    """Потокобезопасный сбор задержек и ошибок по эндпоинтам."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.recording = False
+
+    def add(self, endpoint: str, latency: float, ok: bool) -> None:
+        if not self.recording:
+            return
+        with self._lock:
+            self.latencies[endpoint].append(latency)
+            if not ok:
+                self.errors[endpoint] += 1
+
+    def report(self, duration: float) -> dict[str, dict[str, Any]]:
+        """Статистика по эндпоинтам и в целом (задержки в мс)."""
+
+        def summarize(latencies: list[float], errors: int) -> dict:
+            latencies = sorted(latencies)
+            return {
+                'requests': len(latencies),
+                'errors': errors,
+                'rps': round(len(latencies) / duration, 2),
+                'p50_ms': percentile(latencies, 50),
+                'p95_ms': percentile(latencies, 95),
+                'p99_ms': percentile(latencies, 99),
+                'max_ms': round(latencies[-1] * 1000, 2) if latencies else 0,
+            }
+
+        report = {
+            endpoint: summarize(latencies, self.errors[endpoint])
+            for endpoint, latencies in sorted(self.latencies.items())
+        }
+        report['total'] = summarize(
+            [value for values in self.latencies.values() for value in values],
+            sum(self.errors.values()),
+        )
+
+        return report
+
+
+def percentile(sorted_values: list[float], percent: float) -> float:
+    """Перцентиль по методу ближайшего ранга в миллисекундах."""
+
+    if not sorted_values:
+        return 0.0
+    rank = max(int(len(sorted_values) * percent / 100 + 0.5), 1)
+    return round(sorted_values[min(rank, len(sorted_values)) - 1] * 1000, 2)
+
+
+class Client:
+    """
+    HTTP-клиент потока нагрузки.
+
+    Использует одно постоянное соединение (keep-alive) и хранит токены
+    пользователя.
+    """
+
+    def __init__(
+        self, base_url: str, stats: Stats, email: str, password: str
+    ) -> None:
+        parts = urlsplit(base_url)
+        connection_class = (
+            http.client.HTTPSConnection
+            if parts.scheme == 'https'
+            else http.client.HTTPConnection
+        )
+        self._connect = lambda: connection_class(
+            parts.hostname, parts.port, timeout=30
+        )
+        self._connection = self._connect()
+        self._prefix = parts.path.rstrip('/')
+        self._stats = stats
+        self.email = email
+        self.password = password
+        self.access: str | None = None
+        self.refresh: str | None = None
+
+    def request(
+        self,
+        endpoint: str,
+        method: str,
+        path: str,
+        params: dict | None = None,
+        data: dict | None = None,
+        auth: bool = True,
+    ) -> tuple[int, Any]:
+        """
+        Выполнение запроса с записью задержки.
+
+        :param endpoint: Имя эндпоинта в статистике.
+        :return: Код ответа и разобранный JSON (или None).
+        """
+
+        url = f'{self._prefix}{path}'
+        if params:
+            url = f'{url}?{urlencode(params)}'
+        headers = {'Accept': 'application/json'}
+        body = None
+        if data is not None:
+            body = json.dumps(data).encode()
+            headers['Content-Type'] = 'application/json'
+        if auth and self.access:
+            headers['Authorization'] = f'Bearer {self.access}'
+
+        started = time.perf_counter()
+        try:
+            self._connection.request(method, url, body=body, headers=headers)
+            response = self._connection.getresponse()
+            content = response.read()
+        except (OSError, http.client.HTTPException):
+            # Соединение закрыто сервером (например, при перезапуске
+            # воркера) - открывается новое
+            self._connection.close()
+            self._connection = self._connect()
+            self._stats.add(endpoint, time.perf_counter() - started, False)
+            return 0, None
+        latency = time.perf_counter() - started
+
+        self._stats.add(endpoint, latency, response.status < 400)
+        try:
+            payload = json.loads(content) if content else None
+        except ValueError:
+            payload = None
+
+        return response.status, payload
+
+    def obtain_token(self) -> None:
+        status, payload = self.request(
+            'POST /api/token/',
+            'POST',
+            '/api/token/',
+            data={'email': self.email, 'password': self.password},
+            auth=False,
+        )
+        if status == 200:
+            self.access, self.refresh = payload['access'], payload['refresh']
+
+    def refresh_token(self) -> None:
+        status, payload = self.request(
+            'POST /api/token/refresh/',
+            'POST',
+            '/api/token/refresh/',
+            data={'refresh': self.refresh},
+            auth=False,
+        )
+        if status == 200:
+            self.access = payload['access']
+
+
+class Scenarios:
+    """Сценарии нагрузки."""
+
+    def __init__(self, user_id: int, group_id: int) -> None:
+        """
+        :param user_id: id пользователя, от которого подаются заявки.
+        :param group_id: id группы со свободными местами для заявок.
+        """
+
+        self.user_id = user_id
+        self.group_id = group_id
+
+    def token_obtain(self, client: Client, rnd: random.Random) -> None:
+        client.obtain_token()
+
+    def token_refresh(self, client: Client, rnd: random.Random) -> None:
+        client.refresh_token()
+
+    def group_catalog(self, client: Client, rnd: random.Random) -> None:
+        status, payload = client.request(
+            'GET /api/training_process/groups/',
+            'GET',
+            '/api/training_process/groups/',
+        )
+        if status != 200:
+            return
+
+        # Переход на случайную страницу каталога
+        pages = -(-payload['count'] // PAGE_SIZE)
+        if pages > 1:
+            client.request(
+                'GET /api/training_process/groups/?page',
+                'GET',
+                '/api/training_process/groups/',
+                params={'page': rnd.randint(2, pages)},
+            )
+        client.request(
+            'GET /api/training_process/groups/?has_free_seats',
+            'GET',
+            '/api/training_process/groups/',
+            params={'has_free_seats': 'true'},
+        )
+        if payload['results']:
+            group_id = rnd.choice(payload['results'])['id']
+            client.request(
+                'GET /api/training_process/groups/{id}/',
+                'GET',
+                f'/api/training_process/groups/{group_id}/',
+            )
+
+    def user_search(self, client: Client, rnd: random.Random) -> None:
+        client.request(
+            'GET /api/users/?full_name',
+            'GET',
+            '/api/users/',
+            params={'full_name': rnd.choice(SEARCH_QUERIES)},
+        )
+
+    def coach_list(self, client: Client, rnd: random.Random) -> None:
+        client.request(
+            'GET /api/users/coaches/?ordering=all_coach_experience',
+            'GET',
+            '/api/users/coaches/',
+            params={
+                'ordering': rnd.choice(
+                    ['all_coach_experience', '-all_coach_experience']
+                )
+            },
+        )
+
+    def application_approve(self, client: Client, rnd: random.Random) -> None:
+        status, payload = client.request(
+            'POST /api/training_process/group-applications/',
+            'POST',
+            '/api/training_process/group-applications/',
+            data={
+                'user_id': self.user_id,
+                'group_id': self.group_id,
+                'playing_level': 'player',
+            },
+        )
+        if status == 201:
+            client.request(
+                'POST /api/training_process/group-applications/{id}/approve/',
+                'POST',
+                f'/api/training_process/group-applications/{payload["id"]}'
+                '/approve/',
+            )
+
+
+def prepare(email: str | None, password: str | None) -> dict[str, Any]:
+    """
+    Подготовка данных в локальной БД: пользователь для теста и группа
+    со свободными местами для заявок.
+    """
+
+    import django
+
+    sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'configs.settings')
+    django.setup()
+
+    from apps.training_process.models import Group
+    from apps.user.models import User
+    from apps.user.models.choices import GenderType
+    from django.db.models import F
+
+    if email is None:
+        email, password = LOAD_TEST_EMAIL, secrets.token_urlsafe(16)
+        user, _ = User.objects.get_or_create(
+            email=email,
+            defaults={
+                'last_name': 'Нагрузочный',
+                'first_name': 'Тест',
+                'date_of_birth': '2000-01-01',
+                'gender': GenderType.MALE,
+                'phone': '+7(900)000-0000',
+            },
+        )
+        user.set_password(password)
+        user.save()
+    else:
+        user = User.objects.get(email=email)
+
+    group = (
+        Group.objects.filter(
+            participants_count__lt=F('max_participants'),
+        )
+        .order_by('pk')
+        .first()
+    )
+    if group is None:
+        raise SystemExit('В БД нет групп со свободными местами')
+
+    return {
+        'email': email,
+        'password': password,
+        'user_id': user.pk,
+        'group_id': group.pk,
+    }
+
+
+def parse_mix(value: str | None) -> dict[str, int]:
+    """Разбор весов сценариев: 'group_catalog=10,token_obtain=0'."""
+
+    mix = dict(DEFAULT_MIX)
+    for item in filter(None, (value or '').split(',')):
+        name, _, weight = item.partition('=')
+        if name not in mix:
+            raise SystemExit(f'Неизвестный сценарий: {name}')
+        mix[name] = int(weight)
+
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+
+def run(
+    args: argparse.Namespace, data: dict[str, Any], mix: dict[str, int]
+) -> dict[str, dict[str, Any]]:
+    """Запуск нагрузки и сбор статистики."""
+
+    stats = Stats()
+    scenarios = Scenarios(data['user_id'], data['group_id'])
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    stop = threading.Event()
+
+    def worker(index: int) -> None:
+        rnd = random.Random(index)
+        client = Client(args.base_url, stats, data['email'], data['password'])
+        client.obtain_token()
+        while not stop.is_set():
+            scenario: Callable = getattr(
+                scenarios, rnd.choices(names, weights)[0]
+            )
+            scenario(client, rnd)
+
+    threads = [
+        threading.Thread(target=worker, args=(index,), daemon=True)
+        for index in range(args.concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+
+    # Прогрев не учитывается в статистике
+    time.sleep(args.warmup)
+    stats.recording = True
+    started = time.perf_counter()
+    time.sleep(args.duration)
+    stats.recording = False
+    duration = time.perf_counter() - started
+
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    return stats.report(duration)
+
+
+def print_report(report: dict[str, dict[str, Any]]) -> None:
+    width = max(len(name) for name in report)
+    header = (
+        f'{"эндпоинт":<{width}} {"запросов":>9} {"ошибок":>7} '
+        f'{"rps":>8} {"p50":>8} {"p95":>8} {"p99":>8} {"max":>8}'
+    )
+    print(header)  # noqa: T201
+    print('-' * len(header))  # noqa: T201
+    for name, row in report.items():
+        print(  # noqa: T201
+            f'{name:<{width}} {row["requests"]:>9} {row["errors"]:>7} '
+            f'{row["rps"]:>8.1f} {row["p50_ms"]:>8.1f} '
+            f'{row["p95_ms"]:>8.1f} {row["p99_ms"]:>8.1f} '
+            f'{row["max_ms"]:>8.1f}'
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument(
+        '--duration', type=float, default=60, help='Длительность замера, с'
+    )
+    parser.add_argument(
+        '--warmup', type=float, default=5, help='Длительность прогрева, с'
+    )
+    parser.add_argument('--mix', help='Веса сценариев (имя=вес через ",")')
+    parser.add_argument('--email', help='Email существующего пользователя')
+    parser.add_argument('--password', help='Пароль пользователя')
+    parser.add_argument(
+        '--output', type=Path, help='Файл результатов в формате JSON'
+    )
+    args = parser.parse_args()
+
+    if (args.email is None) != (args.password is None):
+        parser.error('--email и --password передаются вместе')
+
+    mix = parse_mix(args.mix)
+    data = prepare(args.email, args.password)
+    print(  # noqa: T201
+        f'Нагрузка на {args.base_url}: {args.concurrency} потоков, '
+        f'{args.duration:g} с, профиль {mix}'
+    )
+
+    report = run(args, data, mix)
+    print_report(report)
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(
+            json.dumps(
+                {
+                    'base_url': args.base_url,
+                    'concurrency': args.concurrency,
+                    'duration': args.duration,
+                    'mix': mix,
+                    'endpoints': report,
+                },
+                ensure_ascii=False,
+                indent=2,
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
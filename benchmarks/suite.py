@@ -0,0 +1,649 @@
+"""
+Набор микробенчмарков сериализаторов, фильтров и сервисов.
+
+Замеряет:
+- сериализацию списков UserSerializer, CoachSerializer
+  и GroupApplicationSerializer;
+- фильтрацию и сортировку по ФИО (get_user_full_name_annotation)
+  во всех классах фильтров с фильтром full_name;
+- execute() всех сервисов apps/user/services
+  и apps/training_process/services.
+
+Бенчмарки запускаются на отдельной тестовой БД (как при запуске тестов),
+которая наполняется данными заданного объема, поэтому результаты
+не зависят от данных локальной БД. Изменения данных сервисами
+откатываются после каждого замера. Результаты сохраняются в JSON,
+а с параметром --compare сравниваются с результатами другой ветки:
+при замедлении медианы больше порога скрипт завершается с ошибкой.
+
+Запуск: python benchmarks/suite.py --users 10000 --repeat 20
+Сравнение: python benchmarks/suite.py --compare results/main.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+
+# Данные для генерации ФИО пользователей
+LAST_NAMES = [
+    'Иванова',
+    'Смирнова',
+    'Кузнецова',
+    'Попова',
+    'Васильева',
+    'Петрова',
+    'Соколова',
+    'Михайлова',
+    'Новикова',
+    'Федорова',
+]
+FIRST_NAMES = ['Анна', 'Мария', 'Елена', 'Ольга', 'Наталья', 'Ирина']
+PATRONYMICS = ['Александровна', 'Сергеевна', 'Игоревна', None]
+
+
+@dataclass
+class Benchmark:
+    """
+    Бенчмарк.
+
+    :param name: Имя бенчмарка в результатах.
+    :param run: Замеряемая функция. Принимает результат setup.
+    :param setup: Подготовка данных для одного замера (не замеряется).
+    :param rollback: Откатывать изменения БД после каждого замера.
+    """
+
+    name: str
+    run: Callable[[Any], Any]
+    setup: Callable[[], Any] = lambda: None
+    rollback: bool = False
+
+
+@contextmanager
+def rollback_atomic() -> Iterator[None]:
+    """Транзакция, которая всегда откатывается."""
+
+    from django.db import transaction
+
+    with transaction.atomic():
+        yield
+        transaction.set_rollback(True)
+
+
+def measure(benchmark: Benchmark, repeat: int) -> dict[str, Any]:
+    """
+    Замер бенчмарка.
+
+    Первый запуск не замеряется (прогрев) и используется для подсчета
+    количества SQL-запросов.
+
+    :return: Статистика времени в миллисекундах и количество запросов.
+    """
+
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    def run_once(capture: bool = False) -> tuple[float, int]:
+        # Запросы записываются только при прогреве, чтобы запись
+        # не влияла на время замеров
+        captured = CaptureQueriesContext(connection) if capture else []
+        with rollback_atomic() if benchmark.rollback else nullcontext():
+            state = benchmark.setup()
+            with captured if capture else nullcontext():
+                started = time.perf_counter()
+                benchmark.run(state)
+                elapsed = time.perf_counter() - started
+        return elapsed * 1000, len(captured)
+
+    _, queries = run_once(capture=True)
+    timings = [run_once()[0] for _ in range(repeat)]
+
+    return {
+        'min_ms': round(min(timings), 4),
+        'median_ms': round(statistics.median(timings), 4),
+        'mean_ms': round(statistics.mean(timings), 4),
+        'stdev_ms': round(statistics.stdev(timings), 4)
+        if len(timings) > 1
+        else 0.0,
+        'queries': queries,
+        'repeat': repeat,
+    }
+
+
+def seed(users_count: int) -> dict[str, Any]:
+    """
+    Наполнение БД тестовыми данными.
+
+    На каждые 100 пользователей создается 5 тренеров, 25 спортсменов,
+    1 администратор, 10 групп и 50 заявок.
+
+    :return: Объемы созданных данных.
+    """
+
+    from apps.training_process.models import Group, GroupApplication
+    from apps.training_process.models.choices import GroupStatus
+    from apps.user.models import Administrator, Athlete, Coach, User
+    from apps.user.models.choices import CoachPosition, GenderType
+    from common.choices import PlayingLevel, Weekdays
+    from django.contrib.auth.hashers import make_password
+
+    rnd = random.Random(0)
+    today = date.today()
+    password = make_password(None)
+
+    users = User.objects.bulk_create(
+        User(
+            email=f'bench{index}@example.com',
+            last_name=rnd.choice(LAST_NAMES),
+            first_name=rnd.choice(FIRST_NAMES),
+            patronymic=rnd.choice(PATRONYMICS),
+            date_of_birth=today - timedelta(days=rnd.randint(6000, 20000)),
+            gender=GenderType.FEMALE,
+            phone=f'+7(900)000-{index:04d}',
+            password=password,
+        )
+        for index in range(users_count)
+    )
+
+    # Роли назначаются первым пользователям, остальные пользователи
+    # остаются без ролей для сервисов назначения ролей
+    coaches_count = max(users_count // 20, 1)
+    athletes_count = users_count // 4
+    administrators_count = max(users_count // 100, 1)
+    roles_users = iter(users)
+
+    coaches = Coach.objects.bulk_create(
+        Coach(
+            user=next(roles_users),
+            date_from=today - timedelta(days=rnd.randint(0, 3650)),
+            coach_experience=rnd.randint(0, 20),
+            position=rnd.choice(CoachPosition.values),
+        )
+        for _ in range(coaches_count)
+    )
+    athletes = Athlete.objects.bulk_create(
+        Athlete(
+            user=next(roles_users),
+            date_from=today - timedelta(days=rnd.randint(0, 1000)),
+            playing_level=rnd.choice(PlayingLevel.values),
+        )
+        for _ in range(athletes_count)
+    )
+    Administrator.objects.bulk_create(
+        Administrator(user=next(roles_users), date_from=today)
+        for _ in range(administrators_count)
+    )
+
+    groups = Group.objects.bulk_create(
+        Group(
+            name=f'Группа {index}',
+            status=GroupStatus.ACTIVE,
+            coach=coaches[index % len(coaches)],
+            playing_level=rnd.choice(PlayingLevel.values),
+            training_days=[Weekdays.MONDAY, Weekdays.WEDNESDAY],
+            training_time='19:00',
+            trainings_start_date=today,
+        )
+        for index in range(max(users_count // 10, 1))
+    )
+
+    # Спортсмены распределяются по группам с запасом свободных мест
+    memberships = [
+        Athlete.groups.through(
+            athlete_id=athlete.pk, group_id=groups[index % len(groups)].pk
+        )
+        for index, athlete in enumerate(athletes)
+    ]
+    Athlete.groups.through.objects.bulk_create(memberships)
+    Group.objects.all().update_participants_count()
+
+    applications_count = users_count // 2
+    GroupApplication.objects.bulk_create(
+        GroupApplication(
+            user=users[-(index + 1)],
+            group=groups[index % len(groups)],
+            playing_level=rnd.choice(PlayingLevel.values),
+            comment='Хочу заниматься',
+        )
+        for index in range(applications_count)
+    )
+
+    return {
+        'users': users_count,
+        'coaches': coaches_count,
+        'athletes': athletes_count,
+        'administrators': administrators_count,
+        'groups': len(groups),
+        'group_applications': applications_count,
+    }
+
+
+def get_serializer_benchmarks(rows: int) -> list[Benchmark]:
+    """Сериализация страниц списков (без запросов к БД)."""
+
+    from apps.training_process.api.serializers import (
+        GroupApplicationSerializer,
+    )
+    from apps.training_process.models import GroupApplication
+    from apps.user.api.serializers import CoachSerializer, UserSerializer
+    from apps.user.models import Coach, User
+
+    querysets = {
+        'user': (UserSerializer, User.objects.order_by('-id')),
+        'coach': (
+            CoachSerializer,
+            Coach.objects.all()
+            .with_current_coach_experience_annotation()
+            .select_related('user')
+            .order_by('-id'),
+        ),
+        'group_application': (
+            GroupApplicationSerializer,
+            GroupApplication.objects.select_related(
+                'user', 'group__coach__user'
+            ).order_by('-id'),
+        ),
+    }
+
+    benchmarks = []
+    for name, (serializer_class, queryset) in querysets.items():
+        instances = list(queryset[:rows])
+        benchmarks.append(
+            Benchmark(
+                name=f'serializer.{name}[{len(instances)}]',
+                run=lambda _,
+                serializer_class=serializer_class,
+                instances=(instances): serializer_class(
+                    instances, many=True
+                ).data,
+            )
+        )
+
+    return benchmarks
+
+
+def get_filter_benchmarks() -> list[Benchmark]:
+    """Фильтрация и сортировка по ФИО (страница из 20 записей)."""
+
+    from apps.training_process.api.filters import GroupApplicationFilter
+    from apps.training_process.models import GroupApplication
+    from apps.user.api.filters import (
+        AdministratorFilter,
+        AthleteFilter,
+        CoachFilter,
+        UserFilter,
+    )
+    from apps.user.models import Administrator, Athlete, Coach, User
+
+    filtersets = {
+        'user': (UserFilter, User.objects.all()),
+        'coach': (CoachFilter, Coach.objects.select_related('user')),
+        'athlete': (AthleteFilter, Athlete.objects.select_related('user')),
+        'administrator': (
+            AdministratorFilter,
+            Administrator.objects.select_related('user'),
+        ),
+        'group_application': (
+            GroupApplicationFilter,
+            GroupApplication.objects.select_related(
+                'user', 'group__coach__user'
+            ),
+        ),
+    }
+    params = {
+        'full_name': {'full_name': 'ова Мар'},
+        'ordering_full_name': {'ordering': 'full_name'},
+        'ordering_-full_name': {'ordering': '-full_name'},
+    }
+
+    benchmarks = []
+    for name, (filterset_class, queryset) in filtersets.items():
+        for param_name, data in params.items():
+            benchmarks.append(
+                Benchmark(
+                    name=f'filter.{name}.{param_name}',
+                    run=lambda _,
+                    filterset_class=filterset_class,
+                    queryset=queryset,
+                    data=data: list(
+                        filterset_class(data, queryset.order_by('-id')).qs[:20]
+                    ),
+                )
+            )
+
+    return benchmarks
+
+
+def get_service_benchmarks() -> list[Benchmark]:
+    """
+    Выполнение сервисов.
+
+    Данные сервиса готовятся в setup, а изменения откатываются после
+    каждого замера, поэтому все замеры выполняются на одинаковых данных.
+    """
+
+    from apps.training_process.models import GroupApplication
+    from apps.training_process.models.choices import GroupApplicationStatus
+    from apps.training_process.services import (
+        GroupApplicationApproveService,
+        GroupApplicationBulkApproveService,
+        GroupApplicationBulkRejectService,
+        GroupApplicationRejectService,
+    )
+    from apps.user.models import Administrator, Athlete, Coach, User
+    from apps.user.models.choices import CoachPosition, GenderType
+    from apps.user.services import (
+        AdministratorCancelService,
+        AdministratorWithUserCreateService,
+        AthleteCancelService,
+        AthleteWithUserCreateService,
+        CoachCancelService,
+        CoachWithUserCreateService,
+        UserAppointAdministratorService,
+        UserAppointAthleteService,
+        UserAppointCoachService,
+    )
+    from common.choices import PlayingLevel
+    from django.db.models import F
+
+    user_data = {
+        'email': 'bench-new@example.com',
+        'last_name': 'Новая',
+        'first_name': 'Пользователь',
+        'date_of_birth': date(2000, 1, 1),
+        'gender': GenderType.FEMALE,
+        'phone': '+7(900)000-0000',
+    }
+    coach_data = {'position': CoachPosition.INSTRUCTOR, 'coach_experience': 3}
+
+    def get_user_without_roles() -> User:
+        return User.objects.filter(
+            coaches__isnull=True,
+            athletes__isnull=True,
+            administrators__isnull=True,
+        ).latest('pk')
+
+    def get_new_applications(count: int) -> list[GroupApplication]:
+        # Заявки в группы со свободными местами
+        return list(
+            GroupApplication.objects.select_related('user', 'group')
+            .filter(group__participants_count__lt=F('group__max_participants'))
+            .filter(status=GroupApplicationStatus.NEW)
+            .order_by('pk')[:count]
+        )
+
+    return [
+        Benchmark(
+            name='service.AdministratorWithUserCreateService',
+            run=lambda _: AdministratorWithUserCreateService(
+                user_data
+            ).execute(),
+            rollback=True,
+        ),
+        Benchmark(
+            name='service.AthleteWithUserCreateService',
+            run=lambda _: AthleteWithUserCreateService(
+                user_data, PlayingLevel.PLAYER
+            ).execute(),
+            rollback=True,
+        ),
+        Benchmark(
+            name='service.CoachWithUserCreateService',
+            run=lambda _: CoachWithUserCreateService(
+                user_data, **coach_data
+            ).execute(),
+            rollback=True,
+        ),
+        Benchmark(
+            name='service.AdministratorCancelService',
+            setup=lambda: Administrator.objects.filter(
+                date_to__isnull=True
+            ).latest('pk'),
+            run=lambda administrator: AdministratorCancelService(
+                administrator
+            ).execute(),
+            rollback=True,
+        ),
+        Benchmark(
+            name='service.AthleteCancelService',
+            setup=lambda: Athlete.objects.filter(
+                date_to__isnull=True, groups__isnull=False
+            ).latest('pk'),
+            run=lambda athlete: AthleteCancelService(athlete).execute(),
+            rollback=True,
+        ),
+        Benchmark(
+            name='service.CoachCancelService',
+            setup=lambda: Coach.objects.filter(date_to__isnull=True).latest(
+                'pk'
+            ),
+            run=lambda coach: CoachCancelService(coach).execute(),
+            rollback=True,
+        ),
+        Benchmark(
+            name='service.UserAppointAdministratorService',
+            setup=get_user_without_roles,
+            run=lambda user: UserAppointAdministratorService(user).execute(),
+            rollback=True,
+        ),
+        Benchmark(
+            name='service.UserAppointAthleteService',
+            setup=get_user_without_roles,
+            run=lambda user: UserAppointAthleteService(
+                user, PlayingLevel.PLAYER
+            ).execute(),
+            rollback=True,
+        ),
+        Benchmark(
+            name='service.UserAppointCoachService',
+            setup=get_user_without_roles,
+            run=lambda user: UserAppointCoachService(
+                user, coach_data
+            ).execute(),
+            rollback=True,
+        ),
+        Benchmark(
+            name='service.GroupApplicationApproveService',
+            setup=lambda: get_new_applications(1)[0],
+            run=lambda application: GroupApplicationApproveService(
+                application
+            ).execute(),
+            rollback=True,
+        ),
+        Benchmark(
+            name='service.GroupApplicationRejectService',
+            setup=lambda: get_new_applications(1)[0],
+            run=lambda application: GroupApplicationRejectService(
+                application, 'Нет мест'
+            ).execute(),
+            rollback=True,
+        ),
+        Benchmark(
+            name='service.GroupApplicationBulkApproveService[100]',
+            setup=lambda: [item.pk for item in get_new_applications(100)],
+            run=lambda ids: GroupApplicationBulkApproveService(ids).execute(),
+            rollback=True,
+        ),
+        Benchmark(
+            name='service.GroupApplicationBulkRejectService[100]',
+            setup=lambda: [item.pk for item in get_new_applications(100)],
+            run=lambda ids: GroupApplicationBulkRejectService(
+                ids, 'Нет мест'
+            ).execute(),
+            rollback=True,
+        ),
+    ]
+
+
+def get_git_revision() -> dict[str, str | None]:
+    """Ветка и коммит, на которых запущены бенчмарки."""
+
+    def git(*args: str) -> str | None:
+        try:
+            return subprocess.run(
+                ['git', *args],
+                cwd=BASE_DIR,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    return {
+        'branch': git('rev-parse', '--abbrev-ref', 'HEAD'),
+        'commit': git('rev-parse', 'HEAD'),
+    }
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """
+    Сравнение результатов с результатами другого запуска по медиане.
+
+    :param threshold: Допустимое относительное замедление (0.1 - 10%).
+    :return: Имена бенчмарков, которые замедлились больше порога или
+        выполняют больше SQL-запросов.
+    """
+
+    regressions = []
+    for name, result in results['results'].items():
+        base = baseline['results'].get(name)
+        if base is None:
+            print(f'{name}: нет в сравниваемых результатах')  # noqa: T201
+            continue
+
+        ratio = result['median_ms'] / base['median_ms']
+        regressed = ratio > 1 + threshold or (
+            result['queries'] > base['queries']
+        )
+        if regressed:
+            regressions.append(name)
+        print(  # noqa: T201
+            f'{"!" if regressed else " "} {name}: '
+            f'{base["median_ms"]:.3f} -> {result["median_ms"]:.3f} мс '
+            f'(x{ratio:.2f}), запросов {base["queries"]} -> '
+            f'{result["queries"]}'
+        )
+
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument(
+        '--users', type=int, default=10000, help='Количество пользователей'
+    )
+    parser.add_argument(
+        '--rows',
+        type=int,
+        default=100,
+        help='Количество записей для сериализации',
+    )
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument(
+        '--only', help='Запуск бенчмарков, имя которых содержит строку'
+    )
+    parser.add_argument(
+        '--output', type=Path, help='Файл результатов в формате JSON'
+    )
+    parser.add_argument(
+        '--compare', type=Path, help='Результаты для сравнения'
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.1,
+        help='Допустимое замедление при сравнении (0.1 - 10%%)',
+    )
+    parser.add_argument(
+        '--keepdb',
+        action='store_true',
+        help='Не удалять тестовую БД после запуска',
+    )
+    args = parser.parse_args()
+
+    import django
+
+    sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'configs.settings')
+    django.setup()
+
+    from django.db import connection
+
+    # Отдельная БД, чтобы результаты не зависели от локальных данных
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        with rollback_atomic():
+            started = time.perf_counter()
+            volumes = seed(args.users)
+            print(  # noqa: T201
+                f'Данные созданы за {time.perf_counter() - started:.1f} с: '
+                f'{volumes}'
+            )
+
+            benchmarks = [
+                *get_serializer_benchmarks(args.rows),
+                *get_filter_benchmarks(),
+                *get_service_benchmarks(),
+            ]
+            results = {}
+            for benchmark in benchmarks:
+                if args.only and args.only not in benchmark.name:
+                    continue
+                results[benchmark.name] = measure(benchmark, args.repeat)
+                print(  # noqa: T201
+                    f'{benchmark.name}: '
+                    f'{results[benchmark.name]["median_ms"]:.3f} мс, '
+                    f'запросов {results[benchmark.name]["queries"]}'
+                )
+    finally:
+        connection.creation.destroy_test_db(
+            old_name, verbosity=0, keepdb=args.keepdb
+        )
+
+    output = {
+        'meta': {
+            **get_git_revision(),
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'volumes': volumes,
+            'rows': args.rows,
+        },
+        'results': results,
+    }
+
+    path = args.output or RESULTS_DIR / (
+        f'{output["meta"]["branch"] or "unknown"}-'
+        f'{time.strftime("%Y%m%d-%H%M%S")}.json'
+    ).replace('/', '-')
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(output, ensure_ascii=False, indent=2))
+    print(f'Результаты сохранены в {path}')  # noqa: T201
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare(output, baseline, args.threshold)
+        if regressions:
+            raise SystemExit(f'Замедление: {", ".join(regressions)}')
+
+
+if __name__ == '__main__':
+    main()
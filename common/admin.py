@@ -0,0 +1,41 @@
+from django.contrib import admin
+
+from common.pagination import EstimatedCountPaginator
+
+
+class ScalableModelAdmin(admin.ModelAdmin):
+    """
+    Базовый класс панели администратора для больших таблиц.
+
+    Количество записей в списке оценивается планировщиком PostgreSQL
+    вместо COUNT(*), а общее количество записей без фильтров не
+    считается. Сортировка по убыванию id, чтобы страница списка
+    читалась по индексу первичного ключа.
+    """
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    ordering = ('-id',)
+
+
+class CurrentRoleListFilter(admin.SimpleListFilter):
+    """
+    Фильтр ролей по действию. Действующие роли выбираются по частичному
+    индексу date_to IS NULL.
+    """
+
+    title = 'Действие роли'
+    parameter_name = 'current'
+
+    def lookups(self, request, model_admin):
+        return (
+            ('1', 'Действующие'),
+            ('0', 'Закончившиеся'),
+        )
+
+    def queryset(self, request, queryset):
+        if self.value() == '1':
+            return queryset.filter(date_to__isnull=True)
+        if self.value() == '0':
+            return queryset.filter(date_to__isnull=False)
+        return queryset
@@ -19,3 +19,25 @@ class PlayingLevel(models.TextChoices):
     BEGINNER = ('beginner', 'Начинающий')
     PLAYER = ('player', 'Играющий')
     PRO = ('pro', 'Профессионал')
+
+
+class PaginationMode(models.TextChoices):
+    """Режимы пагинации списков."""
+
+    PAGE = ('page', 'Постраничная')
+    CURSOR = ('cursor', 'Курсорная')
+
+
+class PaginationCountStrategy(models.TextChoices):
+    """Стратегии подсчета общего количества записей при пагинации."""
+
+    EXACT = ('exact', 'Точный подсчет')
+    CAPPED = ('capped', 'Точный подсчет до порога')
+    ESTIMATED = ('estimated', 'Оценка планировщика PostgreSQL')
+
+
+class ExportFormat(models.TextChoices):
+    """Форматы файлов выгрузки списков."""
+
+    CSV = ('csv', 'CSV')
+    XLSX = ('xlsx', 'Excel (XLSX)')
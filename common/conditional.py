@@ -0,0 +1,235 @@
+import datetime
+import hashlib
+import json
+from typing import Any
+
+from django.conf import settings
+from django.db.models import QuerySet
+from django.http import HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from django.utils.timezone import get_current_timezone, localdate
+from rest_framework.response import Response
+
+# Поле с датой и временем изменения записи
+UPDATED_AT_FIELD = 'updated_at'
+
+
+def get_updated_at_lookups(queryset: QuerySet) -> list[str]:
+    """
+    Получение путей к полям updated_at модели кверисета и связанных
+    моделей из select_related.
+
+    Связанные модели учитываются, так как их данные входят в ответ
+    через вложенные сериализаторы.
+    """
+
+    lookups = []
+
+    def collect(model, prefix: str, related: dict) -> None:
+        if any(field.name == UPDATED_AT_FIELD for field in model._meta.fields):
+            lookups.append(f'{prefix}{UPDATED_AT_FIELD}')
+        for name, nested in related.items():
+            field = model._meta.get_field(name)
+            collect(field.related_model, f'{prefix}{name}__', nested)
+
+    select_related = queryset.query.select_related
+    collect(
+        queryset.model,
+        '',
+        select_related if isinstance(select_related, dict) else {},
+    )
+
+    return lookups
+
+
+def get_row_updated_at(
+    row: Any, lookups: list[str]
+) -> datetime.datetime | None:
+    """
+    Получение даты последнего изменения записи с учетом связанных
+    записей.
+
+    :param row: Экземпляр модели или строка .values().
+    :param lookups: Пути к полям updated_at.
+    """
+
+    values = []
+    for lookup in lookups:
+        if isinstance(row, dict):
+            value = row.get(lookup)
+        else:
+            value = row
+            for name in lookup.split('__'):
+                value = getattr(value, name, None)
+        if value is not None:
+            values.append(value)
+
+    return max(values, default=None)
+
+
+class NotModified(Exception):
+    """Данные не изменились, клиенту возвращается ответ 304."""
+
+    def __init__(self, response: HttpResponseBase) -> None:
+        super().__init__()
+        self.response = response
+
+
+class ConditionalGetMixin:
+    """
+    Поддержка условных GET-запросов для списка и детального просмотра.
+
+    ETag строится по идентификаторам и датам изменения записей
+    страницы (с учетом связанных записей из select_related) и данным
+    пагинации (количество записей, ссылки). Валидаторы вычисляются
+    по уже выбранной странице без дополнительных запросов, и при
+    совпадении If-None-Match возвращается ответ 304 без сериализации.
+
+    Last-Modified отдается только для детального просмотра: удаление
+    записи из списка не меняет максимальную дату изменения страницы,
+    и If-Modified-Since вернул бы устаревший список. Для списков
+    поддерживается только If-None-Match.
+
+    ETag учитывает параметры запроса и текущую дату, так как часть
+    полей (например, текущий тренерский стаж) зависит от даты.
+    Отключается настройкой CONDITIONAL_GET_ENABLED.
+    """
+
+    # ETag и Last-Modified (timestamp, для списка - None) ответа
+    _validators: tuple[str, int | None] | None = None
+    # Пути к полям updated_at записей страницы
+    _updated_at_lookups: list[str] | None = None
+
+    def values_extra_lookups(self, queryset: QuerySet) -> list[str]:
+        """Поля updated_at для выборки через .values()."""
+
+        self._updated_at_lookups = get_updated_at_lookups(queryset)
+        return self._updated_at_lookups
+
+    def list(self, request, *args, **kwargs):
+        try:
+            response = super().list(request, *args, **kwargs)
+        except NotModified as exc:
+            return exc.response
+
+        return self._set_validators(response)
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        if settings.CONDITIONAL_GET_ENABLED:
+            lookups = get_updated_at_lookups(
+                self.filter_queryset(self.get_queryset())
+            )
+            updated_at = get_row_updated_at(instance, lookups)
+            response = self._get_not_modified_response(
+                request,
+                key=[instance.pk, updated_at],
+                last_modified=self._get_last_modified(updated_at),
+            )
+            if response is not None:
+                return response
+
+        serializer = self.get_serializer(instance)
+        return self._set_validators(Response(serializer.data))
+
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        if page is None or not settings.CONDITIONAL_GET_ENABLED:
+            return page
+
+        if self._updated_at_lookups is None:
+            self._updated_at_lookups = get_updated_at_lookups(queryset)
+        lookups = self._updated_at_lookups
+        rows = [
+            (self._get_row_pk(row), get_row_updated_at(row, lookups))
+            for row in page
+        ]
+        # Данные пагинации (количество записей и ссылки) без результатов
+        pagination = self.paginator.get_paginated_response([]).data
+
+        response = self._get_not_modified_response(
+            request=self.request, key=[pagination, rows]
+        )
+        if response is not None:
+            # Прерывание list() до сериализации страницы
+            raise NotModified(response)
+
+        return page
+
+    def _get_not_modified_response(
+        self,
+        request,
+        key: Any,
+        last_modified: int | None = None,
+    ) -> HttpResponseBase | None:
+        """
+        Построение ETag и проверка условных заголовков.
+
+        :param key: Данные ответа, от которых зависит ETag.
+        :param last_modified: Last-Modified (timestamp) или None, если
+            заголовок не отдается и If-Modified-Since не проверяется.
+        :return: Ответ 304 или None, если данные изменились.
+        """
+
+        etag = self._get_etag(request, key)
+        self._validators = etag, last_modified
+
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            return None
+
+        return self._set_validators(response)
+
+    def _set_validators(self, response: HttpResponseBase):
+        """Добавление заголовков ETag и Last-Modified к ответу."""
+
+        if self._validators is None or response.status_code not in (
+            200,
+            304,
+        ):
+            return response
+
+        etag, timestamp = self._validators
+        response['ETag'] = etag
+        if timestamp is not None:
+            response['Last-Modified'] = http_date(timestamp)
+        patch_cache_control(response, private=True, no_cache=True)
+
+        return response
+
+    @staticmethod
+    def _get_last_modified(updated_at: datetime.datetime | None) -> int:
+        """
+        Last-Modified записи (timestamp): не раньше начала текущих суток,
+        так как данные, зависящие от даты, меняются в начале суток.
+        """
+
+        start_of_day = datetime.datetime.combine(
+            localdate(), datetime.time.min, tzinfo=get_current_timezone()
+        )
+
+        return int(max(updated_at or start_of_day, start_of_day).timestamp())
+
+    @staticmethod
+    def _get_etag(request, key: Any) -> str:
+        """Построение ETag по данным ответа и параметрам запроса."""
+
+        value = json.dumps(
+            [
+                request.path,
+                sorted(request.GET.lists()),
+                request.accepted_renderer.media_type,
+                localdate().isoformat(),
+                key,
+            ],
+            default=str,
+        )
+
+        return f'W/"{hashlib.sha1(value.encode()).hexdigest()}"'
+
+    @staticmethod
+    def _get_row_pk(row: Any) -> Any:
+        return row['pk'] if isinstance(row, dict) else row.pk
@@ -0,0 +1,30 @@
+import logging
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+def log_database_connection_settings(alias: str = 'default') -> None:
+    """
+    Запись в лог настроек соединений с БД при запуске приложения.
+
+    :param alias: Алиас БД из DATABASES.
+    """
+
+    database = settings.DATABASES[alias]
+    pool = database.get('OPTIONS', {}).get('pool')
+    if pool:
+        options = pool if isinstance(pool, dict) else {}
+        logger.info(
+            'БД %s: пул соединений включен (%s)',
+            alias,
+            ', '.join(f'{key}={value}' for key, value in options.items())
+            or 'параметры по умолчанию',
+        )
+    else:
+        logger.info(
+            'БД %s: пул соединений отключен, CONN_MAX_AGE=%s',
+            alias,
+            database.get('CONN_MAX_AGE', 0),
+        )
@@ -0,0 +1,349 @@
+import csv
+import re
+import zipfile
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.db.models import Model
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+
+from common.choices import ExportFormat
+
+# Параметр запроса с форматом файла. Параметр format занят DRF
+# для выбора рендерера
+EXPORT_FORMAT_QUERY_PARAM = 'file_format'
+
+CONTENT_TYPES = {
+    ExportFormat.CSV: 'text/csv; charset=utf-8',
+    ExportFormat.XLSX: (
+        'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    ),
+}
+
+# Размер части файла, после накопления которого она отдается клиенту
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Первые символы строки, с которых Excel начинает формулу
+CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+# Числа и телефоны со знаком: без букв в них нет ссылок и функций,
+# поэтому как формула они не опасны и выгружаются как есть
+CSV_SIGNED_NUMBER = re.compile(r'[+-][\d ().,-]+')
+
+# Символы, недопустимые в XML 1.0
+XML_ILLEGAL_CHARACTERS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/'
+    'content-types">'
+    '<Default Extension="rels" ContentType="application/'
+    'vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType='
+    '"application/'
+    'vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>'
+)
+XLSX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+    'relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/'
+    'officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/'
+    'main" xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/'
+    'relationships">'
+    '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+    'relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/'
+    'officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '</Relationships>'
+)
+XLSX_SHEET_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/'
+    'main"><sheetData>'
+)
+XLSX_SHEET_END = '</sheetData></worksheet>'
+
+
+class StreamBuffer:
+    """
+    Буфер для записи файла частями.
+
+    Не поддерживает seek/tell, поэтому zipfile пишет архив
+    последовательно, с размерами записей после их данных.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def pop(self) -> bytes:
+        """Получение записанных данных с очисткой буфера."""
+
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        self.size = 0
+        return data
+
+
+def format_value(value: Any) -> Any:
+    """
+    Приведение значения выборки к значению ячейки: None - пустая
+    строка, дата и время - в текущем часовом поясе без микросекунд.
+    """
+
+    if value is None:
+        return ''
+    if isinstance(value, datetime):
+        if timezone.is_aware(value):
+            value = timezone.localtime(value)
+        return value.replace(microsecond=0, tzinfo=None).isoformat(sep=' ')
+    if isinstance(value, list):
+        return ', '.join(str(item) for item in value)
+
+    return value
+
+
+def format_csv_value(value: Any) -> Any:
+    """
+    Приведение значения выборки к значению ячейки CSV.
+
+    Строки, которые Excel выполнил бы как формулу (имя, комментарий
+    и т.п. вида =HYPERLINK(...)), начинаются с апострофа и открываются
+    как текст. Числа и телефоны со знаком (+79990000000) не меняются.
+    """
+
+    value = format_value(value)
+    if (
+        isinstance(value, str)
+        and value.startswith(CSV_FORMULA_PREFIXES)
+        and not CSV_SIGNED_NUMBER.fullmatch(value)
+    ):
+        return f"'{value}"
+
+    return value
+
+
+def iter_csv(header: list[str], rows: Iterable[tuple]) -> Iterator[bytes]:
+    """
+    Построчное формирование CSV в UTF-8 с BOM (для открытия в Excel).
+    """
+
+    class Line:
+        @staticmethod
+        def write(value: str) -> str:
+            return value
+
+    writer = csv.writer(Line())
+    chunk = ['\ufeff', writer.writerow(header)]
+    size = 0
+    for row in rows:
+        line = writer.writerow([format_csv_value(value) for value in row])
+        chunk.append(line)
+        size += len(line)
+        if size >= STREAM_CHUNK_SIZE:
+            yield ''.join(chunk).encode()
+            chunk, size = [], 0
+
+    yield ''.join(chunk).encode()
+
+
+def _xlsx_column(index: int) -> str:
+    """Буквенное обозначение столбца по индексу с нуля."""
+
+    name = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        name = chr(ord('A') + remainder) + name
+
+    return name
+
+
+def _xlsx_row(number: int, columns: list[str], values: Iterable) -> str:
+    cells = []
+    for column, value in zip(columns, values, strict=True):
+        reference = f'{column}{number}'
+        value = format_value(value)
+        if isinstance(value, bool):
+            cells.append(f'<c r="{reference}" t="b"><v>{int(value)}</v></c>')
+        elif isinstance(value, int | float | Decimal):
+            cells.append(f'<c r="{reference}"><v>{value}</v></c>')
+        elif value != '':
+            text = escape(XML_ILLEGAL_CHARACTERS.sub('', str(value)))
+            cells.append(
+                f'<c r="{reference}" t="inlineStr"><is>'
+                f'<t xml:space="preserve">{text}</t></is></c>'
+            )
+
+    return f'<row r="{number}">{"".join(cells)}</row>'
+
+
+def iter_xlsx(
+    header: list[str], rows: Iterable[tuple], sheet_name: str = 'Лист1'
+) -> Iterator[bytes]:
+    """
+    Построчное формирование XLSX.
+
+    Книга из одного листа со строками в самих ячейках (inlineStr), без
+    таблицы общих строк и стилей, поэтому лист пишется в архив по мере
+    получения строк выборки. Даты записываются строками.
+    """
+
+    buffer = StreamBuffer()
+    columns = [_xlsx_column(index) for index in range(len(header))]
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', XLSX_CONTENT_TYPES)
+        archive.writestr('_rels/.rels', XLSX_RELS)
+        archive.writestr(
+            'xl/workbook.xml', XLSX_WORKBOOK.format(name=escape(sheet_name))
+        )
+        archive.writestr('xl/_rels/workbook.xml.rels', XLSX_WORKBOOK_RELS)
+        with archive.open('xl/worksheets/sheet1.xml', 'w') as sheet:
+            sheet.write(XLSX_SHEET_START.encode())
+            sheet.write(_xlsx_row(1, columns, header).encode())
+            for number, row in enumerate(rows, start=2):
+                sheet.write(_xlsx_row(number, columns, row).encode())
+                if buffer.size >= STREAM_CHUNK_SIZE:
+                    yield buffer.pop()
+            sheet.write(XLSX_SHEET_END.encode())
+
+    yield buffer.pop()
+
+
+def get_choices_converter(
+    model: type[Model], lookup: str
+) -> Callable[[Any], Any] | None:
+    """
+    Получение функции замены значения поля с вариантами на название
+    варианта. Для полей без вариантов возвращается None.
+    """
+
+    field = None
+    for name in lookup.split('__'):
+        field = model._meta.get_field(name)
+        if field.related_model is not None:
+            model = field.related_model
+
+    choices = dict(field.flatchoices) if field.choices else None
+    if not choices:
+        return None
+
+    return lambda value: choices.get(value, value)
+
+
+class ExportMixin:
+    """
+    Выгрузка списка в CSV или XLSX (GET .../export/?file_format=csv).
+
+    Применяются те же фильтры и сортировка, что и в списке. Строки
+    выбираются через .values_list() серверным курсором частями по
+    EXPORT_CHUNK_SIZE и отдаются потоковым ответом, поэтому память не
+    растет с количеством строк.
+
+    Поля задаются аттрибутом export_fields: путь поля для .values_list()
+    и заголовок столбца.
+    """
+
+    export_fields: dict[str, str] = {}
+    export_filename = 'export'
+
+    @extend_schema(
+        summary='Выгрузка списка в файл',
+        filters=True,
+        parameters=[
+            OpenApiParameter(
+                name=EXPORT_FORMAT_QUERY_PARAM,
+                type=str,
+                enum=ExportFormat.values,
+                description='Формат файла (по умолчанию csv)',
+            ),
+        ],
+        responses={
+            (200, content_type.split(';')[0]): OpenApiTypes.BINARY
+            for content_type in CONTENT_TYPES.values()
+        },
+    )
+    @action(
+        detail=False,
+        methods=['GET'],
+        url_path='export',
+        url_name='export',
+        pagination_class=None,
+    )
+    def export(self, request, *args, **kwargs):
+        """
+        Выгрузка списка в файл с учетом фильтров и сортировки списка.
+        """
+
+        file_format = request.query_params.get(
+            EXPORT_FORMAT_QUERY_PARAM, ExportFormat.CSV
+        )
+        if file_format not in ExportFormat.values:
+            raise ValidationError(
+                {EXPORT_FORMAT_QUERY_PARAM: ['Неизвестный формат файла']}
+            )
+
+        queryset = self.filter_queryset(self.get_queryset())
+        header = list(self.export_fields.values())
+        iter_file = iter_xlsx if file_format == ExportFormat.XLSX else iter_csv
+        response = StreamingHttpResponse(
+            iter_file(header, self.get_export_rows(queryset)),
+            content_type=CONTENT_TYPES[file_format],
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="{self.export_filename}.{file_format}"'
+        )
+
+        return response
+
+    def get_export_rows(self, queryset) -> Iterator[tuple]:
+        """Строки выгрузки с названиями вариантов вместо значений."""
+
+        lookups = list(self.export_fields)
+        converters = [
+            (index, converter)
+            for index, lookup in enumerate(lookups)
+            if (converter := get_choices_converter(queryset.model, lookup))
+        ]
+        rows = queryset.values_list(*lookups).iterator(
+            chunk_size=settings.EXPORT_CHUNK_SIZE
+        )
+        for row in rows:
+            if converters:
+                row = list(row)
+                for index, converter in converters:
+                    row[index] = converter(row[index])
+            yield row
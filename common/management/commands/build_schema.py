@@ -0,0 +1,18 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from common.schema import schema_cache
+
+
+class Command(BaseCommand):
+    help = (
+        'Генерация схемы OpenAPI в файлы SCHEMA_CACHE_DIR. '
+        'Запускается при деплое, чтобы схема не строилась по запросу.'
+    )
+
+    def handle(self, *args, **options):
+        if not settings.SCHEMA_CACHE_DIR:
+            raise CommandError('Не задана настройка SCHEMA_CACHE_DIR')
+
+        for path in schema_cache.build():
+            self.stdout.write(self.style.SUCCESS(f'Схема сохранена: {path}'))
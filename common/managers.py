@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from django.utils.timezone import now
+
 from common.utils import get_user_full_name_annotation
 
 
@@ -10,7 +12,8 @@ class UserFullNameAnnotationMixin(ABC):
     полным именем пользователя.
 
     Для корректной работы необходимо добавить к классу-наследнику аттрибут
-    user_field_name с путем до поля user.
+    user_field_name с путем до поля user. Для кверисета самой модели
+    пользователя аттрибут равен None - ФИО уже хранится в поле full_name.
     """
 
     @property
@@ -22,6 +25,20 @@ class UserFullNameAnnotationMixin(ABC):
         """Добавляет к кверисету аннотацию с ФИО пользователя."""
 
         field_name = self.user_field_name
-        user_lookup = '' if not field_name else f'{field_name}__'
+        if not field_name:
+            return self
+
+        return self.annotate(
+            **get_user_full_name_annotation(f'{field_name}__')
+        )
+
+
+class UpdatedAtQuerySetMixin:
+    """
+    Обновляет дату изменения записей при массовом редактировании
+    через QuerySet.update(), для которого auto_now не применяется.
+    """
 
-        return self.annotate(**get_user_full_name_annotation(user_lookup))
+    def update(self, **kwargs):
+        kwargs.setdefault('updated_at', now())
+        return super().update(**kwargs)
@@ -0,0 +1,173 @@
+import hmac
+import os
+import time
+from contextlib import ExitStack
+from http import HTTPMethod
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import HttpResponse
+from django.views import View
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.multiprocess import MultiProcessCollector
+
+# Метка запросов, для которых не найден маршрут
+UNRESOLVED_VIEW_NAME = '<unresolved>'
+# Метка запросов с нестандартным HTTP-методом. Метод задает клиент,
+# поэтому произвольные методы создавали бы неограниченное число рядов
+OTHER_METHOD = 'other'
+
+# Каталог с файлами метрик процессов. Задается переменной окружения
+# prometheus_client, которая читается при импорте библиотеки
+MULTIPROC_DIR_ENV = 'PROMETHEUS_MULTIPROC_DIR'
+
+if os.getenv(MULTIPROC_DIR_ENV):
+    os.makedirs(os.environ[MULTIPROC_DIR_ENV], exist_ok=True)
+
+LABELS = ('view', 'method')
+
+REQUESTS = Counter(
+    'tcms_http_requests_total',
+    'Количество запросов',
+    [*LABELS, 'status'],
+)
+REQUEST_DURATION = Histogram(
+    'tcms_http_request_duration_seconds',
+    'Время обработки запроса в секундах',
+    LABELS,
+)
+DB_QUERIES = Histogram(
+    'tcms_db_queries_per_request',
+    'Количество SQL-запросов на запрос',
+    LABELS,
+    buckets=(0, 1, 2, 3, 5, 8, 13, 20, 30, 50, 100, float('inf')),
+)
+DB_DURATION = Histogram(
+    'tcms_db_duration_seconds',
+    'Время выполнения SQL-запросов на запрос в секундах',
+    LABELS,
+)
+RESPONSE_SIZE = Histogram(
+    'tcms_http_response_size_bytes',
+    'Размер тела ответа в байтах',
+    LABELS,
+    buckets=tuple(4**power * 256 for power in range(8)) + (float('inf'),),
+)
+
+
+class QueryStats:
+    """
+    Обертка выполнения SQL-запросов (connection.execute_wrapper),
+    подсчитывающая количество и время запросов.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - start
+
+
+class MetricsMiddleware:
+    """
+    Сбор метрик запросов по имени маршрута и HTTP-методу: количество
+    запросов, время обработки, количество и время SQL-запросов, размер
+    ответа.
+
+    Должен быть первым в MIDDLEWARE, чтобы учитывать время остальных
+    middleware. Отключается настройкой METRICS_ENABLED.
+    """
+
+    def __init__(self, get_response) -> None:
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        stats = QueryStats()
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(stats))
+            response = self.get_response(request)
+        duration = time.perf_counter() - start
+
+        match = request.resolver_match
+        labels = {
+            'view': match.view_name if match else UNRESOLVED_VIEW_NAME,
+            'method': (
+                request.method
+                if request.method in HTTPMethod.__members__
+                else OTHER_METHOD
+            ),
+        }
+        REQUESTS.labels(**labels, status=response.status_code).inc()
+        REQUEST_DURATION.labels(**labels).observe(duration)
+        DB_QUERIES.labels(**labels).observe(stats.count)
+        DB_DURATION.labels(**labels).observe(stats.duration)
+        # Размер потокового ответа заранее неизвестен
+        if not response.streaming:
+            RESPONSE_SIZE.labels(**labels).observe(len(response.content))
+
+        return response
+
+
+def get_metrics_registry() -> CollectorRegistry:
+    """
+    Получение реестра метрик для выдачи.
+
+    При запуске в нескольких процессах (задан PROMETHEUS_MULTIPROC_DIR)
+    метрики всех процессов суммируются из файлов в каталоге, иначе
+    выдаются метрики текущего процесса.
+    """
+
+    if not os.getenv(MULTIPROC_DIR_ENV):
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    MultiProcessCollector(registry)
+
+    return registry
+
+
+class MetricsView(View):
+    """
+    Метрики в текстовом формате Prometheus.
+
+    Если задана настройка METRICS_TOKEN, запрос должен содержать
+    заголовок Authorization: Bearer <токен>. Без токена метрики доступны
+    только администраторам, авторизованным в панели администратора.
+    """
+
+    http_method_names = ['get']
+
+    def get(self, request):
+        token = settings.METRICS_TOKEN
+        if token:
+            if not hmac.compare_digest(
+                request.headers.get('Authorization', ''), f'Bearer {token}'
+            ):
+                return HttpResponse(status=401)
+        elif not request.user.is_authenticated:
+            return HttpResponse(status=401)
+        elif not request.user.is_staff:
+            return HttpResponse(status=403)
+
+        return HttpResponse(
+            generate_latest(get_metrics_registry()),
+            content_type=CONTENT_TYPE_LATEST,
+        )
@@ -15,3 +15,63 @@ class FullNameFilterMixin(filters.FilterSet):
         return qs.with_full_name_annotation().filter(
             full_name__icontains=value,
         )
+
+
+class CurrentRoleFilterMixin(filters.FilterSet):
+    """
+    Добавляет к классу с фильтрами фильтр по действующим ролям.
+
+    В списке по умолчанию показываются только действующие роли
+    (без даты окончания действия), что позволяет использовать частичные
+    индексы по условию date_to IS NULL. Для получения всей истории ролей
+    нужно передать current=false.
+    """
+
+    current = filters.BooleanFilter(
+        label='Только действующие роли', method='current_filter'
+    )
+
+    @staticmethod
+    def current_filter(qs, name, value):
+        """Фильтрация по действующим ролям."""
+
+        if value:
+            return qs.filter(date_to__isnull=True)
+        return qs
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+
+        # Значение по умолчанию применяется только к списку и его
+        # выгрузке, чтобы завершенные роли оставались доступны по id
+        if (
+            self.form.cleaned_data.get('current') is None
+            and self._is_list_action()
+        ):
+            queryset = self.current_filter(queryset, 'current', True)
+        return queryset
+
+    def _is_list_action(self) -> bool:
+        """
+        Проверка, что фильтрация выполняется для получения списка или его
+        выгрузки в файл.
+        """
+
+        parser_context = getattr(self.request, 'parser_context', None) or {}
+        view = parser_context.get('view')
+        return getattr(view, 'action', None) in ('list', 'export')
+
+
+class UpdatedAtModelMixin:
+    """
+    Добавляет поле updated_at к сохраняемым полям, если при сохранении
+    модели передан update_fields, чтобы дата изменения обновлялась
+    и при частичном сохранении.
+    """
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'updated_at'}
+
+        return super().save(*args, **kwargs)
@@ -1,5 +1,537 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime, time
+from functools import partial
+from typing import Any
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, FieldError
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db.models import Q, QuerySet
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from common.choices import PaginationCountStrategy, PaginationMode
+
+
+class InexactCountPage(Page):
+    """
+    Страница пагинатора с неточным количеством записей.
+
+    Наличие следующей страницы определяется по лишней записи в выборке,
+    а не по общему количеству записей.
+    """
+
+    def __init__(self, object_list, number, paginator, has_next: bool):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self) -> bool:
+        return self._has_next
+
+
+class CountStrategyPaginator(Paginator):
+    """
+    Пагинатор с настраиваемой стратегией подсчета количества записей.
+
+    Стратегии:
+     - exact - точный COUNT(*);
+     - capped - точный подсчет не более count_cap записей, при превышении
+       порога количество считается неточным;
+     - estimated - оценка планировщика PostgreSQL (EXPLAIN), если она
+       больше порога, иначе подсчет как в capped.
+    """
+
+    def __init__(
+        self,
+        object_list,
+        per_page,
+        count_strategy: PaginationCountStrategy = (
+            PaginationCountStrategy.EXACT
+        ),
+        count_cap: int = 1000,
+        **kwargs,
+    ):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_strategy = count_strategy
+        self.count_cap = count_cap
+        self._count_is_exact = True
+
+    @cached_property
+    def count(self) -> int:
+        if self.count_strategy == PaginationCountStrategy.EXACT:
+            return super().count
+
+        if self.count_strategy == PaginationCountStrategy.ESTIMATED:
+            estimate = self._get_estimated_count()
+            if estimate > self.count_cap:
+                self._count_is_exact = False
+                return estimate
+
+        return self._get_capped_count()
+
+    @property
+    def count_is_exact(self) -> bool:
+        """
+        Является ли количество записей точным.
+
+        Признак выставляется при подсчете, поэтому сначала
+        вычисляется количество записей.
+        """
+
+        return self.count is not None and self._count_is_exact
+
+    def validate_number(self, number):
+        if self.count_is_exact:
+            return super().validate_number(number)
+
+        # При неточном количестве верхняя граница номера страницы неизвестна
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(
+                self.error_messages['invalid_page']
+            ) from None
+        if number < 1:
+            raise EmptyPage(self.error_messages['min_page'])
+
+        return number
+
+    def page(self, number):
+        if self.count_is_exact:
+            return super().page(number)
+
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        object_list = list(
+            self.object_list[bottom : bottom + self.per_page + 1]
+        )
+        if not object_list and number > 1:
+            raise EmptyPage(self.error_messages['no_results'])
+
+        return InexactCountPage(
+            object_list[: self.per_page],
+            number,
+            self,
+            has_next=len(object_list) > self.per_page,
+        )
+
+    def _get_capped_count(self) -> int:
+        """Подсчет количества записей, ограниченный порогом."""
+
+        count = self.object_list.order_by()[: self.count_cap + 1].count()
+        if count > self.count_cap:
+            self._count_is_exact = False
+            return self.count_cap
+
+        return count
+
+    def _get_estimated_count(self) -> int:
+        """Оценка количества записей планировщиком PostgreSQL."""
+
+        plan = json.loads(self.object_list.order_by().explain(format='json'))
+
+        return int(plan[0]['Plan']['Plan Rows'])
+
+
+class EstimatedCountPaginator(CountStrategyPaginator):
+    """
+    Пагинатор с оценкой количества записей планировщиком PostgreSQL
+    (стратегия estimated) и сигнатурой Paginator, для панели
+    администратора.
+    """
+
+    def __init__(
+        self, object_list, per_page, orphans=0, allow_empty_first_page=True
+    ):
+        super().__init__(
+            object_list,
+            per_page,
+            count_strategy=PaginationCountStrategy.ESTIMATED,
+            count_cap=settings.PAGINATION_COUNT_CAP,
+            orphans=orphans,
+            allow_empty_first_page=allow_empty_first_page,
+        )
 
 
 class PageSizePagination(PageNumberPagination):
+    """
+    Пагинация с возможностью указать размер страницы.
+
+    Поддерживает два режима:
+     - постраничный (по умолчанию) - номера страниц и общее количество
+       записей;
+     - курсорный (keyset) - следующая страница выбирается условием по
+       ключу текущей сортировки, поэтому глубокие страницы стоят столько
+       же, сколько первая, а общее количество записей не считается.
+
+    Режим задается параметром запроса pagination, а для эндпоинта - аттрибутом
+    pagination_mode представления. Передача параметра cursor также включает
+    курсорный режим.
+
+    Способ подсчета количества записей в постраничном режиме задается
+    аттрибутом pagination_count_strategy представления
+    (см. CountStrategyPaginator).
+    """
+
     page_size_query_param = 'page_size'
+
+    @property
+    def max_page_size(self) -> int:
+        # Без ограничения один запрос может выбрать всю таблицу. Для
+        # выгрузки списков целиком есть потоковые эндпоинты export
+        return settings.PAGINATION_MAX_PAGE_SIZE
+
+    django_paginator_class = CountStrategyPaginator
+
+    pagination_mode_query_param = 'pagination'
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Некорректный курсор'
+
+    # Поля, однозначно определяющие запись в сортировке
+    unique_ordering_fields = ('pk', 'id')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.pagination_mode = self.get_pagination_mode(request, view)
+        if self.pagination_mode == PaginationMode.CURSOR:
+            return self.paginate_queryset_by_cursor(queryset, request)
+
+        self.django_paginator_class = partial(
+            CountStrategyPaginator,
+            count_strategy=self.get_count_strategy(view),
+            count_cap=settings.PAGINATION_COUNT_CAP,
+        )
+
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.pagination_mode == PaginationMode.CURSOR:
+            return Response(
+                {
+                    'next': self.get_next_cursor_link(),
+                    'previous': self.get_previous_cursor_link(),
+                    'results': data,
+                }
+            )
+
+        return Response(
+            {
+                'count': self.page.paginator.count,
+                'count_is_exact': self.page.paginator.count_is_exact,
+                'next': self.get_next_link(),
+                'previous': self.get_previous_link(),
+                'results': data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties']['count_is_exact'] = {
+            'type': 'boolean',
+            'description': (
+                'Является ли количество записей точным. Если нет, count - '
+                'порог подсчета или оценка количества'
+            ),
+        }
+        # В курсорном режиме общее количество записей не возвращается
+        response_schema['required'] = ['results']
+
+        return response_schema
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                'name': self.pagination_mode_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Режим пагинации',
+                'schema': {
+                    'type': 'string',
+                    'enum': PaginationMode.values,
+                },
+            },
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Курсор страницы в курсорном режиме',
+                'schema': {
+                    'type': 'string',
+                },
+            },
+        ]
+
+    def get_pagination_mode(self, request, view=None) -> PaginationMode:
+        """
+        Определение режима пагинации.
+
+        Приоритет: параметр cursor, параметр pagination,
+        аттрибут pagination_mode представления.
+        """
+
+        if request.query_params.get(self.cursor_query_param):
+            return PaginationMode.CURSOR
+
+        mode = request.query_params.get(self.pagination_mode_query_param)
+        if mode in PaginationMode.values:
+            return PaginationMode(mode)
+
+        return getattr(view, 'pagination_mode', PaginationMode.PAGE)
+
+    @staticmethod
+    def get_count_strategy(view=None) -> PaginationCountStrategy:
+        """
+        Определение стратегии подсчета количества записей: аттрибут
+        pagination_count_strategy представления или настройка
+        PAGINATION_COUNT_STRATEGY.
+        """
+
+        return PaginationCountStrategy(
+            getattr(
+                view,
+                'pagination_count_strategy',
+                settings.PAGINATION_COUNT_STRATEGY,
+            )
+        )
+
+    # Курсорный режим
+
+    def paginate_queryset_by_cursor(
+        self, queryset: QuerySet, request
+    ) -> list | None:
+        """Получение страницы по курсору."""
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        ordering = self.get_keyset_ordering(queryset)
+        values, reverse = self.decode_cursor(request, ordering)
+
+        if reverse:
+            ordering = [self._invert_ordering(field) for field in ordering]
+        queryset = queryset.order_by(*ordering)
+
+        if values is not None:
+            try:
+                queryset = queryset.filter(
+                    self._get_seek_condition(ordering, values)
+                )
+            except (DjangoValidationError, FieldError, ValueError, TypeError):
+                raise NotFound(self.invalid_cursor_message) from None
+
+        # Одна лишняя запись показывает, есть ли страница дальше
+        results = list(queryset[: page_size + 1])
+        has_more = len(results) > page_size
+        results = results[:page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, values is not None
+
+        self.keyset_ordering = [
+            self._invert_ordering(field) if reverse else field
+            for field in ordering
+        ]
+        self.page_results = results
+
+        return results
+
+    def get_keyset_ordering(self, queryset: QuerySet) -> list[str]:
+        """
+        Получение ключа сортировки кверисета.
+
+        Если сортировка не гарантирует уникальность, в конец добавляется
+        первичный ключ.
+        """
+
+        ordering = list(
+            queryset.query.order_by or queryset.model._meta.ordering
+        )
+        if not all(isinstance(field, str) for field in ordering) or any(
+            field.lstrip('-') == '?' for field in ordering
+        ):
+            raise ValidationError(
+                'Курсорная пагинация не поддерживается для этой сортировки'
+            )
+
+        if nullable := [
+            field.lstrip('-')
+            for field in ordering
+            if self._is_nullable(queryset, field.lstrip('-'))
+        ]:
+            # Сравнение с NULL не выполняется ни для одной записи, поэтому
+            # такие записи терялись бы при переходе по курсору
+            raise ValidationError(
+                'Курсорная пагинация не поддерживается для сортировки по '
+                f'полям, допускающим пустые значения: {", ".join(nullable)}'
+            )
+
+        if not any(
+            field.lstrip('-') in self.unique_ordering_fields
+            for field in ordering
+        ):
+            descending = bool(ordering) and ordering[-1].startswith('-')
+            ordering.append('-pk' if descending else 'pk')
+
+        return ordering
+
+    def decode_cursor(
+        self, request, ordering: list[str]
+    ) -> tuple[list | None, bool]:
+        """
+        Декодирование курсора из параметров запроса.
+
+        :return: Значения ключа сортировки и признак движения назад.
+        """
+
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+
+        try:
+            cursor = json.loads(
+                base64.urlsafe_b64decode(encoded.encode('ascii'))
+            )
+            values, reverse = cursor['v'], bool(cursor.get('r'))
+        except (
+            binascii.Error,
+            json.JSONDecodeError,
+            UnicodeError,
+            KeyError,
+            TypeError,
+        ):
+            raise NotFound(self.invalid_cursor_message) from None
+
+        if not isinstance(values, list) or len(values) != len(ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        return values, reverse
+
+    def encode_cursor(self, instance: Any, reverse: bool) -> str:
+        """Кодирование курсора по значениям ключа сортировки записи."""
+
+        values = [
+            self._get_ordering_value(instance, field.lstrip('-'))
+            for field in self.keyset_ordering
+        ]
+        cursor = json.dumps(
+            {'v': values, 'r': int(reverse)},
+            default=self._serialize_value,
+            separators=(',', ':'),
+        )
+
+        return base64.urlsafe_b64encode(cursor.encode('utf-8')).decode('ascii')
+
+    def get_next_cursor_link(self) -> str | None:
+        if not self.has_next or not self.page_results:
+            return None
+
+        cursor = self.encode_cursor(self.page_results[-1], reverse=False)
+        return self._get_cursor_link(cursor)
+
+    def get_previous_cursor_link(self) -> str | None:
+        if not self.has_previous or not self.page_results:
+            return None
+
+        cursor = self.encode_cursor(self.page_results[0], reverse=True)
+        return self._get_cursor_link(cursor)
+
+    def _get_cursor_link(self, cursor: str) -> str:
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.page_query_param)
+        url = replace_query_param(
+            url, self.pagination_mode_query_param, PaginationMode.CURSOR
+        )
+
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    @staticmethod
+    def _get_seek_condition(ordering: list[str], values: list) -> Q:
+        """
+        Условие выборки записей, следующих за курсором.
+
+        Строится как лексикографическое сравнение кортежа ключа сортировки:
+        (a > x) OR (a = x AND b > y) OR ...
+
+        Цепочку OR PostgreSQL не использует как границу диапазона индекса,
+        поэтому к ней добавляется избыточное условие на первое поле ключа
+        (a >= x): индекс читается с позиции курсора, а не с начала.
+        """
+
+        condition, equal = Q(), Q()
+        for field, value in zip(ordering, values, strict=True):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            condition |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+
+        if len(ordering) > 1:
+            name = ordering[0].lstrip('-')
+            lookup = 'lte' if ordering[0].startswith('-') else 'gte'
+            condition &= Q(**{f'{name}__{lookup}': values[0]})
+
+        return condition
+
+    @staticmethod
+    def _is_nullable(queryset: QuerySet, field: str) -> bool:
+        """
+        Может ли поле сортировки принимать значение NULL, в т.ч. из-за
+        необязательной связи на пути к полю.
+        """
+
+        if field in queryset.query.annotations:
+            output_field = queryset.query.annotations[field].output_field
+            return getattr(output_field, 'null', True)
+
+        model, nullable = queryset.model, False
+        for part in field.split('__'):
+            try:
+                model_field = (
+                    model._meta.pk
+                    if part == 'pk'
+                    else model._meta.get_field(part)
+                )
+            except FieldDoesNotExist:
+                return True
+            nullable = nullable or model_field.null
+            if model_field.related_model is not None:
+                model = model_field.related_model
+
+        return nullable
+
+    @staticmethod
+    def _get_ordering_value(instance: Any, field: str) -> Any:
+        """Получение значения поля сортировки, в т.ч. через связи."""
+
+        # Строка выборки .values()
+        if isinstance(instance, dict):
+            return instance[field]
+
+        value = instance
+        for part in field.split('__'):
+            value = getattr(value, part)
+
+        return value
+
+    @staticmethod
+    def _invert_ordering(field: str) -> str:
+        return field[1:] if field.startswith('-') else f'-{field}'
+
+    @staticmethod
+    def _serialize_value(value: Any) -> str:
+        # Даты сериализуются с микросекундами, чтобы не терять точность ключа
+        if isinstance(value, date | datetime | time):
+            return value.isoformat()
+        return str(value)
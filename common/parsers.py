@@ -0,0 +1,31 @@
+import codecs
+
+import orjson
+from django.conf import settings
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+
+from common.renderers import ORJSONRenderer
+
+
+class ORJSONParser(parsers.JSONParser):
+    """
+    Парсер JSON на orjson.
+
+    Тело запроса в кодировке, отличной от UTF-8, разбирается
+    стандартным JSONParser.
+    """
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get(
+            'encoding', settings.DEFAULT_CHARSET
+        )
+        if codecs.lookup(encoding).name != 'utf-8':
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f'JSON parse error - {exc}') from None
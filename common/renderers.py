@@ -0,0 +1,54 @@
+import orjson
+from rest_framework import renderers
+from rest_framework.utils import encoders
+
+# Разделители строк, которые JSONRenderer экранирует, чтобы JSON
+# оставался подмножеством JavaScript
+LINE_SEPARATORS = (
+    ('\u2028'.encode(), b'\\u2028'),
+    ('\u2029'.encode(), b'\\u2029'),
+)
+
+
+class ORJSONRenderer(renderers.JSONRenderer):
+    """
+    Рендерер JSON на orjson.
+
+    Результат совпадает с JSONRenderer: даты и время, Decimal, ленивые
+    строки перевода и прочие типы, которые orjson не поддерживает,
+    преобразуются кодировщиком DRF, а TextChoices сериализуются
+    значением. Ответы с отступами (например, для BrowsableAPIRenderer)
+    и ответы с экранированием не-ASCII символов формируются
+    стандартным JSONRenderer.
+    """
+
+    options = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+    def __init__(self) -> None:
+        self._default = encoders.JSONEncoder().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data, default=self._default, option=self.options
+            )
+        except orjson.JSONEncodeError:
+            # Например, целые числа больше 64 бит
+            return super().render(data, accepted_media_type, renderer_context)
+
+        for separator, escaped in LINE_SEPARATORS:
+            if separator in ret:
+                ret = ret.replace(separator, escaped)
+
+        return ret
@@ -0,0 +1,245 @@
+import hashlib
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import transaction
+from django.http import HttpResponse, HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date
+from django.utils.timezone import localdate
+
+# Алиас кеша ответов в CACHES
+RESPONSE_CACHE_ALIAS = 'responses'
+
+# Заголовки ответа, которые сохраняются в кеше
+CACHED_HEADERS = ('ETag', 'Last-Modified', 'Cache-Control')
+
+# Заголовок с результатом обращения к кешу
+CACHE_STATUS_HEADER = 'X-Cache'
+
+
+class ResponseCache:
+    """
+    Кеш отрендеренных ответов API с инвалидацией по версии.
+
+    Ответы хранятся в кеше RESPONSE_CACHE_ALIAS (бэкенд задается
+    настройкой RESPONSE_CACHE_BACKEND) по ключу из параметров запроса
+    со временем жизни по умолчанию для этого кеша (TIMEOUT в CACHES).
+    При инвалидации меняется версия кеша, и сохраненные ответы
+    становятся устаревшими. Устаревший ответ перестраивает один запрос
+    (под блокировкой в кеше), а остальные запросы в это время получают
+    устаревший ответ, если с инвалидации прошло не больше
+    RESPONSE_CACHE_STALE_TTL секунд (stale-while-revalidate).
+    """
+
+    def __init__(self, key_prefix: str) -> None:
+        """
+        :param key_prefix: Префикс ключей кеша. У каждого префикса
+            своя версия и инвалидация.
+        """
+
+        self.key_prefix = key_prefix
+
+    @property
+    def cache(self):
+        return caches[RESPONSE_CACHE_ALIAS]
+
+    @property
+    def version_key(self) -> str:
+        return f'{self.key_prefix}:version'
+
+    def get_response(
+        self, request, key: str, build: Callable[[], HttpResponseBase]
+    ) -> HttpResponseBase:
+        """
+        Получение ответа из кеша или построение нового.
+
+        :param request: Запрос.
+        :param key: Ключ ответа (см. get_key).
+        :param build: Функция построения отрендеренного ответа.
+        """
+
+        key = f'{self.key_prefix}:{key}'
+        cached = self.cache.get_many([self.version_key, key])
+        version = cached.get(self.version_key)
+        if version is None:
+            # Версия могла быть вытеснена из кеша, поэтому все
+            # сохраненные ответы считаются устаревшими
+            version = self._init_version()
+        entry = cached.get(key)
+
+        if entry is not None and entry['version'] == version:
+            return self._get_cached_response(request, entry, 'HIT')
+
+        if entry is not None:
+            lock_key = f'{key}:lock'
+            if self.cache.add(
+                lock_key, 1, settings.RESPONSE_CACHE_LOCK_TIMEOUT
+            ):
+                try:
+                    return self._build(key, version, build)
+                finally:
+                    self.cache.delete(lock_key)
+
+            # Ответ уже перестраивается другим запросом
+            if time.time() - version < settings.RESPONSE_CACHE_STALE_TTL:
+                return self._get_cached_response(request, entry, 'STALE')
+
+        return self._build(key, version, build)
+
+    def invalidate(self) -> None:
+        """
+        Инвалидация всех ответов с префиксом кеша.
+
+        Версия меняется сразу и повторно после фиксации транзакции,
+        чтобы ответ, построенный до фиксации по старым данным,
+        не считался актуальным.
+        """
+
+        self._set_version()
+        transaction.on_commit(self._set_version)
+
+    def clear(self) -> None:
+        """Очистка кеша ответов."""
+
+        self.cache.clear()
+
+    @staticmethod
+    def get_key(request, *parts: Any) -> str:
+        """
+        Построение ключа ответа по нормализованным параметрам запроса.
+
+        Параметры сортируются, поэтому порядок параметров в запросе
+        не влияет на ключ. Ключ учитывает текущую дату, так как часть
+        полей ответа зависит от даты.
+
+        :param parts: Дополнительные части ключа (действие, id записи).
+        """
+
+        value = json.dumps(
+            [
+                parts,
+                sorted(
+                    (name, sorted(values))
+                    for name, values in request.GET.lists()
+                ),
+                request.accepted_renderer.media_type,
+                localdate().isoformat(),
+            ],
+            default=str,
+        )
+
+        return hashlib.sha1(value.encode()).hexdigest()
+
+    def _build(
+        self, key: str, version: float, build: Callable[[], HttpResponseBase]
+    ) -> HttpResponseBase:
+        """Построение ответа и сохранение в кеш."""
+
+        response = build()
+        if response.status_code == 200:
+            self.cache.set(
+                key,
+                {
+                    'version': version,
+                    'content': response.content,
+                    'content_type': response['Content-Type'],
+                    'headers': {
+                        name: response[name]
+                        for name in CACHED_HEADERS
+                        if name in response
+                    },
+                },
+                DEFAULT_TIMEOUT,
+            )
+            response[CACHE_STATUS_HEADER] = 'MISS'
+
+        return response
+
+    @staticmethod
+    def _get_cached_response(
+        request, entry: dict, cache_status: str
+    ) -> HttpResponseBase:
+        """Ответ из кеша с учетом условных заголовков запроса."""
+
+        headers = entry['headers']
+        last_modified = headers.get('Last-Modified')
+        response = get_conditional_response(
+            request,
+            etag=headers.get('ETag'),
+            last_modified=last_modified and parse_http_date(last_modified),
+        )
+        if response is None:
+            response = HttpResponse(
+                entry['content'], content_type=entry['content_type']
+            )
+
+        for name, value in headers.items():
+            response[name] = value
+        response[CACHE_STATUS_HEADER] = cache_status
+
+        return response
+
+    def _set_version(self) -> None:
+        self.cache.set(self.version_key, time.time(), DEFAULT_TIMEOUT)
+
+    def _init_version(self) -> float:
+        """Создание версии кеша, если ее нет."""
+
+        version = time.time()
+        if not self.cache.add(self.version_key, version, DEFAULT_TIMEOUT):
+            version = self.cache.get(self.version_key, version)
+
+        return version
+
+
+class ResponseCacheMixin:
+    """
+    Кеширование ответов списка и детального просмотра.
+
+    Кеш задается аттрибутом response_cache представления, а его
+    инвалидация - кодом, изменяющим данные ответов. Отключается
+    настройкой RESPONSE_CACHE_ENABLED.
+    """
+
+    response_cache: ResponseCache
+
+    def list(self, request, *args, **kwargs):
+        return self._get_cached_response(
+            request,
+            lambda: super(ResponseCacheMixin, self).list(
+                request, *args, **kwargs
+            ),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._get_cached_response(
+            request,
+            lambda: super(ResponseCacheMixin, self).retrieve(
+                request, *args, **kwargs
+            ),
+        )
+
+    def _get_cached_response(self, request, get_response):
+        if not settings.RESPONSE_CACHE_ENABLED:
+            return get_response()
+
+        def build():
+            # Ответ рендерится сразу, чтобы сохранить его в кеш
+            response = self.finalize_response(request, get_response())
+            if hasattr(response, 'render'):
+                response.render()
+            return response
+
+        return self.response_cache.get_response(
+            request,
+            self.response_cache.get_key(
+                request, self.action, sorted(self.kwargs.items())
+            ),
+            build,
+        )
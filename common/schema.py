@@ -0,0 +1,239 @@
+import gzip
+import hashlib
+import threading
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from drf_spectacular.renderers import OpenApiJsonRenderer, OpenApiYamlRenderer
+from drf_spectacular.settings import spectacular_settings
+from drf_spectacular.utils import extend_schema
+from drf_spectacular.views import SCHEMA_KWARGS, SpectacularAPIView
+
+# Рендереры схемы по формату
+SCHEMA_RENDERERS = {
+    'yaml': OpenApiYamlRenderer,
+    'json': OpenApiJsonRenderer,
+}
+
+# Каталоги проекта с кодом, от которого зависит схема
+SCHEMA_SOURCE_DIRS = ('apps', 'common', 'configs')
+
+
+@cache
+def get_source_hash() -> str:
+    """
+    Хеш исходного кода проекта.
+
+    Входит в имя файла схемы, чтобы после деплоя с изменениями
+    сериализаторов или представлений без смены VERSION не отдавалась
+    схема, сохраненная предыдущей версией кода.
+    """
+
+    digest = hashlib.sha256()
+    base_dir = Path(settings.BASE_DIR)
+    for directory in SCHEMA_SOURCE_DIRS:
+        for path in sorted((base_dir / directory).rglob('*.py')):
+            digest.update(str(path.relative_to(base_dir)).encode())
+            digest.update(path.read_bytes())
+
+    return digest.hexdigest()[:16]
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """
+    Поддерживает ли клиент сжатие gzip по заголовку Accept-Encoding.
+
+    Учитываются веса (q): gzip;q=0 означает отказ от gzip.
+    """
+
+    weights = {}
+    for item in accept_encoding.split(','):
+        coding, *params = (part.strip() for part in item.split(';'))
+        if not coding:
+            continue
+        weight = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding.lower()] = weight
+
+    return weights.get('gzip', weights.get('*', 0.0)) > 0
+
+
+@dataclass(frozen=True)
+class RenderedSchema:
+    """Отрендеренная схема OpenAPI в одном из форматов."""
+
+    content: bytes
+    gzipped: bytes
+    etag: str
+    gzipped_etag: str
+
+    @classmethod
+    def from_content(cls, content: bytes) -> 'RenderedSchema':
+        digest = hashlib.sha256(content).hexdigest()
+        return cls(
+            content=content,
+            gzipped=gzip.compress(content, compresslevel=9, mtime=0),
+            etag=f'"{digest}"',
+            gzipped_etag=f'"{digest}-gzip"',
+        )
+
+
+class SchemaCache:
+    """
+    Кеш схемы OpenAPI.
+
+    Схема строится один раз на процесс: при первом запросе берется
+    из файла в SCHEMA_CACHE_DIR (его создает команда build_schema при
+    деплое), а если файла нет - генерируется и сохраняется в память
+    и в файл. Имя файла содержит версию приложения и хеш исходного кода,
+    поэтому файл предыдущей версии кода не используется.
+    """
+
+    def __init__(self) -> None:
+        self._schemas: dict[str, RenderedSchema] = {}
+        self._lock = threading.Lock()
+
+    def get(self, schema_format: str) -> RenderedSchema:
+        """
+        Получение схемы в нужном формате.
+
+        :param schema_format: Формат схемы (yaml или json).
+        """
+
+        schema = self._schemas.get(schema_format)
+        if schema is not None:
+            return schema
+
+        with self._lock:
+            if schema_format not in self._schemas:
+                content = self._read(schema_format)
+                if content is None:
+                    content = self.render(self.generate(), schema_format)
+                    self._write(schema_format, content)
+                self._schemas[schema_format] = RenderedSchema.from_content(
+                    content
+                )
+
+            return self._schemas[schema_format]
+
+    def build(self) -> list[Path]:
+        """
+        Генерация схемы во всех форматах и сохранение в файлы.
+
+        :return: Пути к созданным файлам.
+        """
+
+        schema = self.generate()
+        paths = []
+        for schema_format in SCHEMA_RENDERERS:
+            content = self.render(schema, schema_format)
+            paths.append(self._write(schema_format, content))
+            self._schemas[schema_format] = RenderedSchema.from_content(content)
+
+        return paths
+
+    def clear(self) -> None:
+        """Очистка кеша процесса."""
+
+        with self._lock:
+            self._schemas.clear()
+
+    @staticmethod
+    def generate() -> dict:
+        """Генерация схемы OpenAPI."""
+
+        generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+        return generator.get_schema(request=None, public=True)
+
+    @staticmethod
+    def render(schema: dict, schema_format: str) -> bytes:
+        """Рендеринг схемы в нужный формат."""
+
+        return SCHEMA_RENDERERS[schema_format]().render(
+            schema, renderer_context={}
+        )
+
+    @staticmethod
+    def get_path(schema_format: str) -> Path | None:
+        """Путь к файлу схемы для текущей версии кода приложения."""
+
+        if not settings.SCHEMA_CACHE_DIR:
+            return None
+
+        version = spectacular_settings.VERSION or 'latest'
+        return Path(settings.SCHEMA_CACHE_DIR) / (
+            f'schema-{version}-{get_source_hash()}.{schema_format}'
+        )
+
+    def _read(self, schema_format: str) -> bytes | None:
+        """Чтение схемы из файла."""
+
+        path = self.get_path(schema_format)
+        if path is None or not path.is_file():
+            return None
+
+        return path.read_bytes()
+
+    def _write(self, schema_format: str, content: bytes) -> Path | None:
+        """Сохранение схемы в файл."""
+
+        path = self.get_path(schema_format)
+        if path is None:
+            return None
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Запись через временный файл, чтобы параллельные процессы
+        # не прочитали файл частично
+        tmp_path = path.with_suffix(f'{path.suffix}.tmp')
+        tmp_path.write_bytes(content)
+        tmp_path.replace(path)
+
+        return path
+
+
+schema_cache = SchemaCache()
+
+
+class CachedSpectacularAPIView(SpectacularAPIView):
+    """
+    Схема OpenAPI из кеша.
+
+    Отдается со строгим ETag (ответ 304 при совпадении If-None-Match)
+    и сжатием gzip, если клиент его поддерживает.
+    """
+
+    @extend_schema(**SCHEMA_KWARGS)
+    def get(self, request, *args, **kwargs):
+        if not settings.SCHEMA_CACHE_ENABLED:
+            return super().get(request, *args, **kwargs)
+
+        renderer = request.accepted_renderer
+        schema = schema_cache.get(renderer.format)
+
+        use_gzip = accepts_gzip(request.headers.get('Accept-Encoding', ''))
+        etag = schema.gzipped_etag if use_gzip else schema.etag
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(
+                schema.gzipped if use_gzip else schema.content,
+                content_type=renderer.media_type,
+            )
+            if use_gzip:
+                response['Content-Encoding'] = 'gzip'
+
+        response['ETag'] = etag
+        response['Cache-Control'] = 'no-cache'
+        patch_vary_headers(response, ['Accept', 'Accept-Encoding'])
+
+        return response
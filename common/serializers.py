@@ -0,0 +1,269 @@
+from rest_framework import serializers
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.permissions import SAFE_METHODS
+
+# Дерево запрошенных полей: имя поля - дерево вложенных полей.
+# Пустой словарь означает поле целиком
+FieldTree = dict[str, 'FieldTree']
+
+FIELDS_QUERY_PARAM = 'fields'
+EXPAND_QUERY_PARAM = 'expand'
+
+
+def parse_field_tree(value: str | None) -> FieldTree | None:
+    """
+    Разбор параметра со списком полей.
+
+    'id,group.name,group.coach' -> {'id': {}, 'group': {'name': {},
+    'coach': {}}}
+
+    :param value: Значение параметра запроса.
+    :return: Дерево полей или None, если параметр не передан.
+    """
+
+    if value is None:
+        return None
+
+    tree: FieldTree = {}
+    for path in value.split(','):
+        node = tree
+        for name in path.strip().split('.'):
+            if name:
+                node = node.setdefault(name, {})
+
+    return tree
+
+
+def get_field_trees(request) -> tuple[FieldTree | None, FieldTree | None]:
+    """
+    Получение деревьев полей из параметров fields и expand запроса.
+
+    Параметры применяются только к запросам на чтение, чтобы не менять
+    набор полей, которые принимает сериализатор при записи.
+    """
+
+    if request is None or request.method not in SAFE_METHODS:
+        return None, None
+
+    query_params = getattr(request, 'query_params', request.GET)
+    return (
+        parse_field_tree(query_params.get(FIELDS_QUERY_PARAM)),
+        parse_field_tree(query_params.get(EXPAND_QUERY_PARAM)),
+    )
+
+
+def get_subtree(tree: FieldTree | None, path: list[str]) -> FieldTree | None:
+    """
+    Получение поддерева по пути.
+
+    :return: Поддерево или None, если путь не ограничен (дерево не
+        передано или поле на пути запрошено целиком).
+    """
+
+    for name in path:
+        if not tree:
+            return None
+        tree = tree.get(name, {})
+
+    return tree or None
+
+
+class DynamicFieldsSerializerMixin:
+    """
+    Добавляет к сериализатору поддержку параметров fields и expand.
+
+    - fields=id,group.name - вернуть только перечисленные поля, в том
+      числе поля вложенных сериализаторов через точку;
+    - expand=group,group.coach - раскрыть только перечисленные связи,
+      остальные вложенные сериализаторы возвращаются как id.
+
+    Без параметров возвращаются все поля и все связи раскрыты.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+
+        fields_tree, expand_tree = get_field_trees(self.context.get('request'))
+        if fields_tree is None and expand_tree is None:
+            return fields
+
+        path = self._get_field_path()
+        fields_subtree = get_subtree(fields_tree, path)
+        if fields_subtree is not None:
+            fields = {
+                name: field
+                for name, field in fields.items()
+                if name in fields_subtree or field.write_only
+            }
+
+        for name, field in fields.items():
+            if not self.is_expanded(
+                fields_tree, expand_tree, [*path, name], field
+            ):
+                fields[name] = self._get_collapsed_field(name, field)
+
+        return fields
+
+    @staticmethod
+    def is_expanded(
+        fields_tree: FieldTree | None,
+        expand_tree: FieldTree | None,
+        path: list[str],
+        field: serializers.Field,
+    ) -> bool:
+        """
+        Проверка, что связь раскрывается вложенным сериализатором.
+
+        Связь раскрыта, если параметр expand не передан, если связь
+        перечислена в expand или если в fields запрошены ее поля.
+        """
+
+        nested = get_nested_serializer(field)
+        if not isinstance(nested, DynamicFieldsSerializerMixin):
+            return True
+        if expand_tree is None or _has_path(expand_tree, path):
+            return True
+
+        return get_subtree(fields_tree, path) is not None
+
+    @classmethod
+    def get_select_related(
+        cls,
+        fields_tree: FieldTree | None,
+        expand_tree: FieldTree | None,
+        path: list[str] | None = None,
+    ) -> list[str]:
+        """
+        Получение связей для select_related по запрошенным полям.
+
+        :return: Пути связей в формате select_related.
+        """
+
+        path = path or []
+        model = cls.Meta.model
+        fields_subtree = get_subtree(fields_tree, path)
+
+        related = []
+        for name, field in cls._declared_fields.items():
+            nested = get_nested_serializer(field)
+            if not isinstance(nested, DynamicFieldsSerializerMixin):
+                continue
+            if fields_subtree is not None and name not in fields_subtree:
+                continue
+            if not cls.is_expanded(
+                fields_tree, expand_tree, [*path, name], field
+            ):
+                continue
+
+            source = field.source or name
+            model_field = model._meta.get_field(source)
+            if not (model_field.many_to_one or model_field.one_to_one):
+                continue
+
+            related.append(source)
+            related.extend(
+                f'{source}__{nested_path}'
+                for nested_path in type(nested).get_select_related(
+                    fields_tree, expand_tree, [*path, name]
+                )
+            )
+
+        return related
+
+    def _get_field_path(self) -> list[str]:
+        """Путь к сериализатору от корневого сериализатора."""
+
+        path = []
+        node = self
+        while node.parent is not None:
+            if node.field_name:
+                path.append(node.field_name)
+            node = node.parent
+
+        return path[::-1]
+
+    @staticmethod
+    def _get_collapsed_field(
+        name: str, field: serializers.Field
+    ) -> serializers.Field:
+        """Замена вложенного сериализатора на id связанной записи."""
+
+        kwargs = {}
+        if field.source not in (None, name):
+            kwargs['source'] = field.source
+
+        return serializers.PrimaryKeyRelatedField(
+            label=field.label,
+            many=isinstance(field, serializers.ListSerializer),
+            read_only=True,
+            **kwargs,
+        )
+
+
+def get_nested_serializer(field: serializers.Field) -> serializers.Field:
+    """Получение вложенного сериализатора поля (с учетом many=True)."""
+
+    if isinstance(field, serializers.ListSerializer):
+        return field.child
+    return field
+
+
+def _has_path(tree: FieldTree, path: list[str]) -> bool:
+    """Проверка наличия пути в дереве полей."""
+
+    for name in path:
+        if name not in tree:
+            return False
+        tree = tree[name]
+
+    return True
+
+
+class DynamicFieldsFilterBackend(BaseFilterBackend):
+    """
+    Убирает из select_related связи, которые не запрошены
+    параметрами fields и expand.
+
+    Без параметров кверисет не меняется.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        serializer_class = view.get_serializer_class()
+        if not issubclass(serializer_class, DynamicFieldsSerializerMixin):
+            return queryset
+
+        fields_tree, expand_tree = get_field_trees(request)
+        if fields_tree is None and expand_tree is None:
+            return queryset
+
+        queryset = queryset.select_related(None)
+        related = serializer_class.get_select_related(fields_tree, expand_tree)
+        if related:
+            queryset = queryset.select_related(*related)
+
+        return queryset
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': FIELDS_QUERY_PARAM,
+                'required': False,
+                'in': 'query',
+                'description': (
+                    'Поля ответа через запятую, поля вложенных объектов - '
+                    'через точку (например, id,group.name)'
+                ),
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': EXPAND_QUERY_PARAM,
+                'required': False,
+                'in': 'query',
+                'description': (
+                    'Раскрываемые связи через запятую (например, '
+                    'group,group.coach). Нераскрытые связи возвращаются '
+                    'как id. Если параметр не передан, раскрыты все связи'
+                ),
+                'schema': {'type': 'string'},
+            },
+        ]
@@ -1,34 +1,61 @@
+from django.db import IntegrityError
 from django.db.models import Case, CharField, F, Q, Value, When
 from django.db.models.functions import Concat
 
 
+def get_full_name_expression(user_lookup: str = '') -> Concat:
+    """
+    Создание выражения с ФИО пользователя, собираемого
+    из полей last_name, first_name и patronymic модели User.
+
+    Используется для генерируемого поля User.full_name.
+
+    :param user_lookup: Путь до объекта модели пользователя.
+    """
+
+    return Concat(
+        F(f'{user_lookup}last_name'),
+        Value(' '),
+        F(f'{user_lookup}first_name'),
+        Case(
+            When(
+                Q(**{f'{user_lookup}patronymic__isnull': True})
+                | Q(**{f'{user_lookup}patronymic': ''}),
+                then=Value(''),
+            ),
+            default=Concat(
+                Value(' '),
+                F(f'{user_lookup}patronymic'),
+            ),
+        ),
+        output_field=CharField(),
+    )
+
+
 def get_user_full_name_annotation(
     user_lookup: str, field='full_name'
-) -> dict[str, Concat]:
+) -> dict[str, F]:
     """
-    Создание аннотации 'full_name' с ФИО пользователя,
-    создаваемой из полей last_name, first_name и patronymic модели User.
+    Создание аннотации 'full_name' с ФИО пользователя.
+
+    ФИО хранится в генерируемом поле full_name модели User, поэтому
+    аннотация ссылается на колонку, а не вычисляет строку для каждой записи.
+    По колонке построен триграммный GIN-индекс, что позволяет использовать
+    его при поиске по подстроке.
 
     :param user_lookup: Путь до объекта модели пользователя.
     :param field: Наименования аннотированного поля.
     """
 
-    return {
-        field: Concat(
-            F(f'{user_lookup}last_name'),
-            Value(' '),
-            F(f'{user_lookup}first_name'),
-            Case(
-                When(
-                    Q(**{f'{user_lookup}patronymic__isnull': True})
-                    | Q(**{f'{user_lookup}patronymic': ''}),
-                    then=Value(''),
-                ),
-                default=Concat(
-                    Value(' '),
-                    F(f'{user_lookup}patronymic'),
-                ),
-            ),
-            output_field=CharField(),
-        )
-    }
+    return {field: F(f'{user_lookup}full_name')}
+
+
+def get_violated_constraint(exc: IntegrityError) -> str | None:
+    """
+    Получение имени нарушенного ограничения базы данных из ошибки
+    целостности (по диагностике psycopg).
+    """
+
+    diag = getattr(exc.__cause__, 'diag', None)
+
+    return getattr(diag, 'constraint_name', None)
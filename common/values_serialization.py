@@ -0,0 +1,277 @@
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.relations import ManyRelatedField
+from rest_framework.response import Response
+
+from common.serializers import EXPAND_QUERY_PARAM, FIELDS_QUERY_PARAM
+
+# Функция получения значения поля из строки .values()
+ValueGetter = Callable[[dict[str, Any]], Any]
+
+
+class UnsupportedFieldError(Exception):
+    """Поле сериализатора нельзя получить через .values()."""
+
+
+class ValuesMapper:
+    """
+    Скомпилированное отображение строки .values() в данные сериализатора.
+
+    Строится один раз по полям сериализатора: для каждого поля заранее
+    определяется путь в .values() и функция преобразования, поэтому
+    строка выборки превращается в данные ответа без создания экземпляров
+    моделей и обхода полей DRF. Результат совпадает
+    с serializer.to_representation().
+
+    Свойства модели поддерживаются только объявленные в аттрибуте
+    values_sources сериализатора: имя свойства - поля модели, из которых
+    оно вычисляется. Свойство вычисляется над объектом только с этими
+    полями. Для сериализаторов с необъявленными свойствами используется
+    стандартная сериализация.
+    """
+
+    def __init__(
+        self,
+        serializer: serializers.Serializer,
+        annotations: frozenset[str] = frozenset(),
+    ) -> None:
+        """
+        :param serializer: Сериализатор модели (не ListSerializer).
+        :param annotations: Аннотации кверисета. Поля корневого
+            сериализатора с источником из аннотаций берутся из колонки
+            аннотации, а не вычисляются свойством модели.
+        :raise UnsupportedFieldError: Если в сериализаторе есть поле,
+            которое нельзя получить через .values().
+        """
+
+        self.annotations = annotations
+        self.lookups: list[str] = []
+        self._getters = self._compile(serializer, prefix='')
+
+    def __call__(self, row: dict[str, Any]) -> dict[str, Any]:
+        return self._map(self._getters, row)
+
+    @staticmethod
+    def _map(getters, row: dict[str, Any]) -> dict[str, Any]:
+        return {name: getter(row) for name, getter in getters}
+
+    def _compile(
+        self, serializer: serializers.Serializer, prefix: str
+    ) -> list[tuple[str, ValueGetter]]:
+        """Компиляция полей сериализатора."""
+
+        getters = []
+        for field in serializer.fields.values():
+            if field.write_only:
+                continue
+            getters.append(
+                (
+                    field.field_name,
+                    self._compile_field(serializer, field, prefix),
+                )
+            )
+
+        return getters
+
+    def _compile_field(
+        self,
+        serializer: serializers.Serializer,
+        field: serializers.Field,
+        prefix: str,
+    ) -> ValueGetter:
+        """Компиляция одного поля сериализатора."""
+
+        model = serializer.Meta.model
+
+        if (
+            isinstance(
+                field,
+                serializers.ListSerializer
+                | ManyRelatedField
+                | serializers.SerializerMethodField,
+            )
+            or field.source == '*'
+            or '.' in field.source
+        ):
+            raise UnsupportedFieldError(field.field_name)
+
+        lookup = f'{prefix}{field.source}'
+
+        # Вложенный сериализатор связи: None, если связь не заполнена
+        if isinstance(field, serializers.Serializer):
+            self.lookups.append(lookup)
+            nested = self._compile(field, prefix=f'{lookup}__')
+            return lambda row: (
+                None if row[lookup] is None else self._map(nested, row)
+            )
+
+        # Связь в виде первичного ключа берется из колонки внешнего ключа
+        if isinstance(field, serializers.PrimaryKeyRelatedField):
+            self.lookups.append(lookup)
+            return lambda row: row[lookup]
+
+        try:
+            model_field = model._meta.get_field(field.source)
+        except FieldDoesNotExist:
+            if not prefix and field.source in self.annotations:
+                self.lookups.append(lookup)
+
+                def get_value(row):
+                    return row[lookup]
+
+            else:
+                get_value = self._compile_property(
+                    serializer, field.source, prefix
+                )
+        else:
+            if not model_field.concrete or model_field.many_to_many:
+                raise UnsupportedFieldError(field.field_name) from None
+            self.lookups.append(lookup)
+
+            def get_value(row):
+                return row[lookup]
+
+        to_representation = field.to_representation
+
+        def getter(row):
+            value = get_value(row)
+            return None if value is None else to_representation(value)
+
+        return getter
+
+    def _compile_property(
+        self, serializer: serializers.Serializer, name: str, prefix: str
+    ) -> ValueGetter:
+        """
+        Компиляция свойства модели, объявленного в values_sources
+        сериализатора.
+
+        Свойство вычисляется над объектом с объявленными полями модели.
+        """
+
+        model = serializer.Meta.model
+        sources = getattr(serializer, 'values_sources', {}).get(name)
+        prop = getattr(model, name, None)
+        if sources is None or not isinstance(prop, property):
+            raise UnsupportedFieldError(name)
+
+        columns = {}
+        for source in sources:
+            model_field = model._meta.get_field(source)
+            if not model_field.concrete or model_field.many_to_many:
+                raise UnsupportedFieldError(name)
+            columns[model_field.attname] = f'{prefix}{model_field.attname}'
+        self.lookups.extend(columns.values())
+
+        def get_value(row):
+            instance = SimpleNamespace(
+                **{attr: row[lookup] for attr, lookup in columns.items()}
+            )
+            return prop.fget(instance)
+
+        return get_value
+
+
+class ValuesListMixin:
+    """
+    Быстрое получение списка через .values().
+
+    Строки страницы выбираются через .values() и преобразуются
+    скомпилированным ValuesMapper без создания экземпляров моделей.
+    Ответ совпадает с ответом стандартного list(). Если сериализатор
+    содержит неподдерживаемые поля, используется стандартный list().
+    Отключается настройкой VALUES_LIST_ENABLED.
+    """
+
+    # Скомпилированные отображения сериализаторов без параметров
+    # fields и expand по классу сериализатора и аннотациям кверисета
+    _values_mappers: dict[
+        tuple[type, frozenset[str]], ValuesMapper | None
+    ] = {}
+
+    def values_extra_lookups(self, queryset) -> list[str]:
+        """
+        Дополнительные поля выборки, которые не входят в ответ
+        (например, для построения ETag).
+        """
+
+        return []
+
+    def list(self, request, *args, **kwargs):
+        if not settings.VALUES_LIST_ENABLED:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = self.get_serializer(many=True)
+        mapper = self.get_values_mapper(
+            serializer.child, frozenset(queryset.query.annotations)
+        )
+        if mapper is None:
+            return super().list(request, *args, **kwargs)
+
+        # Поля сортировки нужны пагинации для построения курсора
+        ordering = [
+            field.lstrip('-')
+            for field in queryset.query.order_by
+            if isinstance(field, str)
+        ]
+        queryset = queryset.values(
+            *dict.fromkeys(
+                [
+                    *mapper.lookups,
+                    *ordering,
+                    *self.values_extra_lookups(queryset),
+                    'pk',
+                ]
+            )
+        )
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response([mapper(row) for row in page])
+
+        return Response([mapper(row) for row in queryset])
+
+    def get_values_mapper(
+        self,
+        serializer: serializers.Serializer,
+        annotations: frozenset[str] = frozenset(),
+    ) -> ValuesMapper | None:
+        """
+        Получение скомпилированного отображения для сериализатора.
+
+        Отображение для набора полей по умолчанию кешируется, а для полей
+        из параметров fields и expand строится на каждый запрос, чтобы
+        параметры запроса не разрастали кеш.
+        """
+
+        query_params = self.request.query_params
+        if FIELDS_QUERY_PARAM in query_params or (
+            EXPAND_QUERY_PARAM in query_params
+        ):
+            return self._compile_values_mapper(serializer, annotations)
+
+        # Для кеша сериализатор создается без контекста, чтобы
+        # отображение не хранило ссылку на запрос
+        key = type(serializer), annotations
+        if key not in self._values_mappers:
+            self._values_mappers[key] = self._compile_values_mapper(
+                type(serializer)(), annotations
+            )
+
+        return self._values_mappers[key]
+
+    @staticmethod
+    def _compile_values_mapper(
+        serializer: serializers.Serializer,
+        annotations: frozenset[str],
+    ) -> ValuesMapper | None:
+        try:
+            return ValuesMapper(serializer, annotations)
+        except UnsupportedFieldError:
+            return None
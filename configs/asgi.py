@@ -1,7 +1,10 @@
 import os
 
+from common.db import log_database_connection_settings
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'configs.settings')
 
 application = get_asgi_application()
+
+log_database_connection_settings()
@@ -0,0 +1,93 @@
+"""
+Конфигурация gunicorn для запуска API в production.
+
+Запуск: gunicorn -c configs/gunicorn.conf.py configs.wsgi:application
+"""
+
+import logging
+import multiprocessing
+import os
+import shutil
+
+logger = logging.getLogger('gunicorn.error')
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:8000')
+
+# Количество воркеров (по умолчанию 2 * CPU + 1) и потоков в воркере.
+# При нескольких потоках используется воркер gthread
+workers = int(
+    os.getenv('GUNICORN_WORKERS', str(multiprocessing.cpu_count() * 2 + 1))
+)
+threads = int(os.getenv('GUNICORN_THREADS', '1'))
+worker_class = 'gthread' if threads > 1 else 'sync'
+
+# Приложение загружается в мастер-процессе до fork, чтобы воркеры
+# разделяли память с загруженным кодом
+preload_app = os.getenv('GUNICORN_PRELOAD', 'True').lower() == 'true'
+
+# Перезапуск воркера после заданного количества запросов ограничивает
+# рост потребляемой памяти. Разброс не дает воркерам перезапускаться
+# одновременно
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', '1000'))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', '100'))
+
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '30'))
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', '30'))
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', '5'))
+
+accesslog = os.getenv('GUNICORN_ACCESS_LOG', '-')
+errorlog = '-'
+loglevel = os.getenv('GUNICORN_LOG_LEVEL', 'info')
+
+
+def on_starting(server):
+    """
+    Подготовка каталога метрик и построение схемы OpenAPI
+    в мастер-процессе.
+
+    Метрики прошлого запуска удаляются, чтобы не суммироваться
+    с новыми. При загрузке приложения до fork воркеры получают уже
+    построенную схему и не генерируют ее по первому запросу.
+    """
+
+    metrics_dir = os.getenv('PROMETHEUS_MULTIPROC_DIR')
+    if metrics_dir:
+        shutil.rmtree(metrics_dir, ignore_errors=True)
+        os.makedirs(metrics_dir, exist_ok=True)
+
+    if not server.cfg.preload_app:
+        return
+
+    from django.conf import settings
+
+    if not settings.SCHEMA_CACHE_ENABLED:
+        return
+
+    from common.schema import schema_cache
+
+    try:
+        schema_cache.build()
+    except Exception:
+        logger.exception('Не удалось построить схему OpenAPI')
+
+
+def post_fork(server, worker):
+    """Закрытие соединений с БД, унаследованных от мастер-процесса."""
+
+    if not server.cfg.preload_app:
+        return
+
+    from django.db import connections
+
+    connections.close_all()
+
+
+def child_exit(server, worker):
+    """Пометка метрик завершенного воркера для prometheus_client."""
+
+    if not os.getenv('PROMETHEUS_MULTIPROC_DIR'):
+        return
+
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
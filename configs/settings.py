@@ -27,6 +27,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'drf_spectacular',
     'django_filters',
@@ -35,10 +36,13 @@ INSTALLED_APPS = [
 INSTALLED_APPS.extend([
     "apps.user.apps.UserConfig",
     'apps.training_process.apps.TrainingProcessConfig',
+    'common',
 ])
 
 
 MIDDLEWARE = [
+    # Первым, чтобы учитывать время остальных middleware
+    'common.metrics.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -83,21 +87,67 @@ DATABASES = {
     }
 }
 
+# Пул соединений psycopg 3. Без пула соединение открывается
+# на каждый запрос, если не задан DB_CONN_MAX_AGE
+DB_POOL_ENABLED = os.getenv('DB_POOL_ENABLED', 'True').lower() == 'true'
+if DB_POOL_ENABLED:
+    DATABASES['default']['OPTIONS'] = {
+        'pool': {
+            'min_size': int(os.getenv('DB_POOL_MIN_SIZE', '2')),
+            'max_size': int(os.getenv('DB_POOL_MAX_SIZE', '10')),
+            # Время ожидания свободного соединения, в секундах
+            'timeout': float(os.getenv('DB_POOL_TIMEOUT', '10')),
+            # Закрытие простаивающих и слишком старых соединений
+            'max_idle': float(os.getenv('DB_POOL_MAX_IDLE', '600')),
+            'max_lifetime': float(os.getenv('DB_POOL_MAX_LIFETIME', '3600')),
+        },
+    }
+else:
+    DATABASES['default']['CONN_MAX_AGE'] = int(
+        os.getenv('DB_CONN_MAX_AGE', '0')
+    )
+# Проверка соединения перед использованием (для пула - перед выдачей
+# соединения из пула)
+DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+
 REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.user.authentication.CachedJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend',
+        'common.serializers.DynamicFieldsFilterBackend',
     ],
     'DEFAULT_PAGINATION_CLASS': 'common.pagination.PageSizePagination',
     'PAGE_SIZE': 20,
+    # JSON кодируется и разбирается через orjson
+    'DEFAULT_RENDERER_CLASSES': [
+        'common.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'common.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
+# Стратегия подсчета общего количества записей в постраничной пагинации
+# (exact, capped, estimated), может быть переопределена в представлении
+PAGINATION_COUNT_STRATEGY = os.getenv('PAGINATION_COUNT_STRATEGY', 'exact')
+# Порог, до которого количество записей считается точно
+PAGINATION_COUNT_CAP = int(os.getenv('PAGINATION_COUNT_CAP', '1000'))
+# Максимальный размер страницы, который можно запросить параметром page_size
+PAGINATION_MAX_PAGE_SIZE = int(os.getenv('PAGINATION_MAX_PAGE_SIZE', '100'))
+
+# Количество строк, выбираемых серверным курсором за раз при выгрузке
+# списков в файл
+EXPORT_CHUNK_SIZE = int(os.getenv('EXPORT_CHUNK_SIZE', '2000'))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -118,6 +168,36 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Логирование
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'default': {
+            'format': '[{asctime}] [{process}] [{levelname}] {name}: {message}',
+            'style': '{',
+        },
+    },
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'default',
+        },
+    },
+    'loggers': {
+        'apps': {
+            'handlers': ['console'],
+            'level': os.getenv('LOG_LEVEL', 'INFO'),
+        },
+        'common': {
+            'handlers': ['console'],
+            'level': os.getenv('LOG_LEVEL', 'INFO'),
+        },
+    },
+}
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.1/topics/i18n/
 
@@ -151,6 +231,13 @@ SPECTACULAR_SETTINGS = {
     },
 }
 
+# Кеш схемы OpenAPI
+SCHEMA_CACHE_ENABLED = (
+    os.getenv('SCHEMA_CACHE_ENABLED', 'True').lower() == 'true'
+)
+# Каталог для файлов схемы (пусто - схема хранится только в памяти)
+SCHEMA_CACHE_DIR = os.getenv('SCHEMA_CACHE_DIR') or None
+
 AUTH_USER_MODEL = 'user.User'
 
 
@@ -161,6 +248,93 @@ SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME': timedelta(
         minutes=int(os.getenv('REFRESH_TOKEN_LIFETIME', '120'))
     ),
-    "UPDATE_LAST_LOGIN": True,
+    # Дата последнего входа обновляется пакетно, см. apps.user.last_login
+    "UPDATE_LAST_LOGIN": False,
+    'TOKEN_OBTAIN_SERIALIZER': (
+        'apps.user.api.serializers.TokenObtainPairWithLastLoginSerializer'
+    ),
     "SIGNING_KEY": SECRET_KEY,
-}
\ No newline at end of file
+}
+
+# Условные GET-запросы: ETag для списков, ETag/Last-Modified для
+# детального просмотра (см. ConditionalGetMixin)
+CONDITIONAL_GET_ENABLED = (
+    os.getenv('CONDITIONAL_GET_ENABLED', 'True').lower() == 'true'
+)
+
+# Кеш ответов API (каталог групп, см. ResponseCacheMixin)
+RESPONSE_CACHE_ENABLED = (
+    os.getenv('RESPONSE_CACHE_ENABLED', 'True').lower() == 'true'
+)
+# Бэкенд кеша: file (по умолчанию), db или locmem. Инвалидация должна
+# быть видна всем процессам, поэтому кеш общий (для db таблица
+# создается командой createcachetable). Кеш locmem не разделяется между
+# процессами: в остальных воркерах инвалидация не действует, поэтому
+# его записи живут не дольше RESPONSE_CACHE_LOCMEM_TTL секунд
+RESPONSE_CACHE_BACKENDS = {
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+    'db': 'django.core.cache.backends.db.DatabaseCache',
+}
+RESPONSE_CACHE_BACKEND = os.getenv('RESPONSE_CACHE_BACKEND', 'file')
+# Каталог (file), таблица (db) или имя (locmem) кеша
+RESPONSE_CACHE_LOCATION = os.getenv('RESPONSE_CACHE_LOCATION') or (
+    '/tmp/tcms/response_cache'
+    if RESPONSE_CACHE_BACKEND == 'file'
+    else 'response_cache'
+)
+RESPONSE_CACHE_LOCMEM_TTL = int(os.getenv('RESPONSE_CACHE_LOCMEM_TTL', '10'))
+# Сколько секунд после инвалидации можно отдавать устаревший ответ,
+# пока он перестраивается другим запросом
+RESPONSE_CACHE_STALE_TTL = int(os.getenv('RESPONSE_CACHE_STALE_TTL', '60'))
+# Время блокировки перестроения ответа в секундах
+RESPONSE_CACHE_LOCK_TIMEOUT = int(
+    os.getenv('RESPONSE_CACHE_LOCK_TIMEOUT', '30')
+)
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'responses': {
+        'BACKEND': RESPONSE_CACHE_BACKENDS[RESPONSE_CACHE_BACKEND],
+        'LOCATION': RESPONSE_CACHE_LOCATION,
+        'TIMEOUT': (
+            RESPONSE_CACHE_LOCMEM_TTL
+            if RESPONSE_CACHE_BACKEND == 'locmem'
+            else None
+        ),
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    },
+}
+
+# Быстрое получение списков через .values() (см. ValuesListMixin)
+VALUES_LIST_ENABLED = (
+    os.getenv('VALUES_LIST_ENABLED', 'True').lower() == 'true'
+)
+
+# Метрики Prometheus на /api/metrics/ (см. common.metrics). При
+# нескольких процессах метрики пишутся в каталог из переменной
+# окружения PROMETHEUS_MULTIPROC_DIR и суммируются при выдаче
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'True').lower() == 'true'
+# Токен для доступа к метрикам (пусто - доступ только администраторам,
+# авторизованным в панели администратора)
+METRICS_TOKEN = os.getenv('METRICS_TOKEN') or None
+
+# Кеш пользователей для аутентификации по JWT
+# Размер локального LRU-кеша процесса (0 - кеш отключен)
+AUTH_USER_CACHE_SIZE = int(os.getenv('AUTH_USER_CACHE_SIZE', '1024'))
+# Время жизни записи в локальном кеше в секундах
+AUTH_USER_CACHE_LOCAL_TTL = int(os.getenv('AUTH_USER_CACHE_LOCAL_TTL', '30'))
+# Алиас общего для процессов кеша из CACHES (пусто - кеш отключен).
+# Кеш locmem не подходит: сброс кеша не будет виден другим процессам
+AUTH_USER_CACHE_ALIAS = os.getenv('AUTH_USER_CACHE_ALIAS') or None
+
+# Пакетное обновление даты последнего входа
+# Интервал записи в секундах (0 - запись при каждом входе)
+LAST_LOGIN_FLUSH_INTERVAL = float(os.getenv('LAST_LOGIN_FLUSH_INTERVAL', '5'))
+# Количество пользователей, при котором запись выполняется досрочно
+LAST_LOGIN_FLUSH_SIZE = int(os.getenv('LAST_LOGIN_FLUSH_SIZE', '500'))
+
+# Максимальное количество строк в файле импорта пользователей с ролями
+USERS_IMPORT_MAX_ROWS = int(os.getenv('USERS_IMPORT_MAX_ROWS', '10000'))
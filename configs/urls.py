@@ -1,6 +1,8 @@
+from common.metrics import MetricsView
+from common.schema import CachedSpectacularAPIView
 from django.contrib import admin
 from django.urls import include, path
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
+from drf_spectacular.views import SpectacularSwaggerView
 from rest_framework_simplejwt.views import (
     TokenObtainPairView,
     TokenRefreshView,
@@ -13,7 +15,7 @@ api_urlpatterns = [
         include('apps.training_process.urls'),
         name='training_process',
     ),
-    path('schema/', SpectacularAPIView.as_view(), name='schema'),
+    path('schema/', CachedSpectacularAPIView.as_view(), name='schema'),
     path(
         'schema/swagger/',
         SpectacularSwaggerView.as_view(url_name='schema'),
@@ -21,6 +23,7 @@ api_urlpatterns = [
     ),
     path('token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
+    path('metrics/', MetricsView.as_view(), name='metrics'),
 ]
 
 urlpatterns = [
@@ -1,7 +1,10 @@
 import os
 
+from common.db import log_database_connection_settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'configs.settings')
 
 application = get_wsgi_application()
+
+log_database_connection_settings()
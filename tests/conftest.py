@@ -1,11 +1,19 @@
 import pytest
 from apps.user.models import User
+from django.core.cache import caches
 from rest_framework import status
 from rest_framework.test import APIClient
 
 from tests.factories import UserFactory
 
 
+@pytest.fixture(autouse=True)
+def clear_response_cache() -> None:
+    """Очистка кеша ответов API перед каждым тестом."""
+
+    caches['responses'].clear()
+
+
 @pytest.fixture
 def test_user() -> User:
     """Фикстура, возвращающая тестового пользователя."""
@@ -11,8 +11,7 @@ class UserFactory(factory.django.DjangoModelFactory):
     date_of_birth = factory.Faker('date_of_birth', minimum_age=18)
     gender = GenderType.FEMALE
 
-    # FIXME емейл должен генерироваться уникальный
-    email = factory.Faker('email', domain='example.com', safe=True)
+    email = factory.Sequence(lambda n: f'user{n}@example.com')
     phone = factory.Faker('numerify', text='+7(9##)###-####')
 
     class Meta:
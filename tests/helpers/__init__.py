@@ -16,6 +16,8 @@ from .coach import (
 )
 from .user import (
     create_user_request_data,
+    create_users_import_file,
+    create_users_import_row,
     serialize_user,
     update_user_request_data,
 )
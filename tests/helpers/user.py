@@ -1,6 +1,9 @@
+import csv
+import io
 from datetime import date
 
 from apps.user.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
 
 from tests.factories import UserFactory
 
@@ -50,3 +53,29 @@ def serialize_user(user: User) -> dict:
         'gender': user.gender,
         'phone': user.phone,
     }
+
+
+def create_users_import_row(request_data: dict) -> dict:
+    """
+    Получение строки файла импорта из данных для создания роли
+    вместе с пользователем.
+    """
+
+    row = {**request_data.pop('user_data'), **request_data}
+    if isinstance(row['date_of_birth'], date):
+        row['date_of_birth'] = row['date_of_birth'].isoformat()
+
+    return row
+
+
+def create_users_import_file(rows: list[dict]) -> SimpleUploadedFile:
+    """Получение CSV-файла импорта пользователей с ролями."""
+
+    content = io.StringIO()
+    writer = csv.DictWriter(content, fieldnames=list(rows[0]))
+    writer.writeheader()
+    writer.writerows(rows)
+
+    return SimpleUploadedFile(
+        'users.csv', content.getvalue().encode(), content_type='text/csv'
+    )
@@ -0,0 +1,76 @@
+import pytest
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from tests.factories import (
+    AdministratorFactory,
+    AthleteFactory,
+    CoachFactory,
+    UserFactory,
+)
+from tests.factories.group import GroupFactory
+from tests.factories.group_application import GroupApplicationFactory
+
+# Количество записей для второго замера
+LARGE_COUNT = 30
+
+
+@pytest.fixture
+def admin_client(test_superuser) -> Client:
+    """Клиент панели администратора с авторизованным суперюзером."""
+
+    client = Client()
+    client.force_login(test_superuser)
+
+    return client
+
+
+def count_queries(client, url: str, params: dict) -> list[str]:
+    """SQL-запросы при открытии страницы панели администратора."""
+
+    with CaptureQueriesContext(connection) as captured:
+        response = client.get(url, data=params)
+    assert response.status_code == status.HTTP_200_OK, (url, params)
+
+    return [query['sql'] for query in captured]
+
+
+@pytest.mark.parametrize(
+    ('model_name', 'factory', 'params'),
+    [
+        ('user_user', UserFactory, {'q': 'example'}),
+        ('user_administrator', AdministratorFactory, {'current': '1'}),
+        ('user_coach', CoachFactory, {'q': 'example'}),
+        ('user_athlete', AthleteFactory, {'current': '0'}),
+        ('training_process_group', GroupFactory, {'q': 'группа'}),
+        (
+            'training_process_groupapplication',
+            GroupApplicationFactory,
+            {'status__exact': 'new'},
+        ),
+    ],
+)
+@pytest.mark.django_db
+def test_admin_changelist_queries(admin_client, model_name, factory, params):
+    """
+    Проверка, что количество запросов списка в панели администратора
+    не зависит от количества записей, а записи считаются только
+    до порога (полный COUNT(*) не выполняется).
+    """
+
+    url = reverse(f'admin:{model_name}_changelist')
+
+    factory.create()
+    small = [count_queries(admin_client, url, p) for p in ({}, params)]
+    factory.create_batch(LARGE_COUNT - 1)
+    large = [count_queries(admin_client, url, p) for p in ({}, params)]
+
+    assert [len(queries) for queries in small] == [
+        len(queries) for queries in large
+    ]
+    for queries in large:
+        counts = [sql for sql in queries if sql.startswith('SELECT COUNT(*)')]
+        assert all('LIMIT' in sql for sql in counts), counts
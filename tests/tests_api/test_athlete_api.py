@@ -5,10 +5,12 @@ from django.utils.timezone import now
 from rest_framework import status
 
 from tests.conftest import check_filters_and_ordering
-from tests.factories import AthleteFactory
+from tests.factories import AthleteFactory, UserFactory
 from tests.helpers import (
     create_athlete_request_data,
     create_athletes_filtering_test_data,
+    create_users_import_file,
+    create_users_import_row,
     serialize_athlete,
 )
 from tests.utils import get_api_url
@@ -85,6 +87,38 @@ def test_athletes_list_max_queries(
         assert response.status_code == status.HTTP_200_OK
 
 
+@pytest.mark.django_db
+def test_athletes_list_current(authorized_client, athlete_list_url):
+    """
+    Тест получения списка спортсменов: по умолчанию показываются только
+    действующие роли.
+    """
+
+    current, cancelled = AthleteFactory.create_batch(2)
+    cancelled.date_to = now().date()
+    cancelled.save()
+    # Новая действующая роль того же пользователя
+    AthleteFactory.create(user=cancelled.user)
+
+    response = authorized_client.get(athlete_list_url)
+    assert response.status_code == status.HTTP_200_OK
+    ids = [item['id'] for item in response.data['results']]
+    assert cancelled.pk not in ids
+    assert current.pk in ids
+    assert len(ids) == 2
+
+    # Вся история ролей
+    response = authorized_client.get(athlete_list_url, data={'current': False})
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data['results']) == 3
+
+    # Завершенная роль доступна по id
+    response = authorized_client.get(
+        get_api_url('athletes', 'detail', pk=cancelled.pk)
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+
 # Остальные тесты API
 
 
@@ -113,6 +147,110 @@ def test_cancel_athlete(authorized_client, athlete):
     )
 
 
+@pytest.mark.django_db
+def test_athletes_import(
+    authorized_client, athlete_list_url, django_assert_max_num_queries
+):
+    """Тест импорта спортсменов вместе с пользователями из CSV."""
+
+    rows = [
+        create_users_import_row(create_athlete_request_data())
+        for _ in range(50)
+    ]
+    rows[0]['patronymic'] = 'Иванович'
+    rows[1]['patronymic'] = ''
+
+    # Количество запросов не зависит от количества строк: проверка
+    # адресов, вставка пользователей и вставка ролей
+    with django_assert_max_num_queries(8):
+        response = authorized_client.post(
+            get_api_url('athletes', 'import'),
+            data={'file': create_users_import_file(rows)},
+            format='multipart',
+        )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.data == {'created': 50, 'errors': []}
+
+    athletes = Athlete.objects.filter(
+        user__email__in=[row['email'] for row in rows]
+    ).select_related('user')
+    assert len(athletes) == 50
+    for athlete in athletes:
+        assert athlete.date_from == now().date()
+        assert athlete.date_to is None
+        assert not athlete.user.has_usable_password()
+    assert athletes.get(user__email=rows[0]['email']).user.patronymic == (
+        'Иванович'
+    )
+    assert athletes.get(user__email=rows[1]['email']).user.patronymic is None
+
+
+@pytest.mark.django_db
+def test_athletes_import_errors(authorized_client):
+    """
+    Тест импорта спортсменов из файла с ошибками: ничего не создается,
+    ошибки возвращаются по номерам строк.
+    """
+
+    existing = UserFactory.create()
+    rows = [
+        create_users_import_row(create_athlete_request_data())
+        for _ in range(5)
+    ]
+    # Адрес существующего пользователя
+    rows[1]['email'] = existing.email
+    # Адрес повторяется в файле
+    rows[2]['email'] = rows[0]['email']
+    # Неизвестный уровень
+    rows[3]['playing_level'] = 'unknown'
+    # Нет обязательного значения
+    rows[4]['last_name'] = ''
+
+    response = authorized_client.post(
+        get_api_url('athletes', 'import'),
+        data={'file': create_users_import_file(rows)},
+        format='multipart',
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data['created'] == 0
+    errors = {
+        error['line']: error['errors'] for error in response.data['errors']
+    }
+    assert list(errors) == [3, 4, 5, 6]
+    assert list(errors[3]) == ['email']
+    assert errors[4]['email'] == ['Адрес повторяется в строке 2']
+    assert list(errors[5]) == ['playing_level']
+    assert list(errors[6]) == ['last_name']
+    assert not Athlete.objects.exists()
+
+
+@pytest.mark.django_db
+def test_athletes_import_columns(authorized_client):
+    """Тест импорта спортсменов из файла с неверным заголовком."""
+
+    row = create_users_import_row(create_athlete_request_data())
+    del row['playing_level']
+    row['unknown'] = 'value'
+
+    response = authorized_client.post(
+        get_api_url('athletes', 'import'),
+        data={'file': create_users_import_file([row])},
+        format='multipart',
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data['errors'] == [
+        {
+            'line': 1,
+            'errors': {
+                'non_field_errors': [
+                    'Неизвестные столбцы: unknown',
+                    'Нет обязательных столбцов: playing_level',
+                ]
+            },
+        }
+    ]
+
+
 # Тесты фильтрации и сортировки
 
 
@@ -0,0 +1,158 @@
+import pytest
+from apps.user.authentication import CachedJWTAuthentication
+from apps.user.cache import AuthUserCache, auth_user_cache
+from apps.user.models import User
+from django.core.cache import caches
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from tests.factories import UserFactory
+from tests.utils import get_api_url
+
+
+@pytest.fixture(autouse=True)
+def clear_auth_user_cache(settings):
+    """
+    Общий кеш пользователей и его очистка между тестами. В тестах
+    один процесс, поэтому общим кешем может быть locmem.
+    """
+
+    settings.AUTH_USER_CACHE_ALIAS = 'default'
+    caches['default'].clear()
+    auth_user_cache.clear()
+    yield
+    auth_user_cache.clear()
+
+
+@pytest.fixture
+def token_user() -> User:
+    """Пользователь, авторизующийся по JWT."""
+
+    return UserFactory.create()
+
+
+@pytest.fixture
+def token_client(token_user) -> APIClient:
+    """Клиент с заголовком авторизации по JWT."""
+
+    client = APIClient()
+    client.credentials(
+        HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(token_user)}'
+    )
+
+    return client
+
+
+@pytest.mark.django_db
+def test_cached_user_authentication(
+    token_client, token_user, django_assert_num_queries
+):
+    """Тест кеширования пользователя между запросами с одним токеном."""
+
+    url = get_api_url('users', 'detail', pk=token_user.pk)
+
+    # Пользователь запроса и данные пользователя
+    with django_assert_num_queries(2):
+        response = token_client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+
+    # Пользователь запроса берется из кеша
+    with django_assert_num_queries(1):
+        response = token_client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+def test_cached_user_invalidation_on_save(token_client, token_user):
+    """Тест сброса кеша при деактивации пользователя через save()."""
+
+    url = get_api_url('users', 'detail', pk=token_user.pk)
+    assert token_client.get(url).status_code == status.HTTP_200_OK
+
+    token_user.is_active = False
+    token_user.save()
+
+    response = token_client.get(url)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+def test_cached_user_invalidation_on_update(token_client, token_user):
+    """Тест сброса кеша при деактивации пользователя через update()."""
+
+    url = get_api_url('users', 'detail', pk=token_user.pk)
+    assert token_client.get(url).status_code == status.HTTP_200_OK
+
+    User.objects.filter(pk=token_user.pk).update(is_active=False)
+
+    response = token_client.get(url)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+def test_cached_user_is_not_shared(token_user):
+    """
+    Тест, что пользователь запроса, закешировавшего пользователя,
+    не является объектом из кеша.
+    """
+
+    authentication = CachedJWTAuthentication()
+    token = AccessToken.for_user(token_user)
+
+    user = authentication.get_user(token)
+    user.request_attribute = 'значение'
+
+    assert not hasattr(authentication.get_user(token), 'request_attribute')
+
+
+@pytest.mark.django_db
+def test_cached_user_invalidation_on_commit(
+    token_user, django_capture_on_commit_callbacks
+):
+    """
+    Тест повторного сброса кеша после фиксации транзакции: запись,
+    закешированная параллельным запросом до фиксации, удаляется.
+    """
+
+    token = AccessToken.for_user(token_user)
+    stale_user = User.objects.get(pk=token_user.pk)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        token_user.is_active = False
+        token_user.save()
+        auth_user_cache.set(token_user.pk, stale_user, token['exp'])
+
+    assert auth_user_cache.get(token_user.pk) is None
+
+
+@pytest.mark.django_db
+def test_cached_user_invalidation_in_other_process(token_user):
+    """
+    Тест сброса кеша в других процессах: локальная запись другого
+    процесса сверяется с версией пользователя в общем кеше.
+    """
+
+    token = AccessToken.for_user(token_user)
+    # Локальный кеш другого процесса
+    other_cache = AuthUserCache()
+    other_cache.set(token_user.pk, token_user, token['exp'])
+    assert other_cache.get(token_user.pk) is not None
+
+    User.objects.filter(pk=token_user.pk).update(is_active=False)
+
+    assert other_cache.get(token_user.pk) is None
+
+
+@pytest.mark.django_db
+def test_cached_user_without_shared_cache(
+    token_client, token_user, settings, django_assert_num_queries
+):
+    """Тест отключения кеша, если общий кеш не задан."""
+
+    settings.AUTH_USER_CACHE_ALIAS = None
+    url = get_api_url('users', 'detail', pk=token_user.pk)
+    assert token_client.get(url).status_code == status.HTTP_200_OK
+
+    with django_assert_num_queries(2):
+        assert token_client.get(url).status_code == status.HTTP_200_OK
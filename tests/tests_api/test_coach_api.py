@@ -9,6 +9,8 @@ from tests.factories import CoachFactory
 from tests.helpers import (
     create_coach_request_data,
     create_coaches_filtering_test_data,
+    create_users_import_file,
+    create_users_import_row,
     serialize_coach,
 )
 from tests.utils import get_api_url
@@ -83,6 +85,38 @@ def test_coaches_list_max_queries(
         assert response.status_code == status.HTTP_200_OK
 
 
+@pytest.mark.django_db
+def test_coaches_list_current(authorized_client, coach_list_url):
+    """
+    Тест получения списка тренеров: по умолчанию показываются только
+    действующие роли.
+    """
+
+    current, cancelled = CoachFactory.create_batch(2)
+    cancelled.date_to = now().date()
+    cancelled.save()
+    # Новая действующая роль того же пользователя
+    CoachFactory.create(user=cancelled.user)
+
+    response = authorized_client.get(coach_list_url)
+    assert response.status_code == status.HTTP_200_OK
+    ids = [item['id'] for item in response.data['results']]
+    assert cancelled.pk not in ids
+    assert current.pk in ids
+    assert len(ids) == 2
+
+    # Вся история ролей
+    response = authorized_client.get(coach_list_url, data={'current': False})
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data['results']) == 3
+
+    # Завершенная роль доступна по id
+    response = authorized_client.get(
+        get_api_url('coaches', 'detail', pk=cancelled.pk)
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+
 # Остальные тесты API
 
 
@@ -111,6 +145,33 @@ def test_cancel_coach(authorized_client, coach):
     )
 
 
+@pytest.mark.django_db
+def test_coaches_import(authorized_client):
+    """Тест импорта тренеров вместе с пользователями из CSV."""
+
+    rows = [
+        create_users_import_row(create_coach_request_data()) for _ in range(3)
+    ]
+    rows[0]['judge_category'] = 'first'
+
+    response = authorized_client.post(
+        get_api_url('coaches', 'import'),
+        data={'file': create_users_import_file(rows)},
+        format='multipart',
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.data == {'created': 3, 'errors': []}
+
+    coaches = Coach.objects.filter(
+        user__email__in=[row['email'] for row in rows]
+    )
+    assert len(coaches) == 3
+    coach = coaches.get(user__email=rows[0]['email'])
+    assert coach.judge_category == 'first'
+    assert coach.coach_experience == rows[0]['coach_experience']
+    assert coach.current_coach_experience == rows[0]['coach_experience']
+
+
 # Тесты фильтрации и сортировки
 
 
@@ -119,6 +180,9 @@ def test_cancel_coach(authorized_client, coach):
     [
         ({'full_name': 'ак'}, [2, 1]),
         ({'full_name': 'Макар'}, [1]),
+        ({'min_coach_experience': 5}, [2, 0]),
+        ({'max_coach_experience': 4}, [1]),
+        ({'min_coach_experience': 4, 'max_coach_experience': 6}, [0]),
     ],
 )
 @pytest.mark.django_db
@@ -0,0 +1,138 @@
+import pytest
+from apps.training_process.models import Group
+from rest_framework import status
+
+from tests.factories.group import GroupFactory
+from tests.factories.group_application import GroupApplicationFactory
+from tests.utils import get_api_url
+
+
+@pytest.mark.parametrize(
+    'basename', ['users', 'coaches', 'athletes', 'group-applications']
+)
+@pytest.mark.django_db
+def test_list_not_modified(authorized_client, basename):
+    """Тест ответа 304 на повторный запрос списка с If-None-Match."""
+
+    GroupApplicationFactory.create_batch(2)
+    url = get_api_url(basename, 'list')
+
+    response = authorized_client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response['ETag']
+    assert 'Last-Modified' not in response
+
+    response = authorized_client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b''
+
+
+@pytest.mark.django_db
+def test_list_modified_nested(authorized_client):
+    """
+    Тест изменения ETag списка групп при изменении данных тренера,
+    которые входят в ответ через вложенный сериализатор.
+    """
+
+    group = GroupFactory.create()
+    url = get_api_url('groups', 'list')
+    etag = authorized_client.get(url)['ETag']
+
+    user = group.coach.user
+    user.first_name = 'Анна'
+    user.save()
+
+    response = authorized_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response['ETag'] != etag
+
+
+@pytest.mark.django_db
+def test_list_modified_delete(authorized_client):
+    """Тест изменения ETag списка при удалении записи."""
+
+    applications = GroupApplicationFactory.create_batch(3)
+    url = get_api_url('group-applications', 'list')
+    etag = authorized_client.get(url, data={'page_size': 2})['ETag']
+
+    applications[-1].delete()
+
+    response = authorized_client.get(
+        url, data={'page_size': 2}, HTTP_IF_NONE_MATCH=etag
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [item['id'] for item in response.data['results']] == [
+        application.pk for application in applications[1::-1]
+    ]
+
+
+@pytest.mark.django_db
+def test_list_if_modified_since_ignored(authorized_client):
+    """
+    Тест, что If-Modified-Since для списка не проверяется: удаление
+    записи не меняет дату изменения оставшихся записей.
+    """
+
+    applications = GroupApplicationFactory.create_batch(2)
+    url = get_api_url('group-applications', 'list')
+    last_modified = authorized_client.get(
+        get_api_url('group-applications', 'detail', pk=applications[0].pk)
+    )['Last-Modified']
+
+    applications[1].delete()
+
+    response = authorized_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+    assert response.status_code == status.HTTP_200_OK
+    assert [item['id'] for item in response.data['results']] == [
+        applications[0].pk
+    ]
+
+
+@pytest.mark.django_db
+def test_list_etag_query_params(authorized_client):
+    """Тест зависимости ETag списка от параметров запроса."""
+
+    GroupFactory.create_batch(2)
+    url = get_api_url('groups', 'list')
+    etag = authorized_client.get(url)['ETag']
+
+    response = authorized_client.get(
+        url, data={'page_size': 1}, HTTP_IF_NONE_MATCH=etag
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+def test_detail_not_modified(authorized_client):
+    """
+    Тест ответа 304 на повторный запрос группы и ответа 200 после
+    частичного сохранения группы.
+    """
+
+    group = GroupFactory.create()
+    url = get_api_url('groups', 'detail', pk=group.pk)
+    response = authorized_client.get(url)
+    etag, last_modified = response['ETag'], response['Last-Modified']
+
+    response = authorized_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    response = authorized_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    Group.objects.filter(pk=group.pk).update_participants_count()
+
+    response = authorized_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+def test_conditional_get_disabled(authorized_client, settings):
+    """Тест отключения условных GET-запросов настройкой."""
+
+    settings.CONDITIONAL_GET_ENABLED = False
+    GroupFactory.create()
+
+    response = authorized_client.get(get_api_url('groups', 'list'))
+    assert response.status_code == status.HTTP_200_OK
+    assert 'ETag' not in response
@@ -0,0 +1,164 @@
+import csv
+import io
+import xml.etree.ElementTree as ET
+import zipfile
+
+import pytest
+from common.export import format_csv_value
+from rest_framework import status
+
+from tests.factories import AthleteFactory, UserFactory
+from tests.factories.group_application import GroupApplicationFactory
+from tests.utils import get_api_url
+
+XLSX_NAMESPACE = {
+    'main': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+}
+
+
+def read_csv(response) -> list[list[str]]:
+    content = b''.join(response.streaming_content).decode('utf-8-sig')
+    return list(csv.reader(io.StringIO(content)))
+
+
+def read_xlsx(response) -> list[list[str]]:
+    content = b''.join(response.streaming_content)
+    with zipfile.ZipFile(io.BytesIO(content)) as archive:
+        assert archive.testzip() is None
+        sheet = ET.fromstring(archive.read('xl/worksheets/sheet1.xml'))
+
+    return [
+        [
+            ''.join(cell.itertext())
+            for cell in row.findall('main:c', XLSX_NAMESPACE)
+        ]
+        for row in sheet.iterfind('.//main:row', XLSX_NAMESPACE)
+    ]
+
+
+@pytest.mark.django_db
+def test_users_export_csv(authorized_client, settings):
+    """Тест выгрузки пользователей в CSV с фильтром и сортировкой."""
+
+    # Выборка частями меньше количества строк
+    settings.EXPORT_CHUNK_SIZE = 2
+    users = UserFactory.create_batch(5, last_name='Выгрузкина')
+    users[0].patronymic = None
+    users[0].save()
+    UserFactory.create(last_name='Другая')
+
+    response = authorized_client.get(
+        get_api_url('users', 'export'),
+        data={'full_name': 'Выгрузкина', 'ordering': 'created_at'},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.streaming
+    assert response['Content-Type'] == 'text/csv; charset=utf-8'
+    assert 'filename="users.csv"' in response['Content-Disposition']
+
+    header, *rows = read_csv(response)
+    assert header[:3] == ['ID', 'Фамилия', 'Имя']
+    assert [int(row[0]) for row in rows] == [user.pk for user in users]
+    assert rows[0][3] == ''
+    assert rows[0][5] == 'Женский'
+    assert rows[0][6] == users[0].email
+
+
+@pytest.mark.django_db
+def test_users_export_csv_formula(authorized_client):
+    """
+    Тест выгрузки в CSV значений, которые Excel выполнил бы как формулу:
+    в CSV они начинаются с апострофа, в XLSX выгружаются как есть.
+    Телефоны со знаком "+" не меняются.
+    """
+
+    last_name = '=HYPERLINK("http://example.com","Открыть")'
+    user = UserFactory.create(last_name=last_name, phone='+79990000000')
+    url = get_api_url('users', 'export')
+
+    response = authorized_client.get(url, data={'ordering': 'created_at'})
+    assert response.status_code == status.HTTP_200_OK
+    row = read_csv(response)[-1]
+    assert int(row[0]) == user.pk
+    assert row[1] == f"'{last_name}"
+    assert row[7] == '+79990000000'
+
+    response = authorized_client.get(
+        url, data={'ordering': 'created_at', 'file_format': 'xlsx'}
+    )
+    row = read_xlsx(response)[-1]
+    assert row[1] == last_name
+
+
+@pytest.mark.parametrize(
+    ('value', 'expected'),
+    [
+        ('+7 (999) 000-00-00', '+7 (999) 000-00-00'),
+        ('-1,5', '-1,5'),
+        ('+SUM(A1:A2)', "'+SUM(A1:A2)"),
+        ("-2+3+cmd|' /C calc'!A0", "'-2+3+cmd|' /C calc'!A0"),
+        ('@SUM(A1)', "'@SUM(A1)"),
+        ('=1', "'=1"),
+    ],
+)
+def test_format_csv_value(value, expected):
+    """
+    Тест экранирования значений CSV: числа и телефоны со знаком
+    выгружаются как есть, значения со ссылками и функциями - с апострофом.
+    """
+
+    assert format_csv_value(value) == expected
+
+
+@pytest.mark.django_db
+def test_athletes_export_xlsx(authorized_client):
+    """Тест выгрузки спортсменов в XLSX."""
+
+    athletes = AthleteFactory.create_batch(3, user__last_name='Выгрузкина')
+    # Закончившиеся роли по умолчанию не выгружаются, как и в списке
+    AthleteFactory.create(date_to='2020-01-01')
+
+    response = authorized_client.get(
+        get_api_url('athletes', 'export'), data={'file_format': 'xlsx'}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response['Content-Type'] == (
+        'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    )
+
+    header, *rows = read_xlsx(response)
+    assert header[0] == 'ID'
+    assert len(header) == 11
+    assert [int(row[0]) for row in rows] == [
+        athlete.pk for athlete in reversed(athletes)
+    ]
+    assert rows[0][2] == 'Выгрузкина'
+
+
+@pytest.mark.django_db
+def test_group_applications_export(authorized_client):
+    """Тест выгрузки заявок на присоединение к группе."""
+
+    application, _ = GroupApplicationFactory.create_batch(2)
+
+    response = authorized_client.get(
+        get_api_url('group-applications', 'export'),
+        data={'group_id': application.group_id},
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    header, *rows = read_csv(response)
+    assert len(rows) == 1
+    assert rows[0][0] == str(application.pk)
+    assert rows[0][2] == 'Новая'
+    assert rows[0][4] == application.user.full_name
+
+
+@pytest.mark.django_db
+def test_export_invalid_format(authorized_client):
+    """Тест выгрузки в неизвестном формате."""
+
+    response = authorized_client.get(
+        get_api_url('users', 'export'), data={'file_format': 'pdf'}
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
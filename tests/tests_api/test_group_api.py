@@ -0,0 +1,61 @@
+import pytest
+from rest_framework import status
+
+from tests.conftest import check_filters_and_ordering
+from tests.factories.group import GroupFactory
+from tests.utils import get_api_url
+
+
+@pytest.mark.django_db
+def test_group_retrieve(authorized_client):
+    """Тест получения данных о заполненности группы."""
+
+    group = GroupFactory.create(max_participants=10, participants_count=4)
+
+    response = authorized_client.get(
+        get_api_url('groups', 'detail', pk=group.pk)
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    assert response.data['participants_count'] == 4
+    assert response.data['free_seats'] == 6
+
+
+@pytest.mark.django_db
+def test_group_update_max_participants(authorized_client):
+    """
+    Тест запрета уменьшать максимальное количество спортсменов
+    ниже текущего.
+    """
+
+    group = GroupFactory.create(max_participants=10, participants_count=4)
+
+    response = authorized_client.patch(
+        get_api_url('groups', 'detail', pk=group.pk),
+        data={'max_participants': 3},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.parametrize(
+    ('filter_param', 'expected_objects'),
+    [
+        ({'has_free_seats': True}, [1]),
+        ({'has_free_seats': False}, [2, 0]),
+    ],
+)
+@pytest.mark.django_db
+def test_filters(authorized_client, filter_param, expected_objects):
+    """Тесты фильтрации списка групп."""
+
+    check_filters_and_ordering(
+        get_api_url('groups', 'list'),
+        authorized_client,
+        [
+            GroupFactory.create(max_participants=2, participants_count=2),
+            GroupFactory.create(max_participants=2, participants_count=1),
+            GroupFactory.create(max_participants=0, participants_count=0),
+        ],
+        filter_param,
+        expected_objects,
+    )
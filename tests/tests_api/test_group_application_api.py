@@ -0,0 +1,373 @@
+import pytest
+from apps.training_process.models import GroupApplication
+from apps.training_process.models.choices import GroupApplicationStatus
+from apps.training_process.services import GroupApplicationBulkApproveService
+from apps.user.models import Athlete
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from tests.factories import AthleteFactory, UserFactory
+from tests.factories.group import GroupFactory
+from tests.factories.group_application import GroupApplicationFactory
+from tests.utils import get_api_url
+
+
+@pytest.mark.django_db
+def test_group_applications_bulk_approve(
+    authorized_client, django_assert_max_num_queries
+):
+    """Тест массового одобрения заявок на присоединение к группе."""
+
+    groups = GroupFactory.create_batch(2)
+    new_user, athlete = UserFactory.create(), AthleteFactory.create()
+    applications = [
+        # Две заявки пользователя без роли спортсмена в разные группы
+        GroupApplicationFactory.create(user=new_user, group=groups[0]),
+        GroupApplicationFactory.create(user=new_user, group=groups[1]),
+        # Заявка действующего спортсмена
+        GroupApplicationFactory.create(user=athlete.user, group=groups[0]),
+        # Уже одобренная заявка
+        GroupApplicationFactory.create(status=GroupApplicationStatus.APPROVED),
+    ]
+    ids = [application.pk for application in applications]
+    missing_id = max(ids) + 1
+
+    with django_assert_max_num_queries(11):
+        response = authorized_client.post(
+            get_api_url('group-applications', 'bulk-approve'),
+            data={'ids': [*ids, missing_id]},
+            format='json',
+        )
+    assert response.status_code == status.HTTP_200_OK
+
+    assert response.data == [
+        {'id': ids[0], 'success': True, 'error': None},
+        {'id': ids[1], 'success': True, 'error': None},
+        {'id': ids[2], 'success': True, 'error': None},
+        {
+            'id': ids[3],
+            'success': False,
+            'error': 'Одобрять можно только заявки в статусе "Новая"',
+        },
+        {'id': missing_id, 'success': False, 'error': 'Заявка не найдена'},
+    ]
+
+    # Проверяем статусы заявок
+    assert set(
+        GroupApplication.objects.filter(pk__in=ids[:3]).values_list(
+            'status', flat=True
+        )
+    ) == {GroupApplicationStatus.APPROVED}
+
+    # Проверяем, что пользователю создана одна роль спортсмена,
+    # и спортсмены присоединены к группам
+    new_athlete = Athlete.objects.get(user=new_user, date_to__isnull=True)
+    assert set(new_athlete.groups.all()) == set(groups)
+    assert list(athlete.groups.all()) == [groups[0]]
+
+    # Проверяем заполненность групп
+    for group, participants_count in zip(groups, [2, 1], strict=True):
+        group.refresh_from_db()
+        assert group.participants_count == participants_count
+
+
+@pytest.mark.django_db
+def test_group_applications_bulk_approve_no_free_seats(authorized_client):
+    """Тест массового одобрения заявок сверх количества мест в группе."""
+
+    group = GroupFactory.create(max_participants=2)
+    applications = GroupApplicationFactory.create_batch(3, group=group)
+
+    response = authorized_client.post(
+        get_api_url('group-applications', 'bulk-approve'),
+        data={'ids': [application.pk for application in applications]},
+        format='json',
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    assert [item['success'] for item in response.data] == [True, True, False]
+    assert response.data[2]['error'] == 'В группе нет свободных мест'
+
+    group.refresh_from_db()
+    assert group.participants_count == 2
+    assert group.free_seats == 0
+
+
+@pytest.mark.django_db
+def test_group_applications_bulk_approve_group_member(authorized_client):
+    """
+    Тест массового одобрения заявки спортсмена, который уже состоит
+    в заполненной группе: место не занимается, заявка одобряется.
+    """
+
+    athlete = AthleteFactory.create()
+    group = GroupFactory.create(max_participants=1)
+    athlete.groups.add(group)
+    application = GroupApplicationFactory.create(
+        user=athlete.user, group=group
+    )
+
+    response = authorized_client.post(
+        get_api_url('group-applications', 'bulk-approve'),
+        data={'ids': [application.pk]},
+        format='json',
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == [
+        {'id': application.pk, 'success': True, 'error': None}
+    ]
+
+    group.refresh_from_db()
+    assert group.participants_count == 1
+
+
+@pytest.mark.django_db
+def test_group_applications_bulk_approve_concurrent_athlete(
+    authorized_client, monkeypatch
+):
+    """
+    Тест массового одобрения заявки пользователя, которому роль спортсмена
+    назначили параллельно после поиска действующих ролей: заявка
+    одобряется, новая роль не создается.
+    """
+
+    group = GroupFactory.create()
+    user = UserFactory.create()
+    application = GroupApplicationFactory.create(user=user, group=group)
+
+    get_athletes = GroupApplicationBulkApproveService._get_athletes
+
+    def get_athletes_before_appoint(applications):
+        # Роль назначается после первого поиска действующих ролей
+        athletes = get_athletes(applications)
+        AthleteFactory.create(user=user)
+        monkeypatch.setattr(
+            GroupApplicationBulkApproveService,
+            '_get_athletes',
+            staticmethod(get_athletes),
+        )
+        return athletes
+
+    monkeypatch.setattr(
+        GroupApplicationBulkApproveService,
+        '_get_athletes',
+        staticmethod(get_athletes_before_appoint),
+    )
+
+    response = authorized_client.post(
+        get_api_url('group-applications', 'bulk-approve'),
+        data={'ids': [application.pk]},
+        format='json',
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == [
+        {'id': application.pk, 'success': True, 'error': None}
+    ]
+
+    athlete = Athlete.objects.get(user=user)
+    assert list(athlete.groups.all()) == [group]
+
+    group.refresh_from_db()
+    assert group.participants_count == 1
+
+
+@pytest.mark.django_db
+def test_group_application_approve_group_member(authorized_client):
+    """
+    Тест одобрения заявки спортсмена, который уже состоит в заполненной
+    группе: место не занимается, заявка одобряется.
+    """
+
+    athlete = AthleteFactory.create()
+    group = GroupFactory.create(max_participants=1)
+    athlete.groups.add(group)
+    application = GroupApplicationFactory.create(
+        user=athlete.user, group=group
+    )
+
+    response = authorized_client.post(
+        get_api_url('group-applications', 'approve', pk=application.pk)
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data['status'] == GroupApplicationStatus.APPROVED
+    assert response.data['group']['participants_count'] == 1
+
+
+@pytest.mark.django_db
+def test_group_application_approve_participants_count_queries(
+    authorized_client,
+):
+    """
+    Тест одобрения заявки: количество спортсменов пересчитывается
+    один раз, под блокировкой группы.
+    """
+
+    application = GroupApplicationFactory.create()
+
+    with CaptureQueriesContext(connection) as captured:
+        response = authorized_client.post(
+            get_api_url('group-applications', 'approve', pk=application.pk)
+        )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data['group']['participants_count'] == 1
+
+    queries = [query['sql'] for query in captured]
+    updates = [
+        sql
+        for sql in queries
+        if sql.startswith('UPDATE "training_process_group"')
+        and '"participants_count"' in sql
+    ]
+    assert len(updates) == 1
+    locks = [
+        index
+        for index, sql in enumerate(queries)
+        if 'FROM "training_process_group"' in sql and 'FOR UPDATE' in sql
+    ]
+    assert locks
+    assert locks[0] < queries.index(updates[0])
+
+
+@pytest.mark.django_db
+def test_group_application_approve(authorized_client):
+    """Тест одобрения заявки с пересчетом заполненности группы."""
+
+    group = GroupFactory.create(max_participants=1)
+    application, another_application = GroupApplicationFactory.create_batch(
+        2, group=group
+    )
+
+    response = authorized_client.post(
+        get_api_url('group-applications', 'approve', pk=application.pk)
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data['group']['participants_count'] == 1
+    assert response.data['group']['free_seats'] == 0
+
+    # В группе больше нет мест
+    response = authorized_client.post(
+        get_api_url('group-applications', 'approve', pk=another_application.pk)
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data[0] == 'В группе нет свободных мест'
+
+    # После окончания роли спортсмена место освобождается
+    athlete = Athlete.objects.get(user=application.user)
+    response = authorized_client.post(
+        get_api_url('athletes', 'cancel-athlete', pk=athlete.pk)
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    group.refresh_from_db()
+    assert group.participants_count == 0
+
+
+@pytest.mark.django_db
+def test_group_applications_bulk_reject(authorized_client):
+    """Тест массового отклонения заявок на присоединение к группе."""
+
+    applications = GroupApplicationFactory.create_batch(2)
+    rejected = GroupApplicationFactory.create(
+        status=GroupApplicationStatus.REJECT
+    )
+    ids = [application.pk for application in [*applications, rejected]]
+
+    response = authorized_client.post(
+        get_api_url('group-applications', 'bulk-reject'),
+        data={'ids': ids, 'reject_reason': 'Группа заполнена'},
+        format='json',
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    assert [item['success'] for item in response.data] == [True, True, False]
+    assert response.data[2]['error'] == (
+        'Отклонять можно только заявки в статусе "Новая"'
+    )
+
+    for application in applications:
+        application.refresh_from_db()
+        assert application.status == GroupApplicationStatus.REJECT
+        assert application.reject_reason == 'Группа заполнена'
+
+
+@pytest.mark.django_db
+def test_group_applications_bulk_approve_empty_ids(authorized_client):
+    """Тест валидации пустого списка заявок."""
+
+    response = authorized_client.post(
+        get_api_url('group-applications', 'bulk-approve'),
+        data={'ids': []},
+        format='json',
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_group_applications_list_sparse_fields(
+    authorized_client, django_assert_num_queries
+):
+    """
+    Тест выборочных полей: незапрошенные связи не попадают в ответ
+    и не присоединяются в запросе.
+    """
+
+    GroupApplicationFactory.create_batch(2)
+
+    with django_assert_num_queries(2) as captured:
+        response = authorized_client.get(
+            get_api_url('group-applications', 'list'),
+            data={'fields': 'id,status'},
+        )
+    assert response.status_code == status.HTTP_200_OK
+
+    for item in response.data['results']:
+        assert set(item) == {'id', 'status'}
+    assert 'JOIN' not in captured.captured_queries[-1]['sql']
+
+
+@pytest.mark.django_db
+def test_group_applications_list_nested_fields(authorized_client):
+    """Тест выборочных полей вложенных сериализаторов."""
+
+    application = GroupApplicationFactory.create()
+
+    response = authorized_client.get(
+        get_api_url('group-applications', 'list'),
+        data={'fields': 'id,group.name,group.coach.user.email'},
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    assert response.data['results'][0] == {
+        'id': application.pk,
+        'group': {
+            'name': application.group.name,
+            'coach': {'user': {'email': application.group.coach.user.email}},
+        },
+    }
+
+
+@pytest.mark.django_db
+def test_group_applications_list_expand(
+    authorized_client, django_assert_num_queries
+):
+    """Тест раскрытия связей: нераскрытые связи возвращаются как id."""
+
+    application = GroupApplicationFactory.create()
+
+    with django_assert_num_queries(2) as captured:
+        response = authorized_client.get(
+            get_api_url('group-applications', 'list'),
+            data={'expand': 'group'},
+        )
+    assert response.status_code == status.HTTP_200_OK
+
+    item = response.data['results'][0]
+    assert item['user'] == application.user_id
+    assert item['group']['id'] == application.group_id
+    assert item['group']['coach'] == application.group.coach_id
+
+    sql = captured.captured_queries[-1]['sql']
+    assert '"training_process_group"' in sql
+    assert '"user_coach"' not in sql
+    assert '"user_user"' not in sql
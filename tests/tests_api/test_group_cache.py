@@ -0,0 +1,204 @@
+import pytest
+from django.core.cache import caches
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework import status
+
+from tests.factories import AthleteFactory
+from tests.factories.group import GroupFactory
+from tests.utils import get_api_url
+
+
+@pytest.fixture
+def group_list_url() -> str:
+    return get_api_url('groups', 'list')
+
+
+@pytest.mark.django_db
+def test_group_list_cache(authorized_client, group_list_url):
+    """
+    Тест кеширования списка групп: ключ не зависит от порядка
+    параметров запроса.
+    """
+
+    GroupFactory.create_batch(2)
+
+    response = authorized_client.get(
+        f'{group_list_url}?page_size=10&has_free_seats=true'
+    )
+    assert response['X-Cache'] == 'MISS'
+
+    cached_response = authorized_client.get(
+        f'{group_list_url}?has_free_seats=true&page_size=10'
+    )
+    assert cached_response['X-Cache'] == 'HIT'
+    assert cached_response.content == response.content
+    assert cached_response['ETag'] == response['ETag']
+
+    response = authorized_client.get(
+        group_list_url, HTTP_IF_NONE_MATCH=cached_response['ETag']
+    )
+    assert response['X-Cache'] == 'MISS'
+
+
+@pytest.mark.django_db
+def test_group_detail_cache_not_modified(authorized_client):
+    """Тест ответа 304 из кеша на запрос с If-None-Match."""
+
+    group = GroupFactory.create()
+    url = get_api_url('groups', 'detail', pk=group.pk)
+    etag = authorized_client.get(url)['ETag']
+
+    response = authorized_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response['X-Cache'] == 'HIT'
+
+
+@pytest.mark.django_db
+def test_group_cache_invalidation_on_update(authorized_client):
+    """Тест инвалидации кеша при редактировании группы через API."""
+
+    group = GroupFactory.create(name='Старое')
+    url = get_api_url('groups', 'detail', pk=group.pk)
+    authorized_client.get(url)
+
+    response = authorized_client.patch(url, data={'name': 'Новое'})
+    assert response.status_code == status.HTTP_200_OK
+
+    response = authorized_client.get(url)
+    assert response['X-Cache'] == 'MISS'
+    assert response.data['name'] == 'Новое'
+
+
+@pytest.mark.django_db
+def test_group_cache_invalidation_on_coach_user_change(
+    authorized_client, group_list_url
+):
+    """Тест инвалидации кеша при изменении пользователя тренера группы."""
+
+    group = GroupFactory.create()
+    authorized_client.get(group_list_url)
+
+    user = group.coach.user
+    user.first_name = 'Анна'
+    user.save()
+
+    response = authorized_client.get(group_list_url)
+    assert response['X-Cache'] == 'MISS'
+    assert response.data['results'][0]['coach']['user']['first_name'] == (
+        'Анна'
+    )
+
+
+@pytest.mark.django_db
+def test_group_cache_invalidation_on_membership_change(
+    authorized_client, group_list_url
+):
+    """Тест инвалидации кеша при изменении состава группы."""
+
+    group = GroupFactory.create()
+    athlete = AthleteFactory.create()
+    authorized_client.get(group_list_url)
+
+    athlete.groups.add(group)
+
+    response = authorized_client.get(group_list_url)
+    assert response['X-Cache'] == 'MISS'
+
+
+@pytest.mark.django_db
+def test_group_cache_not_invalidated_on_other_user_change(
+    authorized_client, group_list_url, user
+):
+    """Тест сохранения кеша при изменении пользователя не из групп."""
+
+    GroupFactory.create()
+    authorized_client.get(group_list_url)
+
+    user.first_name = 'Анна'
+    user.save()
+
+    response = authorized_client.get(group_list_url)
+    assert response['X-Cache'] == 'HIT'
+
+
+@pytest.mark.django_db
+def test_group_cache_stale_while_revalidate(
+    authorized_client, group_list_url, monkeypatch
+):
+    """
+    Тест stale-while-revalidate: пока ответ перестраивается другим
+    запросом, отдается устаревший ответ.
+    """
+
+    group = GroupFactory.create(name='Старое')
+    stale_response = authorized_client.get(group_list_url)
+    group.name = 'Новое'
+    group.save()
+
+    # Блокировка перестроения занята другим запросом
+    monkeypatch.setattr(
+        caches['responses'], 'add', lambda *args, **kwargs: False
+    )
+    response = authorized_client.get(group_list_url)
+    assert response['X-Cache'] == 'STALE'
+    assert response.content == stale_response.content
+
+    monkeypatch.undo()
+    response = authorized_client.get(group_list_url)
+    assert response['X-Cache'] == 'MISS'
+    assert response.data['results'][0]['name'] == 'Новое'
+
+
+@pytest.mark.parametrize(
+    ('backend', 'location'),
+    [
+        ('django.core.cache.backends.locmem.LocMemCache', 'test'),
+        ('django.core.cache.backends.filebased.FileBasedCache', None),
+        ('django.core.cache.backends.db.DatabaseCache', 'test_cache'),
+    ],
+)
+@pytest.mark.django_db
+def test_group_cache_backends(
+    authorized_client, group_list_url, tmp_path, backend, location
+):
+    """Тест работы кеша ответов с разными бэкендами."""
+
+    cache_settings = {
+        'BACKEND': backend,
+        'LOCATION': location or str(tmp_path),
+    }
+    with override_settings(
+        CACHES={'default': cache_settings, 'responses': cache_settings}
+    ):
+        call_command('createcachetable')
+        GroupFactory.create()
+
+        assert authorized_client.get(group_list_url)['X-Cache'] == 'MISS'
+        assert authorized_client.get(group_list_url)['X-Cache'] == 'HIT'
+
+        GroupFactory.create()
+        response = authorized_client.get(group_list_url)
+        assert response['X-Cache'] == 'MISS'
+        assert response.data['count'] == 2
+
+
+@pytest.mark.django_db
+def test_group_cache_timeout(authorized_client, group_list_url):
+    """
+    Тест времени жизни ответов в кеше: ответ хранится не дольше TIMEOUT
+    кеша (для locmem, инвалидация которого не видна другим процессам).
+    """
+
+    cache_settings = {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'test_timeout',
+        'TIMEOUT': 0,
+    }
+    with override_settings(
+        CACHES={'default': cache_settings, 'responses': cache_settings}
+    ):
+        GroupFactory.create()
+
+        assert authorized_client.get(group_list_url)['X-Cache'] == 'MISS'
+        assert authorized_client.get(group_list_url)['X-Cache'] == 'MISS'
@@ -0,0 +1,96 @@
+import datetime
+import decimal
+import json
+import uuid
+
+import pytest
+from apps.training_process.api.serializers import GroupApplicationSerializer
+from apps.training_process.models import GroupApplication
+from common.choices import PlayingLevel
+from common.renderers import ORJSONRenderer
+from django.utils.translation import gettext_lazy
+from rest_framework import status
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.renderers import JSONRenderer
+
+from tests.factories.group_application import GroupApplicationFactory
+from tests.utils import get_api_url
+
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        {
+            'datetime': datetime.datetime(
+                2025, 3, 1, 10, 30, 15, 123456, tzinfo=datetime.UTC
+            ),
+            'date': datetime.date(2025, 3, 1),
+            'time': datetime.time(19, 0, 0, 500000),
+            'timedelta': datetime.timedelta(hours=1, seconds=5),
+            'decimal': decimal.Decimal('10.50'),
+            'uuid': uuid.UUID(int=1),
+            'lazy': gettext_lazy('Пользователь'),
+            'choice': PlayingLevel.PLAYER,
+            'error': ErrorDetail('Ошибка', code='invalid'),
+            'separators': 'a\u2028b\u2029c',
+            'keys': {1: 'one', None: 'none'},
+            'big_int': 2**70,
+        },
+        [None, True, 1, 'Строка', [], {}],
+    ],
+)
+def test_orjson_renderer(data):
+    """Тест рендерера orjson: результат совпадает с JSONRenderer."""
+
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+@pytest.mark.django_db
+def test_orjson_renderer_serializer_data():
+    """Тест рендерера orjson на данных сериализатора."""
+
+    GroupApplicationFactory.create_batch(3, comment=None)
+    data = GroupApplicationSerializer(
+        GroupApplication.objects.all(), many=True
+    ).data
+
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_orjson_renderer_indent():
+    """Тест рендерера orjson с отступами из заголовка Accept."""
+
+    data = {'id': 1, 'name': 'Группа'}
+    media_type = 'application/json; indent=4'
+
+    assert ORJSONRenderer().render(data, media_type) == (
+        JSONRenderer().render(data, media_type)
+    )
+
+
+@pytest.mark.django_db
+def test_orjson_parser(authorized_client, test_user):
+    """Тест разбора тела запроса парсером orjson."""
+
+    response = authorized_client.patch(
+        get_api_url('users', 'detail', pk=test_user.pk),
+        data=json.dumps({'first_name': 'Анна'}),
+        content_type='application/json',
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    test_user.refresh_from_db()
+    assert test_user.first_name == 'Анна'
+
+
+@pytest.mark.django_db
+def test_orjson_parser_invalid_json(authorized_client, test_user):
+    """Тест ответа на некорректный JSON в теле запроса."""
+
+    response = authorized_client.patch(
+        get_api_url('users', 'detail', pk=test_user.pk),
+        data='{"first_name": ',
+        content_type='application/json',
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data['detail'].startswith('JSON parse error')
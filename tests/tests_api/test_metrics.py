@@ -0,0 +1,127 @@
+import subprocess
+import sys
+
+import pytest
+from common.metrics import get_metrics_registry
+from django.urls import reverse
+from prometheus_client.parser import text_string_to_metric_families
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from tests.utils import get_api_url
+
+
+@pytest.fixture
+def metrics_client(test_superuser) -> APIClient:
+    """Клиент администратора, авторизованного в панели администратора."""
+
+    client = APIClient()
+    client.force_login(test_superuser)
+
+    return client
+
+
+def get_samples(response) -> dict:
+    """Значения метрик из ответа /api/metrics/ по имени и меткам."""
+
+    return {
+        (sample.name, tuple(sorted(sample.labels.items()))): sample.value
+        for family in text_string_to_metric_families(response.content.decode())
+        for sample in family.samples
+    }
+
+
+@pytest.mark.django_db
+def test_metrics(authorized_client, metrics_client):
+    """Проверка сбора метрик запросов по маршрутам."""
+
+    url = get_api_url('coaches', 'list')
+    labels = (('method', 'GET'), ('view', 'coaches-list'))
+
+    before = get_samples(metrics_client.get(reverse('metrics')))
+    authorized_client.get(url)
+    authorized_client.get(url)
+
+    response = metrics_client.get(reverse('metrics'))
+    assert response.status_code == status.HTTP_200_OK
+    assert response['Content-Type'].startswith('text/plain')
+
+    after = get_samples(response)
+
+    def delta(name, extra=()):
+        key = (name, tuple(sorted(labels + extra)))
+        return after[key] - before.get(key, 0)
+
+    assert delta('tcms_http_requests_total', (('status', '200'),)) == 2
+    assert delta('tcms_http_request_duration_seconds_count') == 2
+    assert delta('tcms_db_queries_per_request_count') == 2
+    assert delta('tcms_db_queries_per_request_sum') >= 2
+    assert delta('tcms_db_duration_seconds_sum') > 0
+    assert delta('tcms_http_response_size_bytes_sum') > 0
+
+
+@pytest.mark.django_db
+def test_metrics_unknown_method(authorized_client, metrics_client):
+    """Проверка метки нестандартного HTTP-метода."""
+
+    authorized_client.generic('FOO', get_api_url('coaches', 'list'))
+
+    samples = get_samples(metrics_client.get(reverse('metrics')))
+    methods = {
+        dict(labels)['method']
+        for name, labels in samples
+        if name == 'tcms_http_requests_total'
+    }
+    assert 'other' in methods
+    assert 'FOO' not in methods
+
+
+@pytest.mark.django_db
+def test_metrics_without_token(unauthorized_client, test_user):
+    """Проверка доступа к метрикам без токена: только администраторам."""
+
+    response = unauthorized_client.get(reverse('metrics'))
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    client = APIClient()
+    client.force_login(test_user)
+    response = client.get(reverse('metrics'))
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+def test_metrics_token(unauthorized_client, settings):
+    """Проверка доступа к метрикам по токену."""
+
+    settings.METRICS_TOKEN = 'secret'
+
+    response = unauthorized_client.get(reverse('metrics'))
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    response = unauthorized_client.get(
+        reverse('metrics'), HTTP_AUTHORIZATION='Bearer secret'
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_metrics_multiprocess(tmp_path, monkeypatch):
+    """Проверка суммирования метрик нескольких процессов."""
+
+    # Каждый процесс пишет метрики в свой файл в общем каталоге
+    code = (
+        'from common.metrics import REQUESTS; '
+        "REQUESTS.labels(view='test', method='GET', status=200).inc()"
+    )
+    for _ in range(2):
+        subprocess.run(
+            [sys.executable, '-c', code],
+            env={'PROMETHEUS_MULTIPROC_DIR': str(tmp_path)},
+            check=True,
+        )
+
+    monkeypatch.setenv('PROMETHEUS_MULTIPROC_DIR', str(tmp_path))
+    value = get_metrics_registry().get_sample_value(
+        'tcms_http_requests_total',
+        {'view': 'test', 'method': 'GET', 'status': '200'},
+    )
+    assert value == 2
@@ -0,0 +1,207 @@
+import re
+
+import pytest
+from apps.user.api.views import UserViewSet
+from apps.user.models import User
+from common.choices import PaginationCountStrategy
+from common.pagination import PageSizePagination
+from django.db import connection, transaction
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from tests.factories import UserFactory
+
+
+def collect_cursor_pages(client, url, params) -> tuple[list[int], dict]:
+    """
+    Обход всех страниц списка в курсорном режиме.
+
+    :return: id записей в порядке обхода и данные последней страницы.
+    """
+
+    ids = []
+    response = client.get(url, data={**params, 'pagination': 'cursor'})
+    while True:
+        assert response.status_code == status.HTTP_200_OK
+        assert 'count' not in response.data
+        ids.extend(item['id'] for item in response.data['results'])
+        if response.data['next'] is None:
+            return ids, response.data
+        response = client.get(response.data['next'])
+
+
+@pytest.mark.parametrize(
+    'ordering',
+    ['', 'full_name', '-full_name', 'created_at', '-created_at'],
+)
+@pytest.mark.django_db
+def test_cursor_pagination(authorized_client, user_list_url, ordering):
+    """
+    Тест курсорной пагинации: обход списка по курсору должен совпадать
+    с сортировкой списка в постраничном режиме.
+    """
+
+    # Одинаковые ФИО, чтобы проверить добор ключа сортировки по id
+    UserFactory.create_batch(3, last_name='Иванова', first_name='Анна')
+    UserFactory.create_batch(4)
+    params = {'ordering': ordering, 'page_size': 2}
+
+    response = authorized_client.get(
+        user_list_url, data={**params, 'page_size': 100}
+    )
+    expected_ids = [item['id'] for item in response.data['results']]
+
+    ids, last_page = collect_cursor_pages(
+        authorized_client, user_list_url, params
+    )
+    assert ids == expected_ids
+
+    # Обход в обратном направлении от последней страницы
+    backward_ids = [item['id'] for item in last_page['results']]
+    previous = last_page['previous']
+    while previous is not None:
+        response = authorized_client.get(previous)
+        assert response.status_code == status.HTTP_200_OK
+        backward_ids = [
+            *[item['id'] for item in response.data['results']],
+            *backward_ids,
+        ]
+        previous = response.data['previous']
+    assert backward_ids == expected_ids
+
+
+@pytest.mark.django_db
+def test_cursor_pagination_deep_page_queries(
+    authorized_client,
+    user_list_url,
+    django_assert_num_queries,
+):
+    """Тест отсутствия подсчета количества записей в курсорном режиме."""
+
+    UserFactory.create_batch(5)
+    last_id = User.objects.order_by('-id').values_list('id', flat=True)[2]
+
+    response = authorized_client.get(
+        user_list_url, data={'pagination': 'cursor', 'page_size': 2}
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    # Только запрос страницы
+    with django_assert_num_queries(1):
+        response = authorized_client.get(response.data['next'])
+    assert response.data['results'][0]['id'] == last_id
+
+
+@pytest.mark.parametrize(
+    ('ordering', 'values'),
+    [
+        (['full_name', 'pk'], ['Иванова Анна', 1]),
+        (['-created_at', '-pk'], ['2025-01-01T00:00:00+00:00', 1]),
+    ],
+)
+@pytest.mark.django_db
+def test_cursor_seek_condition_index_bound(ordering, values):
+    """
+    Тест условия выборки по курсору: первое поле ключа ограничивает
+    чтение индекса (Index Cond), а не фильтрует все записи до курсора.
+    """
+
+    queryset = User.objects.order_by(*ordering).filter(
+        PageSizePagination._get_seek_condition(ordering, values)
+    )
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+        plan = queryset[:10].explain()
+
+    field = ordering[0].lstrip('-')
+    assert re.search(rf'Index Cond: \(+{field}\b', plan), plan
+
+
+@pytest.mark.django_db
+def test_cursor_pagination_nullable_ordering():
+    """Тест запрета курсора по полю, допускающему пустые значения."""
+
+    request = Request(
+        APIRequestFactory().get('/', data={'pagination': 'cursor'})
+    )
+
+    with pytest.raises(ValidationError):
+        PageSizePagination().paginate_queryset(
+            User.objects.order_by('patronymic'), request
+        )
+
+
+@pytest.mark.django_db
+def test_cursor_pagination_invalid_cursor(authorized_client, user_list_url):
+    """Тест обработки некорректного курсора."""
+
+    response = authorized_client.get(
+        user_list_url, data={'cursor': 'некорректный'}
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_capped_count(authorized_client, user_list_url, settings):
+    """
+    Тест подсчета количества записей до порога: при превышении порога
+    количество неточное, но страницы за порогом остаются доступными.
+    """
+
+    settings.PAGINATION_COUNT_CAP = 3
+    UserFactory.create_batch(5)
+
+    response = authorized_client.get(user_list_url, data={'page_size': 2})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data['count'] == 3
+    assert response.data['count_is_exact'] is False
+
+    response = authorized_client.get(
+        user_list_url, data={'page_size': 2, 'page': 3}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data['results']) == 2
+    assert response.data['next'] is None
+
+    response = authorized_client.get(
+        user_list_url, data={'page_size': 2, 'page': 4}
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.parametrize(
+    'count_strategy', list(PaginationCountStrategy.values)
+)
+@pytest.mark.django_db
+def test_count_below_cap(
+    authorized_client, user_list_url, monkeypatch, count_strategy
+):
+    """Тест точного количества записей, если оно меньше порога."""
+
+    monkeypatch.setattr(
+        UserViewSet, 'pagination_count_strategy', count_strategy
+    )
+    UserFactory.create_batch(5)
+
+    response = authorized_client.get(user_list_url, data={'page_size': 2})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data['count'] == User.objects.count()
+    assert response.data['count_is_exact'] is True
+
+
+@pytest.mark.parametrize('pagination', ['page', 'cursor'])
+@pytest.mark.django_db
+def test_max_page_size(authorized_client, user_list_url, settings, pagination):
+    """Тест ограничения размера страницы, запрошенного клиентом."""
+
+    settings.PAGINATION_MAX_PAGE_SIZE = 3
+    UserFactory.create_batch(5)
+
+    response = authorized_client.get(
+        user_list_url, data={'page_size': 1000, 'pagination': pagination}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data['results']) == 3
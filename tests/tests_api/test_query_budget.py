@@ -0,0 +1,301 @@
+"""
+Тесты бюджета SQL-запросов.
+
+Каждый список и детальный просмотр запрашивается сначала с одной
+записью (связанной записью), а затем с 50, и количество запросов
+должно совпадать. Так ловятся N+1 запросы (например, пропущенный
+select_related). Списки проверяются со всеми фильтрами и сортировками
+из filterset_class представления, в том числе без ValuesListMixin.
+"""
+
+from collections.abc import Callable
+
+import factory
+import pytest
+from apps.training_process.api.filters import (
+    GroupApplicationFilter,
+    GroupFilter,
+)
+from apps.user.api.filters import (
+    AdministratorFilter,
+    AthleteFilter,
+    CoachFilter,
+    UserFilter,
+)
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django_filters import OrderingFilter
+from rest_framework import status
+
+from tests.factories import (
+    AdministratorFactory,
+    AthleteFactory,
+    CoachFactory,
+    UserFactory,
+)
+from tests.factories.group import GroupFactory
+from tests.factories.group_application import GroupApplicationFactory
+from tests.utils import get_api_url
+
+# Количество записей для второго замера
+LARGE_COUNT = 50
+
+# Фамилия пользователей тестовых данных для фильтра по ФИО
+LAST_NAME = 'Бюджетова'
+
+# Уникальные данные пользователей тестовых данных
+USER_DATA = {
+    'last_name': LAST_NAME,
+    'email': factory.Sequence(lambda n: f'budget{n}@example.com'),
+}
+NESTED_USER_DATA = {
+    f'user__{name}': value for name, value in USER_DATA.items()
+}
+
+
+@pytest.fixture(autouse=True)
+def disable_response_cache(settings) -> None:
+    """Ответы строятся на каждый запрос, чтобы запросы к БД выполнялись."""
+
+    settings.RESPONSE_CACHE_ENABLED = False
+
+
+def get_filter_params(filterset_class, values: dict[str, list]) -> list[dict]:
+    """
+    Получение параметров запросов для всех фильтров и сортировок.
+
+    :param filterset_class: Класс фильтров представления.
+    :param values: Значения фильтров по имени. Должны быть заданы для
+        всех фильтров, кроме сортировки.
+    """
+
+    params = [{}]
+    filters = filterset_class.base_filters
+    for name, filter_ in filters.items():
+        if not isinstance(filter_, OrderingFilter):
+            continue
+        for param in filter_.param_map:
+            params += [{name: param}, {name: f'-{param}'}]
+
+    not_ordering = {
+        name
+        for name, filter_ in filters.items()
+        if not isinstance(filter_, OrderingFilter)
+    }
+    assert set(values) == not_ordering, (
+        f'{filterset_class.__name__}: не заданы значения фильтров '
+        f'{not_ordering - set(values)}'
+    )
+    for name, filter_values in values.items():
+        params += [{name: value} for value in filter_values]
+
+    return params
+
+
+def count_queries(client, url: str, params: dict) -> int:
+    """Количество SQL-запросов при выполнении запроса к API."""
+
+    with CaptureQueriesContext(connection) as captured:
+        response = client.get(url, data=params)
+    assert response.status_code == status.HTTP_200_OK, (url, params)
+
+    return len(captured)
+
+
+def check_query_budget(
+    client,
+    settings,
+    basename: str,
+    seed: Callable[[int], int | None],
+    params: list[dict] = (),
+) -> None:
+    """
+    Проверка, что количество запросов не зависит от количества записей.
+
+    :param basename: Имя маршрута представления.
+    :param seed: Создание заданного количества записей (связанных
+        записей). Возвращает id записи для детального просмотра или None,
+        если у представления нет детального просмотра.
+    :param params: Параметры запросов списка.
+    """
+
+    def measure(pk: int | None) -> dict:
+        result = {}
+        for values_list in (True, False):
+            settings.VALUES_LIST_ENABLED = values_list
+            for query_params in params or [{}]:
+                key = (values_list, tuple(query_params.items()))
+                result[key] = count_queries(
+                    client, get_api_url(basename, 'list'), query_params
+                )
+        if pk is not None:
+            result['detail'] = count_queries(
+                client, get_api_url(basename, 'detail', pk=pk), {}
+            )
+
+        return result
+
+    small = measure(seed(1))
+    large = measure(seed(LARGE_COUNT - 1))
+
+    diff = {
+        key: (small[key], large[key])
+        for key in small
+        if small[key] != large[key]
+    }
+    assert not diff, f'{basename}: количество запросов растет: {diff}'
+
+
+@pytest.mark.django_db
+def test_users_query_budget(authorized_client, settings):
+    """Бюджет запросов API пользователей."""
+
+    users = []
+
+    def seed(count):
+        users.extend(UserFactory.create_batch(count, **USER_DATA))
+        # Связанные записи пользователя для детального просмотра
+        GroupApplicationFactory.create_batch(
+            count, user=users[0], group__coach__user__email=USER_DATA['email']
+        )
+        return users[0].pk
+
+    params = get_filter_params(
+        UserFilter,
+        {
+            'full_name': [LAST_NAME],
+            'email': ['budget'],
+            'phone': ['+7'],
+        },
+    )
+    check_query_budget(authorized_client, settings, 'users', seed, params)
+
+
+@pytest.mark.django_db
+def test_administrators_query_budget(authorized_client, settings):
+    """Бюджет запросов API администраторов."""
+
+    def seed(count):
+        AdministratorFactory.create_batch(count, **NESTED_USER_DATA)
+
+    params = get_filter_params(AdministratorFilter, {'full_name': [LAST_NAME]})
+    check_query_budget(
+        authorized_client, settings, 'administrators', seed, params
+    )
+
+
+@pytest.mark.django_db
+def test_coaches_query_budget(authorized_client, settings):
+    """Бюджет запросов API тренеров."""
+
+    coaches = []
+
+    def seed(count):
+        coaches.extend(
+            CoachFactory.create_batch(
+                count, coach_experience=5, **NESTED_USER_DATA
+            )
+        )
+        # Группы тренера для детального просмотра
+        GroupFactory.create_batch(count, coach=coaches[0])
+        return coaches[0].pk
+
+    params = get_filter_params(
+        CoachFilter,
+        {
+            'current': [True, False],
+            'full_name': [LAST_NAME],
+            'min_coach_experience': [1],
+            'max_coach_experience': [10],
+        },
+    )
+    check_query_budget(authorized_client, settings, 'coaches', seed, params)
+
+
+@pytest.mark.django_db
+def test_athletes_query_budget(authorized_client, settings):
+    """Бюджет запросов API спортсменов."""
+
+    group = GroupFactory.create(coach__user__email='budget-coach@example.com')
+    athletes = []
+
+    def seed(count):
+        athletes.extend(AthleteFactory.create_batch(count, **NESTED_USER_DATA))
+        for athlete in athletes[-count:]:
+            athlete.groups.add(group)
+        # Группы спортсмена для детального просмотра
+        athletes[0].groups.add(
+            *GroupFactory.create_batch(count, coach=group.coach)
+        )
+        return athletes[0].pk
+
+    params = get_filter_params(
+        AthleteFilter,
+        {
+            'current': [True, False],
+            'full_name': [LAST_NAME],
+            'group_id': [group.pk],
+        },
+    )
+    check_query_budget(authorized_client, settings, 'athletes', seed, params)
+
+
+@pytest.mark.django_db
+def test_groups_query_budget(authorized_client, settings):
+    """Бюджет запросов API групп."""
+
+    groups = []
+
+    def seed(count):
+        groups.extend(
+            GroupFactory.create_batch(
+                count + 1,
+                max_participants=1,
+                coach__user__email=USER_DATA['email'],
+            )
+        )
+        # Спортсмены группы для детального просмотра. При обоих замерах
+        # есть заполненная группа и группы со свободными местами, поэтому
+        # оба фильтра по свободным местам возвращают записи
+        groups[0].athletes.add(
+            *AthleteFactory.create_batch(count, **NESTED_USER_DATA)
+        )
+        return groups[0].pk
+
+    params = get_filter_params(GroupFilter, {'has_free_seats': [True, False]})
+    check_query_budget(authorized_client, settings, 'groups', seed, params)
+
+
+@pytest.mark.django_db
+def test_group_applications_query_budget(authorized_client, settings):
+    """Бюджет запросов API заявок на присоединение к группе."""
+
+    group = GroupFactory.create(coach__user__email='budget-coach@example.com')
+    user = UserFactory.create(**USER_DATA)
+    applications = []
+
+    def seed(count):
+        # Заявки в одну группу и заявки одного пользователя в разные
+        # группы, чтобы фильтры по группе и пользователю возвращали
+        # все записи
+        applications.extend(
+            GroupApplicationFactory.create_batch(
+                count, group=group, **NESTED_USER_DATA
+            )
+        )
+        GroupApplicationFactory.create_batch(
+            count, user=user, group__coach=group.coach
+        )
+        return applications[0].pk
+
+    params = get_filter_params(
+        GroupApplicationFilter,
+        {
+            'full_name': [LAST_NAME],
+            'user_id': [user.pk],
+            'group_id': [group.pk],
+        },
+    )
+    check_query_budget(
+        authorized_client, settings, 'group-applications', seed, params
+    )
@@ -0,0 +1,113 @@
+import gzip
+
+import pytest
+from common import schema
+from common.schema import schema_cache
+from django.core.management import call_command
+from rest_framework import status
+
+SCHEMA_URL = '/api/schema/'
+
+
+@pytest.fixture(autouse=True)
+def clear_schema_cache():
+    """Очистка кеша схемы между тестами."""
+
+    schema_cache.clear()
+    yield
+    schema_cache.clear()
+
+
+@pytest.mark.django_db
+def test_schema_etag(unauthorized_client):
+    """Тест ответа 304 при совпадении ETag схемы."""
+
+    response = unauthorized_client.get(SCHEMA_URL)
+    assert response.status_code == status.HTTP_200_OK
+    assert b'openapi' in response.content
+    etag = response['ETag']
+
+    response = unauthorized_client.get(SCHEMA_URL, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response['ETag'] == etag
+
+
+@pytest.mark.django_db
+def test_schema_gzip(unauthorized_client):
+    """Тест сжатия схемы, если клиент поддерживает gzip."""
+
+    response = unauthorized_client.get(SCHEMA_URL, data={'format': 'json'})
+    assert response.status_code == status.HTTP_200_OK
+
+    gzip_response = unauthorized_client.get(
+        SCHEMA_URL, data={'format': 'json'}, HTTP_ACCEPT_ENCODING='gzip'
+    )
+    assert gzip_response.status_code == status.HTTP_200_OK
+    assert gzip_response['Content-Encoding'] == 'gzip'
+    assert gzip_response['ETag'] != response['ETag']
+    assert gzip.decompress(gzip_response.content) == response.content
+
+
+@pytest.mark.parametrize(
+    ('accept_encoding', 'expected'),
+    [
+        ('gzip', True),
+        ('br, gzip;q=0.5', True),
+        ('*', True),
+        ('gzip;q=0', False),
+        ('gzip;q=0.0, *', False),
+        ('*;q=0', False),
+        ('identity', False),
+        ('gzipped', False),
+    ],
+)
+@pytest.mark.django_db
+def test_schema_gzip_accept_encoding(
+    unauthorized_client, accept_encoding, expected
+):
+    """Тест учета весов (q) заголовка Accept-Encoding."""
+
+    response = unauthorized_client.get(
+        SCHEMA_URL, HTTP_ACCEPT_ENCODING=accept_encoding
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert (response.get('Content-Encoding') == 'gzip') is expected
+
+
+@pytest.mark.django_db
+def test_build_schema_command(unauthorized_client, settings, tmp_path):
+    """Тест генерации схемы командой и отдачи схемы из файла."""
+
+    settings.SCHEMA_CACHE_DIR = str(tmp_path)
+    call_command('build_schema')
+    schema_cache.clear()
+
+    path = schema_cache.get_path('yaml')
+    assert path.is_file()
+
+    # Схема отдается из файла, а не генерируется заново
+    path.write_bytes(b'openapi: 3.0.3\n')
+    response = unauthorized_client.get(SCHEMA_URL)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.content == b'openapi: 3.0.3\n'
+
+
+@pytest.mark.django_db
+def test_schema_file_of_other_code(
+    unauthorized_client, settings, tmp_path, monkeypatch
+):
+    """
+    Тест, что файл схемы, сохраненный другой версией кода с той же
+    VERSION, не отдается.
+    """
+
+    settings.SCHEMA_CACHE_DIR = str(tmp_path)
+    call_command('build_schema')
+    schema_cache.get_path('yaml').write_bytes(b'openapi: 3.0.3\n')
+    schema_cache.clear()
+
+    monkeypatch.setattr(schema, 'get_source_hash', lambda: 'other')
+    response = unauthorized_client.get(SCHEMA_URL)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.content != b'openapi: 3.0.3\n'
+    assert b'paths' in response.content
@@ -0,0 +1,72 @@
+import pytest
+from apps.user.last_login import last_login_buffer
+from rest_framework import status
+
+from tests.factories import UserFactory
+
+TOKEN_URL = '/api/token/'
+
+
+@pytest.fixture(autouse=True)
+def clear_last_login_buffer():
+    """Очистка буфера дат входа между тестами."""
+
+    last_login_buffer.clear()
+    yield
+    last_login_buffer.clear()
+
+
+def obtain_token(client, user) -> None:
+    """Получение пары токенов пользователем."""
+
+    response = client.post(
+        TOKEN_URL,
+        data={'email': user.email, 'password': 'password'},
+        format='json',
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert {'access', 'refresh'} <= set(response.data)
+
+
+@pytest.mark.django_db
+def test_token_obtain_last_login_batched(
+    unauthorized_client, settings, django_assert_num_queries
+):
+    """Тест пакетного обновления даты последнего входа."""
+
+    settings.LAST_LOGIN_FLUSH_INTERVAL = 3600
+    users = UserFactory.create_batch(3)
+    for user in users:
+        user.set_password('password')
+        user.save()
+        obtain_token(unauthorized_client, user)
+
+    # До записи буфера дата входа не обновляется
+    for user in users:
+        user.refresh_from_db()
+        assert user.last_login is None
+
+    # Все даты входа записываются одним запросом
+    with django_assert_num_queries(1):
+        assert last_login_buffer.flush() == 3
+
+    for user in users:
+        user.refresh_from_db()
+        assert user.last_login is not None
+
+
+@pytest.mark.django_db
+def test_token_obtain_last_login_without_interval(
+    unauthorized_client, settings
+):
+    """Тест записи даты последнего входа сразу, если интервал не задан."""
+
+    settings.LAST_LOGIN_FLUSH_INTERVAL = 0
+    user = UserFactory.create()
+    user.set_password('password')
+    user.save()
+
+    obtain_token(unauthorized_client, user)
+
+    user.refresh_from_db()
+    assert user.last_login is not None
@@ -0,0 +1,86 @@
+import pytest
+from apps.training_process.api.serializers import GroupSerializer
+from apps.training_process.models import Group
+from common.values_serialization import UnsupportedFieldError, ValuesMapper
+from django.test import override_settings
+from rest_framework import status
+
+from tests.factories import AthleteFactory, CoachFactory, UserFactory
+from tests.factories.group import GroupFactory
+from tests.factories.group_application import GroupApplicationFactory
+from tests.utils import get_api_url
+
+
+def get_list_content(client, url: str, params: dict, enabled: bool) -> bytes:
+    """Получение ответа списка с включенным или выключенным .values()."""
+
+    with override_settings(VALUES_LIST_ENABLED=enabled):
+        response = client.get(url, data=params)
+    assert response.status_code == status.HTTP_200_OK
+
+    return response.content
+
+
+@pytest.fixture
+def values_list_data() -> None:
+    """Данные для сравнения ответов, в том числе с пустыми полями."""
+
+    UserFactory.create_batch(2, patronymic=None)
+    coach = CoachFactory.create(judge_category=None, education=None)
+    CoachFactory.create()
+    AthleteFactory.create_batch(3)
+    GroupApplicationFactory.create(group=GroupFactory.create(coach=coach))
+    GroupApplicationFactory.create(comment=None)
+
+
+@pytest.mark.parametrize(
+    'basename',
+    ['users', 'coaches', 'athletes', 'group-applications'],
+)
+@pytest.mark.parametrize(
+    'params',
+    [
+        {},
+        {'ordering': 'full_name'},
+        {'ordering': '-full_name', 'page_size': 1, 'page': 2},
+        {'fields': 'id,user.last_name', 'expand': 'user'},
+        {'expand': 'group'},
+        {'pagination': 'cursor', 'page_size': 2},
+        {'pagination': 'cursor', 'ordering': 'full_name'},
+    ],
+)
+@pytest.mark.django_db
+def test_values_list_content(
+    authorized_client, values_list_data, basename, params
+):
+    """
+    Тест быстрого получения списка через .values(): ответ должен
+    побайтово совпадать с ответом стандартного list().
+    """
+
+    url = get_api_url(basename, 'list')
+
+    assert get_list_content(
+        authorized_client, url, params, enabled=True
+    ) == get_list_content(authorized_client, url, params, enabled=False)
+
+
+@pytest.mark.django_db
+def test_values_mapper_properties():
+    """
+    Тест свойств модели в ValuesMapper: вычисляются только объявленные
+    в values_sources сериализатора, для остальных используется
+    стандартная сериализация.
+    """
+
+    group = GroupFactory.create(max_participants=5, participants_count=2)
+
+    mapper = ValuesMapper(GroupSerializer())
+    row = Group.objects.values(*mapper.lookups).get(pk=group.pk)
+    assert mapper(row)['free_seats'] == 3
+
+    class UndeclaredSerializer(GroupSerializer):
+        values_sources = {}
+
+    with pytest.raises(UnsupportedFieldError):
+        ValuesMapper(UndeclaredSerializer())
@@ -1,6 +1,13 @@
 import pytest
+from apps.training_process.models import Group
+from apps.user.models import Athlete
+from apps.user.services import UserAppointAthleteService
+from django.db import IntegrityError
+from django.utils.timezone import now
+from rest_framework.exceptions import ValidationError
 
-from tests.factories import AthleteFactory
+from tests.factories import AthleteFactory, UserFactory
+from tests.factories.group import GroupFactory
 
 
 @pytest.mark.django_db
@@ -17,3 +24,88 @@ def test_athlete_full_name():
         )
 
         assert athlete.user.full_name == full_name.strip()
+
+
+@pytest.mark.django_db
+def test_athlete_groups_participants_count():
+    """
+    Проверка пересчета количества спортсменов в группах при изменении
+    состава групп через связь, в т.ч. в панели администратора.
+    """
+
+    groups = GroupFactory.create_batch(2)
+    athlete, other_athlete = AthleteFactory.create_batch(2)
+
+    def counts():
+        return [
+            Group.objects.get(pk=group.pk).participants_count
+            for group in groups
+        ]
+
+    athlete.groups.add(*groups)
+    assert counts() == [1, 1]
+
+    groups[0].athletes.add(other_athlete)
+    assert counts() == [2, 1]
+
+    athlete.groups.remove(groups[1])
+    assert counts() == [2, 0]
+
+    athlete.groups.clear()
+    assert counts() == [1, 0]
+
+    groups[0].athletes.clear()
+    assert counts() == [0, 0]
+
+
+@pytest.mark.django_db
+def test_athlete_change_groups_participants_count():
+    """
+    Проверка пересчета количества спортсменов в группах при изменении
+    даты окончания роли и удалении спортсмена, в т.ч. в панели
+    администратора.
+    """
+
+    group = GroupFactory.create()
+    athletes = AthleteFactory.create_batch(3)
+    group.athletes.add(*athletes)
+
+    def count():
+        return Group.objects.get(pk=group.pk).participants_count
+
+    assert count() == 3
+
+    athletes[0].date_to = now().date()
+    athletes[0].save()
+    assert count() == 2
+
+    athletes[0].date_to = None
+    athletes[0].save(update_fields=['date_to'])
+    assert count() == 3
+
+    athletes[1].delete()
+    assert count() == 2
+
+    Athlete.objects.filter(pk=athletes[2].pk).delete()
+    assert count() == 1
+
+
+@pytest.mark.django_db
+def test_appoint_athlete_integrity_errors():
+    """
+    Проверка, что ошибкой о действующей роли считается только нарушение
+    ограничения уникальности действующей роли.
+    """
+
+    athlete = AthleteFactory.create()
+
+    with pytest.raises(ValidationError):
+        UserAppointAthleteService(
+            user=athlete.user, playing_level=athlete.playing_level
+        ).execute()
+
+    # Нарушение NOT NULL не связано с ролью и не скрывается
+    with pytest.raises(IntegrityError):
+        UserAppointAthleteService(
+            user=UserFactory.create(), playing_level=None
+        ).execute()
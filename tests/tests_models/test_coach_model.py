@@ -1,4 +1,7 @@
+from datetime import date
+
 import pytest
+from apps.user.models import Coach
 from dateutil.relativedelta import relativedelta
 from django.utils.timezone import now
 
@@ -34,3 +37,35 @@ def test_current_coach_experience():
             coach.current_coach_experience
             == delta.years + coach.coach_experience
         )
+
+
+@pytest.mark.django_db
+def test_career_start_date():
+    """Проверка хранимой даты начала тренерской карьеры."""
+
+    coach = CoachFactory.create(
+        date_from=date(2020, 3, 15), coach_experience=4
+    )
+    assert coach.career_start_date == date(2016, 3, 15)
+
+    # После изменения стажа дата перечитывается из БД
+    coach.coach_experience = 6
+    coach.save()
+    assert coach.career_start_date == date(2014, 3, 15)
+
+
+@pytest.mark.django_db
+def test_current_coach_experience_annotation():
+    """
+    Проверка, что аннотация с общим тренерским стажем совпадает
+    со значением, вычисленным по дате начала карьеры.
+    """
+
+    coaches = CoachFactory.create_batch(3)
+    annotated = Coach.objects.all().with_current_coach_experience_annotation()
+
+    for coach in coaches:
+        assert (
+            annotated.get(pk=coach.pk).current_coach_experience
+            == coach.current_coach_experience
+        )
@@ -0,0 +1,97 @@
+from io import StringIO
+
+import pytest
+from apps.user.models import Athlete
+from apps.user.services import AthletesWithUsersImportService
+from django.core.management import CommandError, call_command
+
+from tests.factories import UserFactory
+from tests.helpers import create_athlete_request_data, create_users_import_row
+
+
+def write_import_file(path, rows: list[dict]) -> None:
+    lines = [','.join(rows[0])]
+    lines += [','.join(str(value) for value in row.values()) for row in rows]
+    path.write_text('\n'.join(lines), encoding='utf-8')
+
+
+@pytest.mark.django_db
+def test_import_users(tmp_path):
+    """Проверка импорта спортсменов командой."""
+
+    path = tmp_path / 'athletes.csv'
+    rows = [
+        create_users_import_row(create_athlete_request_data())
+        for _ in range(3)
+    ]
+    write_import_file(path, rows)
+
+    stdout = StringIO()
+    call_command('import_users', str(path), role='athlete', stdout=stdout)
+
+    assert 'Создано ролей: 3' in stdout.getvalue()
+    assert Athlete.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test_import_users_errors(tmp_path):
+    """Проверка, что при ошибках в файле команда ничего не создает."""
+
+    path = tmp_path / 'athletes.csv'
+    rows = [
+        create_users_import_row(create_athlete_request_data())
+        for _ in range(2)
+    ]
+    rows[1]['email'] = UserFactory.create().email
+    write_import_file(path, rows)
+
+    stderr = StringIO()
+    with pytest.raises(CommandError, match='Ошибок в строках: 1'):
+        call_command('import_users', str(path), role='athlete', stderr=stderr)
+
+    assert 'Строка 3, email' in stderr.getvalue()
+    assert not Athlete.objects.exists()
+
+
+@pytest.mark.django_db
+def test_import_users_email_taken_before_insert(tmp_path, monkeypatch):
+    """
+    Проверка, что адрес, занятый другим пользователем после проверки
+    адресов, возвращается ошибкой строки, и ничего не создается.
+    """
+
+    path = tmp_path / 'athletes.csv'
+    rows = [
+        create_users_import_row(create_athlete_request_data())
+        for _ in range(2)
+    ]
+    write_import_file(path, rows)
+
+    create = AthletesWithUsersImportService._create
+
+    def create_after_concurrent_user(self, import_rows):
+        UserFactory.create(email=rows[1]['email'])
+        return create(self, import_rows)
+
+    monkeypatch.setattr(
+        AthletesWithUsersImportService, '_create', create_after_concurrent_user
+    )
+
+    with path.open(encoding='utf-8') as csv_file:
+        report = AthletesWithUsersImportService(csv_file).execute()
+
+    assert report == {
+        'created': 0,
+        'errors': [
+            {
+                'line': 3,
+                'errors': {
+                    'email': [
+                        'Пользователь с таким адресом электронной почты '
+                        'уже существует'
+                    ]
+                },
+            }
+        ],
+    }
+    assert not Athlete.objects.exists()
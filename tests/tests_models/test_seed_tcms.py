@@ -0,0 +1,80 @@
+from io import StringIO
+
+import pytest
+from apps.training_process.models import Group, GroupApplication
+from apps.user.models import Administrator, Athlete, Coach, User
+from django.core.management import call_command
+from django.db import transaction
+from django.db.models import F
+
+from tests.factories import AthleteFactory
+
+SEED_OPTIONS = {
+    'users': 500,
+    'coaches': 0.1,
+    'athletes': 0.5,
+    'administrators': 0.05,
+    'seed': 1,
+}
+
+
+def seed() -> None:
+    call_command('seed_tcms', **SEED_OPTIONS, stdout=StringIO())
+
+
+@pytest.mark.django_db
+def test_seed_tcms():
+    """Проверка генерации тестовых данных."""
+
+    existing = AthleteFactory.create()
+
+    seed()
+
+    assert User.objects.count() == SEED_OPTIONS['users'] + 1
+    assert Coach.objects.filter(date_to__isnull=True).exists()
+    assert Coach.objects.filter(date_to__isnull=False).exists()
+    assert Athlete.objects.filter(groups__isnull=False).exists()
+    assert Administrator.objects.exists()
+    assert GroupApplication.objects.exists()
+
+    # Количество спортсменов групп согласовано со связями и не больше
+    # максимального
+    counts = dict(Group.objects.values_list('pk', 'participants_count'))
+    Group.objects.all().update_participants_count()
+    assert counts == dict(
+        Group.objects.values_list('pk', 'participants_count')
+    )
+    assert not Group.objects.filter(
+        participants_count__gt=F('max_participants')
+    ).exists()
+
+    # Последовательности id сдвинуты за загруженные записи
+    athlete = AthleteFactory.create()
+    assert athlete.pk > existing.pk
+    assert athlete.user_id == User.objects.latest('pk').pk
+
+
+@pytest.mark.django_db
+def test_seed_tcms_reproducible():
+    """Проверка, что при одинаковом зерне данные совпадают."""
+
+    def snapshot():
+        with transaction.atomic():
+            seed()
+            result = {
+                model: list(
+                    model.objects.order_by('pk').values_list('pk', *fields)
+                )
+                for model, fields in (
+                    (User, ('full_name', 'email', 'phone', 'date_of_birth')),
+                    (Coach, ('user_id', 'date_from', 'date_to')),
+                    (Athlete, ('user_id', 'date_from', 'date_to')),
+                    (Group, ('coach_id', 'participants_count')),
+                    (GroupApplication, ('user_id', 'group_id', 'status')),
+                )
+            }
+            transaction.set_rollback(True)
+
+        return result
+
+    assert snapshot() == snapshot()
@@ -1,4 +1,5 @@
 import pytest
+from apps.user.models import User
 
 from tests.factories import UserFactory
 
@@ -18,3 +19,37 @@ def test_user_full_name():
         )
 
         assert user.full_name == full_name.strip()
+
+
+@pytest.mark.django_db
+def test_user_full_name_after_update():
+    """Проверка пересчета поля с ФИО пользователя после обновления."""
+
+    user = UserFactory.create(patronymic=None)
+    assert user.full_name == f'{user.last_name} {user.first_name}'
+
+    user.patronymic = 'Петровна'
+    user.save()
+
+    assert user.full_name == (f'{user.last_name} {user.first_name} Петровна')
+
+
+@pytest.mark.django_db
+def test_user_updated_at():
+    """
+    Проверка обновления даты изменения при частичном сохранении
+    и при массовом редактировании.
+    """
+
+    user = UserFactory.create()
+    updated_at = user.updated_at
+
+    user.first_name = 'Анна'
+    user.save(update_fields=['first_name'])
+    user.refresh_from_db()
+    assert user.updated_at > updated_at
+
+    updated_at = user.updated_at
+    User.objects.filter(pk=user.pk).update(last_name='Иванова')
+    user.refresh_from_db()
+    assert user.updated_at > updated_at